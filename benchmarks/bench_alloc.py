@@ -0,0 +1,124 @@
+# benchmarks/bench_alloc.py
+# Checks with tracemalloc that steady-state gameplay ticks allocate nothing
+# that outlives them, and reports the transient allocations per tick. The
+# frog keeps hopping up through the road and river rows and back, so ticks
+# run car collisions, log riding and deaths.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_alloc
+#   python -m benchmarks.bench_alloc --backend numpy --ticks 20000
+#
+# Exits with status 1 if the ticks left a single block behind. Positions and
+# counters are Python ints, replaced by new objects as their values change,
+# so both traces are taken after restoring the same game snapshot and
+# replaying the same SETTLE ticks from it: with every value and cache equal,
+# any extra block is a leak. The measured ticks are replayed once before
+# they are traced, so one-time caches are filled on every path they take.
+import argparse
+import gc
+import sys
+import tracemalloc
+from game.config import GameConfig
+from game.game import Game
+from game.snapshot import restore, snapshot
+
+# Ticks replayed from the snapshot before each trace, refreshing lazily
+# updated caches such as the lane buckets and the HUD state
+SETTLE = 100
+
+
+def build_game(backend, level):
+    config = GameConfig()
+    config.OBSTACLE_BACKEND = backend
+    # No background level generation allocating while we measure
+    config.ENDLESS_LEVELS = False
+    game = Game(config)
+    game.reset(level)
+    # Plenty of lives, so the frog can keep dying without ending the game
+    game.state["lives"] = 10 ** 4
+    return game
+
+
+def tick(game, step):
+    """One steady-state tick: every other tick a hop, 8 up from the start row
+    (never reaching the goal row) then 8 down, the tick and the HUD state"""
+    if step % 2 == 0:
+        game.move_player("up" if step // 2 % 16 < 8 else "down")
+    game.step()
+    game.get_game_state()
+
+
+def traced_memory(trace):
+    """Bytes and blocks allocated, not counting tracemalloc's or this script's own"""
+    stats = trace.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__)]).statistics("filename")
+    return sum(stat.size for stat in stats), sum(stat.count for stat in stats)
+
+
+def measure(game, ticks, warmup):
+    """Net bytes and blocks left behind by ticks, the peak transient bytes
+    and the lives lost"""
+    # Traced from the start, so caches hold traced objects in both traces
+    tracemalloc.start()
+    for step in range(warmup):
+        tick(game, step)
+    state = snapshot(game)
+    lives = game.state["lives"]
+
+    def replay(count):
+        """Restore the snapshot and replay the first count ticks from it"""
+        restore(game, state)
+        for step in range(warmup, warmup + count):
+            tick(game, step)
+
+    def settle():
+        """Replay SETTLE ticks from the same interpreter state each time"""
+        # A full collection also empties the free lists, which decide
+        # whether a new float or tuple is a traced allocation
+        gc.collect()
+        replay(SETTLE)
+        # Objects left to the cycle collector are not what a tick keeps
+        gc.collect()
+
+    # Replays are deterministic: a first pass over the measured ticks fills
+    # every one-time cache on the paths they take
+    replay(SETTLE + ticks)
+    settle()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for step in range(warmup + SETTLE, warmup + SETTLE + ticks):
+        tick(game, step)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    lost = lives - game.state["lives"]
+    settle()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    # Filtered only now, compiling the filter allocates
+    before = traced_memory(before)
+    after = traced_memory(after)
+    return after[0] - before[0], after[1] - before[1], peak, lost
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Allocation check of the gameplay tick")
+    parser.add_argument("--backend", default="objects", choices=["objects", "numpy"])
+    parser.add_argument("--level", type=int, default=2)
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--warmup", type=int, default=500,
+                        help="ticks run before measuring, to fill caches")
+    args = parser.parse_args()
+
+    game = build_game(args.backend, args.level)
+    net_bytes, net_blocks, peak, lost = measure(game, args.ticks, args.warmup)
+    print(f"{args.ticks} ticks on level {args.level} ({args.backend}), {lost} lives lost: "
+          f"net {net_bytes} bytes in {net_blocks} blocks, peak transient {peak} bytes")
+    if net_blocks > 0:
+        print(f"steady-state ticks leave {net_blocks} blocks behind")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
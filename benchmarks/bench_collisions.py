@@ -0,0 +1,56 @@
+# benchmarks/bench_collisions.py
+# Run from the repository root: python -m benchmarks.bench_collisions
+import argparse
+import time
+from game.config import GameConfig
+from game.game import Game
+
+
+def build_game(backend, lanes, per_lane):
+    """Game whose obstacle manager holds lanes x per_lane obstacles"""
+    config = GameConfig()
+    config.OBSTACLE_BACKEND = backend
+    game = Game(config)
+    game.reset()
+    manager = game.obstacle_manager
+    manager.clear()
+    for lane in range(lanes):
+        for i in range(per_lane):
+            if lane % 2:
+                manager.create_car(lane, True, is_right=bool(i % 2))
+            else:
+                manager.create_log(lane, True, is_right=bool(i % 2))
+    # Spread the obstacles along their lanes
+    for _ in range(50):
+        manager.update()
+    return game
+
+
+def time_check_collisions(game, queries):
+    """Average cost of Game.check_collisions with the frog parked on the road"""
+    player = game.player
+    start = time.perf_counter()
+    for _ in range(queries):
+        player.position["x"] = 4
+        player.position["y"] = 5
+        game.state["lives"] = 1000
+        game.check_collisions()
+    return (time.perf_counter() - start) / queries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Game.check_collisions scaling")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--backend", default="objects", choices=["objects", "numpy"])
+    args = parser.parse_args()
+
+    print(f"{'lanes':>6} {'per lane':>9} {'obstacles':>10} {'us/check':>9}")
+    for lanes in (10, 100, 1000):
+        for per_lane in (1, 10, 50):
+            game = build_game(args.backend, lanes, per_lane)
+            cost = time_check_collisions(game, args.queries) * 1e6
+            print(f"{lanes:>6} {per_lane:>9} {lanes * per_lane:>10} {cost:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
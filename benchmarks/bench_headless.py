@@ -0,0 +1,32 @@
+# benchmarks/bench_headless.py
+# Run from the repository root: python -m benchmarks.bench_headless
+import argparse
+import time
+from game.headless import HeadlessRunner, random_policy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless simulation throughput")
+    parser.add_argument("--games", type=int, default=2000)
+    parser.add_argument("--max-ticks", type=int, default=2000)
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    runner = HeadlessRunner(policy=random_policy(args.seed))
+
+    total_ticks = 0
+    start = time.perf_counter()
+    for _ in range(args.games):
+        total_ticks += runner.run_episode(args.level, args.max_ticks)["ticks"]
+    elapsed = time.perf_counter() - start
+
+    print(f"games:           {args.games}")
+    print(f"simulated ticks: {total_ticks}")
+    print(f"elapsed:         {elapsed:.3f} s")
+    print(f"games/s:         {args.games / elapsed:.0f}")
+    print(f"ticks/s:         {total_ticks / elapsed:.0f}")
+
+
+if __name__ == "__main__":
+    main()
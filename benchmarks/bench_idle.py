@@ -0,0 +1,99 @@
+# benchmarks/bench_idle.py
+# CPU use of the main loop on screens where nothing moves: runs main.py's
+# frame loop on the start screen (with the name input cursor blinking) and
+# on the pause screen, once drawing every frame at config.FPS and once with
+# a FrameScheduler (config.IDLE_FRAME_PACING).
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_idle
+#   python -m benchmarks.bench_idle --seconds 10 --render full
+#
+# Exits with status 1 if the paced loop uses more than --target percent of
+# a CPU on any screen.
+import argparse
+import os
+import sys
+import time
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from game.config import GameConfig
+from game.game import Game
+from game.ui import UI
+from game.renderer import create_renderer
+from game.pacing import FrameScheduler
+
+
+def build_screen(name, config, screen):
+    """Game and UI showing the named idle screen"""
+    game = Game(config)
+    ui = UI(game)
+    ui.initialize(screen, pygame.time.Clock())
+    if name == "start":
+        ui.active_input = True
+        ui.text_input = "bench"
+    else:
+        game.start_game("bench")
+        game.state["is_paused"] = True
+    return game, ui
+
+
+def run(name, paced, args, screen):
+    """Return (CPU percent, frames drawn per second) of the loop on one screen"""
+    config = GameConfig()
+    config.IDLE_FRAME_PACING = paced
+    config.RENDER_MODE = args.render
+    config.ENDLESS_LEVELS = False
+    game, ui = build_screen(name, config, screen)
+    renderer = create_renderer(game, ui, screen)
+    scheduler = FrameScheduler(config)
+    clock = pygame.time.Clock()
+    # The pause screen never wakes the loop by itself, end the run with an event
+    stop = pygame.event.custom_type()
+    pygame.time.set_timer(stop, int(args.seconds * 1000), 1)
+    drawn = 0
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    running = True
+    while running:
+        events = scheduler.wait(ui) if scheduler.is_idle(game) else []
+        for event in events + pygame.event.get():
+            if event.type == stop:
+                running = False
+            ui.handle_events(event)
+        game.update(pygame.time.get_ticks())
+        if scheduler.should_draw(game, ui, pygame.time.get_ticks()):
+            renderer.render()
+            drawn += 1
+        clock.tick(config.FPS)
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    return cpu / wall * 100, drawn / wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU use of the main loop on idle screens")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--render", choices=("dirty", "full"), default="dirty")
+    parser.add_argument("--target", type=float, default=2.0,
+                        help="maximum CPU percent of the paced loop")
+    args = parser.parse_args()
+
+    pygame.init()
+    config = GameConfig()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT + 50))
+    failed = False
+    for name in ("start", "paused"):
+        for paced in (False, True):
+            usage, fps = run(name, paced, args, screen)
+            print(f"{name:7s} {'paced' if paced else 'every frame':12s} "
+                  f"CPU {usage:5.1f} %  {fps:5.1f} frames drawn/s")
+            failed = failed or paced and usage > args.target
+    pygame.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
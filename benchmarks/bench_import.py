@@ -0,0 +1,69 @@
+# benchmarks/bench_import.py
+# Cold-start time of the simulation core: each run imports a module in a
+# fresh interpreter and reports how long the import took, and whether it
+# pulled in pygame.
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_import
+#   python -m benchmarks.bench_import --module game.game --runs 20
+#
+# Bytecode is compiled first, as an installed package would have it, so the
+# runs measure imports and not compilation. Exits with status 1 if the median
+# is over --target milliseconds or the core imported pygame.
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Prints the import time in ms and whether pygame got imported
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps([elapsed, "pygame" in sys.modules]))
+"""
+
+
+def time_import(module):
+    """Milliseconds to import module in a new interpreter, and whether pygame was loaded"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.run([sys.executable, "-c", PROBE.format(module=module)],
+                            cwd=ROOT, env=env, capture_output=True, text=True,
+                            check=True).stdout
+    elapsed, pygame_loaded = json.loads(output.splitlines()[-1])
+    return elapsed, pygame_loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import time of the simulation core")
+    parser.add_argument("--module", default="game.headless")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--target", type=float, default=20.0,
+                        help="maximum median import time in milliseconds")
+    args = parser.parse_args()
+
+    compileall.compile_dir(os.path.join(ROOT, "game"), quiet=1)
+    times = []
+    pygame_loaded = False
+    for _ in range(args.runs):
+        elapsed, loaded = time_import(args.module)
+        times.append(elapsed)
+        pygame_loaded = pygame_loaded or loaded
+
+    median = statistics.median(times)
+    print(f"import {args.module}: min {min(times):.2f} ms, median {median:.2f} ms, "
+          f"max {max(times):.2f} ms over {args.runs} runs (target {args.target:.0f} ms)")
+    print(f"pygame imported: {'yes' if pygame_loaded else 'no'}")
+    if pygame_loaded or median > args.target:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
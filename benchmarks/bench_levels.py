@@ -0,0 +1,55 @@
+# benchmarks/bench_levels.py
+# Run from the repository root: python -m benchmarks.bench_levels
+import argparse
+import json
+import os
+import tempfile
+import time
+from game.level_loader import LevelCatalog
+
+
+def write_levels(level_dir, count):
+    """Write count level files with a few hundred obstacles each"""
+    os.makedirs(level_dir)
+    for i in range(count):
+        lanes = [{"lane": lane, "type": "log" if lane < 4 else "car",
+                  "direction": "right" if (lane + i) % 2 else "left",
+                  "count": 40, "offset": i % 50, "spacing": 150}
+                 for lane in range(1, 8)]
+        with open(os.path.join(level_dir, f"level_{i:04d}.json"), "w") as f:
+            json.dump({"tick_ms": 300 - i % 100, "lanes": lanes}, f)
+
+
+def time_load_all(level_dir, cache_dir):
+    """Time listing a catalog and loading every level in it"""
+    start = time.perf_counter()
+    catalog = LevelCatalog(level_dir, cache_dir)
+    for level in range(1, len(catalog) + 1):
+        catalog.get(level)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Level file loading with the compiled cache")
+    parser.add_argument("--levels", type=int, default=300)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        level_dir = os.path.join(root, "levels")
+        cache_dir = os.path.join(level_dir, ".cache")
+        write_levels(level_dir, args.levels)
+
+        cold = time_load_all(level_dir, cache_dir)
+        warm = time_load_all(level_dir, cache_dir)
+        start = time.perf_counter()
+        LevelCatalog(level_dir, cache_dir).get(1)
+        first = time.perf_counter() - start
+
+    print(f"levels:               {args.levels}")
+    print(f"cold (compile):       {cold * 1000:.1f} ms")
+    print(f"warm (mmap cache):    {warm * 1000:.1f} ms")
+    print(f"startup (one level):  {first * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
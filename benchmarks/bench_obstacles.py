@@ -0,0 +1,66 @@
+# benchmarks/bench_obstacles.py
+# Run from the repository root: python -m benchmarks.bench_obstacles
+import argparse
+import time
+from game.config import GameConfig
+from game.obstacles import create_obstacle_manager
+from game.rect import Rect
+
+
+def build_manager(backend, count):
+    """Fill a manager with count obstacles spread over the road and river lanes"""
+    config = GameConfig()
+    config.OBSTACLE_BACKEND = backend
+    manager = create_obstacle_manager(config)
+    for i in range(count):
+        if i % 2:
+            manager.create_car(4 + i % 4, True, is_right=bool(i % 3))
+        else:
+            manager.create_log(1 + i % 3, True, is_right=bool(i % 3))
+    return manager
+
+
+def time_ticks(manager, ticks):
+    """Time ticks x (update + car test + log test)"""
+    player_rect = Rect(310, 130, 40, 40)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        manager.update()
+        manager.is_hit_by_car(player_rect)
+        manager.is_on_log(player_rect.copy())
+    return time.perf_counter() - start
+
+
+def time_seek(manager, tick, repeat=20):
+    """Time jumping to tick in closed form (average of repeat seeks)"""
+    start = time.perf_counter()
+    for i in range(repeat):
+        manager.seek(tick + i)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Obstacle backend throughput")
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--seek-tick", type=int, default=1000000)
+    args = parser.parse_args()
+
+    print(f"{'obstacles':>10} {'objects us/tick':>16} {'numpy us/tick':>14}")
+    for count in args.counts:
+        results = []
+        for backend in ("objects", "numpy"):
+            manager = build_manager(backend, count)
+            results.append(time_ticks(manager, args.ticks) / args.ticks * 1e6)
+        print(f"{count:>10} {results[0]:>16.1f} {results[1]:>14.1f}")
+
+    print(f"\nseek to tick {args.seek_tick}")
+    print(f"{'obstacles':>10} {'objects us':>16} {'numpy us':>14}")
+    for count in args.counts:
+        results = [time_seek(build_manager(backend, count), args.seek_tick) * 1e6
+                   for backend in ("objects", "numpy")]
+        print(f"{count:>10} {results[0]:>16.1f} {results[1]:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# benchmarks/bench_threaded.py
+# Stress test of the threaded simulation: renders frames that are slowed
+# down on purpose and measures the time between simulation ticks, once with
+# Game.update() called from the render loop as main.py does by default and
+# once with a SimulationThread (config.THREADED_SIMULATION).
+#
+# Run from the repository root:
+#   python -m benchmarks.bench_threaded
+#   python -m benchmarks.bench_threaded --render-ms 70 --tick-ms 50 --seconds 10
+#
+# The slowdown busy-waits by default, holding the GIL like slow Python
+# drawing code would; --sleep waits without it instead. Exits with status 1
+# if the threaded ticks' p1 or p99 interval is off the tick length by more
+# than --tolerance milliseconds.
+import argparse
+import os
+import statistics
+import sys
+import time
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from game.config import GameConfig
+from game.game import Game
+from game.ui import UI
+from game.renderer import create_renderer
+from game.sim_thread import SimulationThread
+from game.snapshot_view import SnapshotView
+
+
+def build_game(tick_ms, level):
+    config = GameConfig()
+    config.SIM_TICK_MS = tick_ms
+    # No background level generation competing for the CPU
+    config.ENDLESS_LEVELS = False
+    game = Game(config)
+    game.reset(level)
+    # The frog stays on the start row, but never run out of lives
+    game.state["lives"] = 10 ** 6
+    return game
+
+
+def slow_down(ms, sleep):
+    """Stand-in for an expensive frame"""
+    if sleep:
+        time.sleep(ms / 1000)
+        return
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+def run_inline(args, screen):
+    """Ticks from Game.update() in the render loop, return (tick intervals, frames)"""
+    game = build_game(args.tick_ms, args.level)
+    ui = UI(game)
+    ui.initialize(screen, pygame.time.Clock())
+    renderer = create_renderer(game, ui, screen)
+    tick_times = []
+    frames = 0
+    game.last_update = time.perf_counter() * 1000
+    end = time.perf_counter() + args.seconds
+    while time.perf_counter() < end:
+        pygame.event.pump()
+        now = time.perf_counter()
+        tick = game.tick
+        game.update(now * 1000)
+        # Ticks caught up on in one update all happen now
+        tick_times.extend([now] * (game.tick - tick))
+        renderer.render()
+        slow_down(args.render_ms, args.sleep)
+        frames += 1
+    return [(b - a) * 1000 for a, b in zip(tick_times, tick_times[1:])], frames
+
+
+def run_threaded(args, screen):
+    """Ticks from a SimulationThread, drawn from its snapshots"""
+    game = build_game(args.tick_ms, args.level)
+    simulation = SimulationThread(game)
+    view = SnapshotView(game, simulation)
+    ui = UI(view)
+    ui.initialize(screen, pygame.time.Clock())
+    renderer = create_renderer(view, ui, screen)
+    frames = 0
+    simulation.start()
+    end = time.perf_counter() + args.seconds
+    try:
+        while time.perf_counter() < end:
+            pygame.event.pump()
+            view.load()
+            renderer.render()
+            slow_down(args.render_ms, args.sleep)
+            frames += 1
+    finally:
+        simulation.stop()
+    return simulation.tick_intervals(), frames
+
+
+def report(name, intervals, frames, seconds):
+    """Print tick interval statistics, return the p1 and p99 intervals"""
+    intervals = sorted(intervals)
+    if not intervals:
+        print(f"{name:9s} no ticks")
+        return None
+    p1 = intervals[int(len(intervals) * 0.01)]
+    p99 = intervals[min(len(intervals) - 1, int(len(intervals) * 0.99))]
+    print(f"{name:9s} {frames / seconds:5.1f} fps {len(intervals) + 1:5d} ticks, interval ms: "
+          f"min {intervals[0]:5.1f}  p1 {p1:5.1f}  p50 {statistics.median(intervals):5.1f}  "
+          f"p99 {p99:5.1f}  max {intervals[-1]:5.1f}  stdev {statistics.pstdev(intervals):4.1f}")
+    return p1, p99
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulation tick timing under slow rendering")
+    parser.add_argument("--tick-ms", type=int, default=50)
+    parser.add_argument("--render-ms", type=float, default=70,
+                        help="extra time spent on every rendered frame")
+    parser.add_argument("--sleep", action="store_true",
+                        help="slow frames down with sleep() instead of busy-waiting")
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--level", type=int, default=2)
+    parser.add_argument("--tolerance", type=float, default=10,
+                        help="allowed p99 deviation of threaded tick intervals, in ms")
+    args = parser.parse_args()
+
+    pygame.init()
+    config = GameConfig()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT + 50))
+    print(f"tick {args.tick_ms} ms, frames slowed by {args.render_ms} ms "
+          f"({'sleep' if args.sleep else 'busy-wait'})")
+    report("inline", *run_inline(args, screen), args.seconds)
+    percentiles = report("threaded", *run_threaded(args, screen), args.seconds)
+    pygame.quit()
+    if percentiles is None or any(abs(p - args.tick_ms) > args.tolerance for p in percentiles):
+        print("threaded ticks are not steady")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
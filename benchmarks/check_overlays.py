@@ -0,0 +1,106 @@
+# benchmarks/check_overlays.py
+# Checks that the pause, game over and level complete screens compose their
+# overlay once: draws each of them repeatedly with both renderers and counts
+# UI.overlay_builds and every pygame.Surface created after the first frame.
+#
+# Run from the repository root:
+#   python -m benchmarks.check_overlays
+#   python -m benchmarks.check_overlays --frames 600
+#
+# Surfaces are counted by swapping pygame.Surface and pygame.font.Font for
+# subclasses that count construction, convert(), convert_alpha() and text
+# rendering, which is how the game creates every surface it draws. Exits
+# with status 1 if a screen built an overlay or a surface after its first
+# frame.
+import argparse
+import os
+import sys
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from game.config import GameConfig
+from game.game import Game
+from game.ui import UI
+from game.renderer import create_renderer
+
+# Surfaces created since the start, see CountingSurface and CountingFont
+created = [0]
+
+
+class CountingSurface(pygame.Surface):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        created[0] += 1
+
+    def convert(self, *args):
+        created[0] += 1
+        return super().convert(*args)
+
+    def convert_alpha(self, *args):
+        created[0] += 1
+        return super().convert_alpha(*args)
+
+
+class CountingFont(pygame.font.Font):
+    def render(self, *args, **kwargs):
+        created[0] += 1
+        return super().render(*args, **kwargs)
+
+
+def show(game, screen_name):
+    """Put a started game on the named overlay screen"""
+    config = game.config
+    game.start_game("check")
+    if screen_name == "paused":
+        game.state["is_paused"] = True
+    elif screen_name == "game over":
+        game.state["current"] = config.STATE_GAME_OVER
+    else:
+        game.state["current"] = config.STATE_LEVEL_COMPLETE
+
+
+def check(screen_name, render_mode, frames, screen):
+    """Return (overlay builds, surfaces created) after the first frame"""
+    config = GameConfig()
+    config.RENDER_MODE = render_mode
+    config.ENDLESS_LEVELS = False
+    game = Game(config)
+    ui = UI(game)
+    ui.initialize(screen, pygame.time.Clock())
+    renderer = create_renderer(game, ui, screen)
+    show(game, screen_name)
+
+    renderer.render()
+    builds = ui.overlay_builds
+    surfaces = created[0]
+    for frame in range(1, frames):
+        game.update(frame * 16)
+        renderer.render()
+    return ui.overlay_builds - builds, created[0] - surfaces
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Overlay surface reuse check")
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    pygame.Surface = CountingSurface
+    pygame.font.Font = CountingFont
+    pygame.init()
+    config = GameConfig()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT + 50))
+    failed = False
+    for render_mode in ("dirty", "full"):
+        for screen_name in ("paused", "game over", "level complete"):
+            builds, surfaces = check(screen_name, render_mode, args.frames, screen)
+            print(f"{render_mode:5s} {screen_name:14s} after the first of {args.frames} frames: "
+                  f"{builds} overlay builds, {surfaces} surfaces created")
+            failed = failed or builds or surfaces
+    pygame.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+# benchmarks/check_positions.py
+# Checks the closed-form obstacle motion against tick-by-tick play: fills
+# managers of both backends with random layouts (any speed from 0, offsets
+# on and off the screen, obstacles added mid-game), then compares
+# positions_at(tick) and seek(tick) with the positions update() reaches.
+#
+# Run from the repository root:
+#   python -m benchmarks.check_positions
+#   python -m benchmarks.check_positions --layouts 1000 --ticks 500 --seed 7
+#
+# Exits with status 1 on the first mismatch, printing the layout.
+import argparse
+import random
+import sys
+from game.config import GameConfig
+from game.obstacles import create_obstacle_manager
+
+
+def random_layout(rng, config, count):
+    """[(created at tick, is_log, lane, is_right, offset, speed)]"""
+    width = config.SCREEN_WIDTH
+    return [(rng.choice((0, 0, rng.randrange(50))), rng.random() < 0.5, rng.randrange(1, 8),
+             rng.random() < 0.5, rng.randrange(-2 * width, 2 * width), rng.randrange(13))
+            for _ in range(count)]
+
+
+def check_layout(backend, layout, ticks):
+    """First (tick, expected, got) where closed form and update() disagree, or None"""
+    config = GameConfig()
+    config.OBSTACLE_BACKEND = backend
+    played = create_obstacle_manager(config)
+    closed = create_obstacle_manager(config)
+    pending = sorted(layout, key=lambda entry: entry[0])
+    for tick in range(ticks + 1):
+        # Obstacles created now count their motion from this tick
+        closed.seek(tick)
+        while pending and pending[0][0] == tick:
+            _, is_log, lane, is_right, offset, speed = pending.pop(0)
+            create = "create_log" if is_log else "create_car"
+            for manager in (played, closed):
+                getattr(manager, create)(lane, True, is_right, offset, speed)
+        expected = list(played.get_positions())
+        for got in (list(played.positions_at(tick)), list(closed.get_positions())):
+            if got != expected:
+                return tick, expected, got
+        played.update()
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Closed-form obstacle positions against update()")
+    parser.add_argument("--layouts", type=int, default=400)
+    parser.add_argument("--obstacles", type=int, default=6)
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    config = GameConfig()
+    for backend in ("objects", "numpy"):
+        for i in range(args.layouts):
+            layout = random_layout(rng, config, args.obstacles)
+            mismatch = check_layout(backend, layout, args.ticks)
+            if mismatch is not None:
+                tick, expected, got = mismatch
+                print(f"{backend}: layout {i} differs at tick {tick}\n  layout {layout}\n"
+                      f"  update() {expected}\n  closed form {got}")
+                return 1
+        print(f"{backend}: {args.layouts} layouts match over {args.ticks} ticks")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
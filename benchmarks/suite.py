@@ -0,0 +1,292 @@
+# benchmarks/suite.py
+# Reproducible benchmark suite for the simulation, collision and rendering hot
+# paths, run headless under the SDL dummy video driver.
+#
+# Run from the repository root:
+#   python -m benchmarks.suite --out bench.json
+#   python -m benchmarks.suite --baseline bench.json --out new.json
+#
+# With --baseline the run exits with status 1 if any case got slower than
+# the baseline by more than --tolerance (default 25%).
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+from game.config import GameConfig
+from game.game import Game
+from game.rect import Rect
+from game.ui import UI
+from game.renderer import FullRenderer, DirtyRectRenderer
+
+OBSTACLE_COUNTS = (10, 100, 1000)
+LANE_COUNTS = (4, 8)
+
+
+def build_game(obstacles, lanes, backend):
+    """A playing Game with obstacles spread round-robin over lanes 1..lanes"""
+    config = GameConfig()
+    config.OBSTACLE_BACKEND = backend
+    if lanes > config.LANES - 2:
+        # A taller board, roads on the car lanes and river on the log lanes
+        config.LANE_KINDS = (("goal",) +
+                             tuple("road" if lane % 2 else "river" for lane in range(1, lanes + 1)) +
+                             ("safe", "start"))
+        config.FROG_START = {"x": 5, "y": config.LANES - 1}
+    game = Game(config)
+    game.reset()
+    manager = game.obstacle_manager
+    manager.clear()
+    for i in range(obstacles):
+        lane = 1 + i % lanes
+        if lane % 2:
+            manager.create_car(lane, True, is_right=bool(i // lanes % 2), offset=i * 37 % 500)
+        else:
+            manager.create_log(lane, True, is_right=bool(i // lanes % 2), offset=i * 37 % 500)
+    for _ in range(10):
+        manager.update()
+    return game
+
+
+def query_rects(game, lanes):
+    """One frog-sized rect per lane and column, the shapes collision tests see"""
+    config = game.config
+    size = config.FROG_SIZE
+    offset = (config.CELL_SIZE - size) // 2
+    return [Rect(x * config.CELL_SIZE + offset, lane * config.CELL_SIZE + offset,
+                 size, size)
+            for lane in range(1, lanes + 1) for x in range(0, 9, 2)]
+
+
+def bench_obstacle_update(game, ui, lanes):
+    return game.obstacle_manager.update
+
+
+def bench_is_hit_by_car(game, ui, lanes):
+    manager = game.obstacle_manager
+    rects = query_rects(game, lanes)
+
+    def run():
+        for rect in rects:
+            manager.is_hit_by_car(rect)
+    return run, len(rects)
+
+
+def bench_is_on_log(game, ui, lanes):
+    manager = game.obstacle_manager
+    rects = query_rects(game, lanes)
+
+    def run():
+        for rect in rects:
+            manager.is_on_log(rect.copy())
+    return run, len(rects)
+
+
+def bench_check_collisions(game, ui, lanes):
+    player = game.player
+    state = game.state
+    cells = [(x, lane) for lane in range(1, lanes + 1) for x in range(0, 9, 2)]
+
+    def run():
+        for x, y in cells:
+            player.position["x"] = x
+            player.position["y"] = y
+            state["lives"] = 1000
+            game.check_collisions()
+    return run, len(cells)
+
+
+def bench_home_draw(game, ui, lanes):
+    home = game.level_manager.homes[0]
+    screen = pygame.display.get_surface()
+
+    def run():
+        home.filled = not home.filled
+        home.draw(screen)
+    return run
+
+
+def bench_obstacle_draw(game, ui, lanes):
+    manager = game.obstacle_manager
+    screen = pygame.display.get_surface()
+    # Mid-tick, so the interpolated positions are drawn
+    return lambda: manager.draw(screen, 0.5)
+
+
+def bench_player_draw(game, ui, lanes):
+    player = game.player
+    screen = pygame.display.get_surface()
+    return lambda: player.draw(screen)
+
+
+def bench_draw_background(game, ui, lanes):
+    return ui.draw_background
+
+
+def bench_draw_game_info(game, ui, lanes):
+    def run():
+        # A new score every call, like a frame after scoring
+        game.state["score"] += 10
+        ui.draw_game_info(game.get_game_state())
+    return run
+
+
+def bench_frame_full(game, ui, lanes):
+    renderer = FullRenderer(game, ui, pygame.display.get_surface())
+
+    def run():
+        game.obstacle_manager.update()
+        renderer.render()
+    return run
+
+
+def bench_frame_dirty(game, ui, lanes):
+    renderer = DirtyRectRenderer(game, ui, pygame.display.get_surface())
+
+    def run():
+        game.obstacle_manager.update()
+        renderer.render()
+    return run
+
+
+# name: factory(game, ui, lanes) -> callable or (callable, operations per call)
+BENCHMARKS = {
+    "obstacle_update": bench_obstacle_update,
+    "is_hit_by_car": bench_is_hit_by_car,
+    "is_on_log": bench_is_on_log,
+    "check_collisions": bench_check_collisions,
+    "home_draw": bench_home_draw,
+    "obstacle_draw": bench_obstacle_draw,
+    "player_draw": bench_player_draw,
+    "draw_background": bench_draw_background,
+    "draw_game_info": bench_draw_game_info,
+    "frame_full": bench_frame_full,
+    "frame_dirty": bench_frame_dirty,
+}
+
+
+def measure(run, operations, repeat, min_time):
+    """Per-operation times in microseconds of repeat batches of about min_time"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        # Grow towards min_time, at least doubling
+        number = max(number * 2, int(number * min_time * 1.1 / max(elapsed, 1e-9)))
+
+    times = [elapsed]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        times.append(time.perf_counter() - start)
+    per_op = [t / (number * operations) * 1e6 for t in times]
+    return {"best_us": min(per_op), "median_us": statistics.median(per_op),
+            "number": number, "operations": operations}
+
+
+def case_name(name, obstacles, lanes):
+    return f"{name}[obstacles={obstacles},lanes={lanes}]"
+
+
+def run_suite(names, obstacle_counts, lane_counts, backend, repeat, min_time):
+    screen = pygame.display.set_mode((GameConfig().SCREEN_WIDTH,
+                                      GameConfig().SCREEN_HEIGHT + 50))
+    results = {}
+    for obstacles in obstacle_counts:
+        for lanes in lane_counts:
+            for name in names:
+                game = build_game(obstacles, lanes, backend)
+                ui = UI(game)
+                ui.initialize(screen, pygame.time.Clock())
+                bench = BENCHMARKS[name](game, ui, lanes)
+                run, operations = bench if isinstance(bench, tuple) else (bench, 1)
+                key = case_name(name, obstacles, lanes)
+                results[key] = measure(run, operations, repeat, min_time)
+                print(f"{key:<50} {results[key]['best_us']:>12.2f} us", flush=True)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print the change of every case against baseline, return regressed cases"""
+    regressions = []
+    print(f"\n{'case':<50} {'baseline':>10} {'now':>10} {'change':>8}")
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:<50} {'-':>10} {result['best_us']:>10.2f} {'new':>8}")
+            continue
+        ratio = result["best_us"] / base["best_us"] if base["best_us"] else 1.0
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<50} {base['best_us']:>10.2f} {result['best_us']:>10.2f} "
+              f"{(ratio - 1) * 100:>+7.1f}%{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frogger hot path benchmark suite")
+    parser.add_argument("--out", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against a JSON file written by --out")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown against the baseline (0.25 = 25%%)")
+    parser.add_argument("--obstacles", type=int, nargs="+", default=list(OBSTACLE_COUNTS))
+    parser.add_argument("--lanes", type=int, nargs="+", default=list(LANE_COUNTS))
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS),
+                        help="run only these benchmarks")
+    parser.add_argument("--backend", default="objects", choices=["objects", "numpy"])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="seconds per timed batch")
+    args = parser.parse_args()
+
+    pygame.init()
+    names = args.only or list(BENCHMARKS)
+    results = run_suite(names, args.obstacles, args.lanes, args.backend,
+                        args.repeat, args.min_time)
+    pygame.quit()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "backend": args.backend,
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "results": results
+    }
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["meta"].get("backend") != args.backend:
+            print(f"warning: baseline was recorded with the "
+                  f"{baseline['meta'].get('backend')} backend")
+        regressions = compare(results, baseline["results"], args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.tolerance:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+# game/__init__.py
+
+# Инициализация пакета game
+# Экспортируем основные классы для удобного импорта.
+# Модули загружаются лениво, при первом обращении к имени: симуляция
+# (Game, HeadlessRunner) не тянет за собой pygame, его импортируют
+# только UI и отрисовка.
+
+import importlib
+
+# Имя -> модуль пакета, в котором оно определено
+_EXPORTS = {
+    'GameConfig': '.config',
+    'Game': '.game',
+    'Player': '.player',
+    'ObstacleManager': '.obstacles',
+    'Obstacle': '.obstacles',
+    'LevelManager': '.levels',
+    'Home': '.levels',
+    'UI': '.ui',
+    'HeadlessRunner': '.headless'
+}
+
+__all__ = [
+    'GameConfig',
+    'Game',
+    'Player',
+    'ObstacleManager',
+    'Obstacle',
+    'LevelManager',
+    'Home',
+    'UI',
+    'HeadlessRunner'
+]
+
+__version__ = '1.0.0'
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,72 @@
+# game/board.py
+# Board geometry from GameConfig, compiled once into per-row lookup tables.
+
+# Lane kinds of GameConfig.LANE_KINDS. "start" is safe ground like "safe",
+# drawn black like the strip the frog has always started on
+LANE_KIND_NAMES = ("safe", "start", "road", "river", "goal")
+SAFE, START, ROAD, RIVER, GOAL = range(len(LANE_KIND_NAMES))
+
+# Background color of each lane kind, as GameConfig.COLORS keys
+LANE_COLORS = ("GREEN", "BLACK", "ROAD_GRAY", "RIVER_BLUE", "GOAL_GREEN")
+
+# Boards shared by everything using the same geometry, see board_key()
+_boards = {}
+
+
+def board_key(config):
+    """Everything a Board depends on or is checked against"""
+    return (config.BOARD_COLUMNS, tuple(config.LANE_KINDS), config.CELL_SIZE,
+            config.HOME_COUNT, config.HOME_X, config.HOME_Y, config.HOME_SPACING,
+            config.SCREEN_WIDTH, config.FROG_START["x"], config.FROG_START["y"])
+
+
+def get_board(config):
+    """Return the shared Board of a config's geometry"""
+    key = board_key(config)
+    board = _boards.get(key)
+    if board is None:
+        board = _boards[key] = Board(config)
+    return board
+
+
+class Board:
+    """Per-row lookup tables of the board described by a GameConfig
+
+    Row y (0 = top) is of kind kinds[y]. is_river and is_goal hold 1 or 0
+    per row, so the player, collision and rendering code test a row with
+    a single index instead of comparing it against row ranges.
+    """
+
+    def __init__(self, config):
+        kinds = []
+        for name in config.LANE_KINDS:
+            if name not in LANE_KIND_NAMES:
+                raise ValueError(f"Unknown lane kind: {name}")
+            kinds.append(LANE_KIND_NAMES.index(name))
+        if config.BOARD_COLUMNS < 1 or not kinds:
+            raise ValueError("The board needs at least one column and one lane")
+        if config.BOARD_COLUMNS * config.CELL_SIZE > config.SCREEN_WIDTH:
+            raise ValueError(f"{config.BOARD_COLUMNS} columns of {config.CELL_SIZE} pixels "
+                             f"don't fit in SCREEN_WIDTH {config.SCREEN_WIDTH}")
+        start = config.FROG_START
+        if not (0 <= start["x"] < config.BOARD_COLUMNS and 0 <= start["y"] < len(kinds)):
+            raise ValueError(f"FROG_START {start} is off the "
+                             f"{config.BOARD_COLUMNS}x{len(kinds)} board")
+
+        self.columns = config.BOARD_COLUMNS
+        self.rows = len(kinds)
+        self.cell_size = config.CELL_SIZE
+        self.kinds = bytes(kinds)
+        self.is_river = bytes(kind == RIVER for kind in kinds)
+        self.is_goal = bytes(kind == GOAL for kind in kinds)
+        self.home_positions = tuple(
+            (config.HOME_X + i * config.HOME_SPACING, config.HOME_Y)
+            for i in range(config.HOME_COUNT))
+
+    def rows_of(self, kind):
+        """Rows of a lane kind, top to bottom"""
+        return tuple(y for y, row_kind in enumerate(self.kinds) if row_kind == kind)
+
+    def lane_colors(self, colors):
+        """Background color of every row, looked up in a COLORS dict"""
+        return [colors[LANE_COLORS[kind]] for kind in self.kinds]
@@ -3,13 +3,30 @@
 class GameConfig:
     def __init__(self):
         # Screen settings
+        # SCREEN_HEIGHT follows from the board, see the property below
         self.SCREEN_WIDTH = 560
-        self.SCREEN_HEIGHT = 600
         self.FPS = 60
+        # Outside gameplay, draw only when something changed and block on
+        # input in between (see game/pacing.py)
+        self.IDLE_FRAME_PACING = True
+        # Blink period of the name input cursor (0 = steady cursor)
+        self.CURSOR_BLINK_MS = 530
+
+        # Rendering: "dirty" repaints changed rects only, "full" flips every frame
+        self.RENDER_MODE = "dirty"
+        # More dirty rects than this in one frame fall back to a full redraw
+        self.DIRTY_RECT_LIMIT = 128
+        # Rendered text surfaces kept by UI.render_text()
+        self.TEXT_CACHE_SIZE = 128
 
         # Game settings
-        self.LANES = 10
         self.CELL_SIZE = 60
+        # Board (see game/board.py): columns the frog moves over, and the kind
+        # of every lane from the top: "goal", "river", "road", "safe" or
+        # "start" (safe ground drawn black). The frog starts on a cell of it
+        self.BOARD_COLUMNS = 9
+        self.LANE_KINDS = ("goal", "river", "river", "river",
+                           "road", "road", "road", "road", "safe", "start")
         self.FROG_START = {"x": 5, "y": 9}
         self.INITIAL_LIVES = 3
 
@@ -33,8 +50,51 @@ class GameConfig:
             "GOAL_GREEN": (144, 238, 144)
         }
 
-        # Game speeds
-        self.LEVEL_SPEEDS = [300, 200]
+        # Milliseconds per simulation tick on levels without their own tick_ms:
+        # START on level 1, halving the distance to MIN on every level after
+        self.LEVEL_TICK_MS_START = 300
+        self.LEVEL_TICK_MS_MIN = 100
+        self.LEVEL_TICK_MS_DECAY = 0.5
+        # Fixed tick length overriding the level speed (None = use the level speed)
+        self.SIM_TICK_MS = None
+        # Longest frame the simulation catches up on (avoids a spiral of death)
+        self.MAX_FRAME_TIME = 1000
+        # Run the simulation on its own thread at the tick rate, drawing the
+        # snapshots it publishes (see game/sim_thread.py)
+        self.THREADED_SIMULATION = False
+
+        # Level files (see game/level_loader.py) and their compiled cache,
+        # relative to the repository root
+        self.LEVEL_DIR = "levels"
+        self.LEVEL_CACHE_DIR = "levels/.cache"
+
+        # Seed for level generation, stored in replays
+        self.LEVEL_SEED = 0
+        # Generate endless levels past the last level file (see game/level_generator.py)
+        self.ENDLESS_LEVELS = True
+        # Generate the next endless level in the background while one is
+        # played. Off for headless runs, main.py turns it on
+        self.PREFETCH_LEVELS = False
+        # Candidates solver-checked at once, worker processes (None = all cores,
+        # 0 = no processes), candidates tried before falling back to a level
+        # file, and ticks the solver may search per candidate
+        self.LEVEL_GEN_BATCH = 4
+        self.LEVEL_GEN_WORKERS = None
+        self.LEVEL_GEN_MAX_CANDIDATES = 32
+        self.LEVEL_GEN_SOLVER_TICKS = 3000
+
+        # Record input logs (see game/replay.py) into REPLAY_DIR on game over
+        self.RECORD_REPLAYS = False
+        self.REPLAY_DIR = "replays"
+
+        # Frame profiler (see game/profiler.py): record from the start, frames
+        # kept, and where F4 exports CSV and Chrome trace files
+        self.PROFILE = False
+        self.PROFILE_FRAMES = 600
+        self.PROFILE_DIR = "profiles"
+
+        # Obstacle backend: "objects" (ObstacleManager) or "numpy" (ArrayObstacleManager)
+        self.OBSTACLE_BACKEND = "objects"
 
         # Obstacle sizes
         self.CAR_WIDTH = 80
@@ -45,8 +105,25 @@ class GameConfig:
         self.HOME_WIDTH = 80
         self.HOME_HEIGHT = 40
 
+        # Homes of levels without their own: HOME_COUNT homes from HOME_X,
+        # HOME_SPACING pixels apart at HOME_Y
+        self.HOME_COUNT = 5
+        self.HOME_X = 40
+        self.HOME_Y = 10
+        self.HOME_SPACING = 120
+
         # Game states
         self.STATE_START = 0
         self.STATE_PLAYING = 1
         self.STATE_GAME_OVER = 2
-        self.STATE_LEVEL_COMPLETE = 3
\ No newline at end of file
+        self.STATE_LEVEL_COMPLETE = 3
+
+    @property
+    def LANES(self):
+        """Number of lanes of the board"""
+        return len(self.LANE_KINDS)
+
+    @property
+    def SCREEN_HEIGHT(self):
+        """Height of the board in pixels, without the info panel"""
+        return self.LANES * self.CELL_SIZE
\ No newline at end of file
@@ -1,14 +1,42 @@
 # game/game.py
-import pygame
 from .config import GameConfig
 from .player import Player
-from .obstacles import ObstacleManager
+from .board import get_board
+from .obstacles import create_obstacle_manager
 from .levels import LevelManager
+from .replay import EVENT_CODES, EVENT_CONTINUE
+from .profiler import FrameProfiler, PHASE_COLLISIONS
+from .input import InputQueue
+from . import snapshot
 
 
-class Game:
+class GameInfo:
+    """Fixed-field view of the state the HUD shows, see Game.get_game_state()"""
+
+    __slots__ = ("player_name", "level", "lives", "score", "state")
+
     def __init__(self):
-        self.config = GameConfig()
+        self.player_name = ""
+        self.level = 0
+        self.lives = 0
+        self.score = 0
+        self.state = 0
+
+    def __getitem__(self, name):
+        # Read like the dict get_game_state() used to return
+        return getattr(self, name)
+
+    def values(self):
+        """The fields as a tuple, to compare against an earlier frame"""
+        return (self.player_name, self.level, self.lives, self.score, self.state)
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class Game:
+    def __init__(self, config=None):
+        self.config = config or GameConfig()
         self.state = {
             "current": self.config.STATE_START,
             "level": 1,
@@ -19,17 +47,40 @@ class Game:
         }
 
         # Initialize game objects
+        self.board = get_board(self.config)
         self.player = Player(self.config)
-        self.obstacle_manager = ObstacleManager(self.config)
+        self.obstacle_manager = create_obstacle_manager(self.config)
         self.level_manager = LevelManager(self.config)
 
         # Timing
         self.last_update = 0
-        self.game_speed = self.config.LEVEL_SPEEDS[0]
+        self.game_speed = self.level_manager.get_tick_ms(1)
+        self.tick = 0
+        # Fixed-timestep state: unsimulated time and render blend factor
+        self.accumulator = 0
+        self.interpolation = 1.0
+        # Whether the last update() left the game running, see update()
+        self.simulating = False
+
+        # Row the frog was on when it last lost a life
+        self.last_death_lane = None
+
+        # Returned by get_game_state(), refreshed in place
+        self.info = GameInfo()
+
+        # Moves and pause toggles from the event loop, applied by update()
+        self.input_queue = InputQueue()
+
+        # Optional replay.InputRecorder logging inputs for replays
+        self.recorder = None
 
-    def reset(self):
+        # Frame phase timings, toggled with F3 in main.py
+        self.profiler = FrameProfiler(self.config.PROFILE_FRAMES)
+        self.profiler.enabled = self.profiler.show_overlay = self.config.PROFILE
+
+    def reset(self, level=1):
         """Reset game to initial state"""
-        self.state["level"] = 1
+        self.state["level"] = level
         self.state["lives"] = self.config.INITIAL_LIVES
         self.state["score"] = 0
         self.state["current"] = self.config.STATE_PLAYING
@@ -38,27 +89,72 @@ class Game:
         self.player.reset()
         self.obstacle_manager.clear()
         self.level_manager.reset_homes()
-        self.level_manager.generate_level(1, self.obstacle_manager)
-        self.game_speed = self.config.LEVEL_SPEEDS[0]
+        self.level_manager.generate_level(level, self.obstacle_manager)
+        self.level_manager.prefetch(level + 1)
+        self.game_speed = self.level_manager.get_tick_ms(level)
+        self.tick = 0
+        self.accumulator = 0
+        self.interpolation = 1.0
+
+        if self.recorder:
+            self.recorder.begin(self, level)
 
     def start_game(self, player_name):
         """Start a new game"""
         self.state["player_name"] = player_name or "Player"
         self.reset()
 
+    @property
+    def tick_ms(self):
+        """Length of one simulation tick in milliseconds"""
+        return self.config.SIM_TICK_MS or self.game_speed
+
     def update(self, current_time):
-        """Update game state"""
-        if self.state["is_paused"] or self.state["current"] != self.config.STATE_PLAYING:
+        """Advance the simulation by the time elapsed since the last frame
+
+        Ticks run at a fixed rate from an accumulator, so the simulation does
+        not depend on the frame rate and dropped frames are caught up.
+        The leftover fraction of a tick is kept in self.interpolation for
+        rendering between ticks. Queued inputs are applied first, so they
+        land on the same tick as a direct move_player() call would.
+        """
+        frame_time = min(current_time - self.last_update, self.config.MAX_FRAME_TIME)
+        self.last_update = current_time
+        if self.input_queue.pending:
+            self.apply_inputs()
+
+        # Time spent in menus or paused is not simulated, and neither is the
+        # frame that starts, continues or unpauses the game after it
+        was_running = self.simulating
+        self.simulating = (not self.state["is_paused"] and
+                           self.state["current"] == self.config.STATE_PLAYING)
+        if not (was_running and self.simulating):
             return
 
-        # Update at game speed interval
-        if current_time - self.last_update > self.game_speed:
-            self.last_update = current_time
+        self.accumulator += frame_time
+        tick_ms = self.tick_ms
+        while self.accumulator >= tick_ms:
+            self.accumulator -= tick_ms
+            self.step()
+            if self.state["current"] != self.config.STATE_PLAYING:
+                self.accumulator = 0
+                break
+
+        self.interpolation = self.accumulator / tick_ms
+
+    def step(self):
+        """Advance the simulation by exactly one tick"""
+        self.tick += 1
 
-            # Update obstacles
-            self.obstacle_manager.update()
+        # Update obstacles
+        self.obstacle_manager.update()
 
-            # Check collisions and game logic
+        # Check collisions and game logic
+        if self.profiler.enabled:
+            started = self.profiler.start()
+            self.check_collisions()
+            self.profiler.stop(PHASE_COLLISIONS, started)
+        else:
             self.check_collisions()
 
     def check_collisions(self):
@@ -87,12 +183,13 @@ class Game:
                 self.complete_level()
 
         # Check if reached top (extra points)
-        if self.player.position["y"] < 1:
+        if self.board.is_goal[self.player.position["y"]]:
             self.state["score"] += 50
             self.player.reset()
 
     def lose_life(self):
         """Handle losing a life"""
+        self.last_death_lane = self.player.position["y"]
         self.state["lives"] -= 1
         self.player.reset()
 
@@ -101,7 +198,7 @@ class Game:
 
     def complete_level(self):
         """Handle level completion"""
-        if self.state["level"] < 2:
+        if not self.level_manager.is_last_level(self.state["level"]):
             self.state["current"] = self.config.STATE_LEVEL_COMPLETE
         else:
             self.state["score"] += 500
@@ -109,34 +206,64 @@ class Game:
 
     def next_level(self):
         """Advance to next level"""
+        if self.recorder:
+            self.recorder.record(self.tick, EVENT_CONTINUE)
+
         self.state["level"] += 1
         self.player.reset()
         self.level_manager.reset_homes()
         self.level_manager.generate_level(self.state["level"], self.obstacle_manager)
+        self.level_manager.prefetch(self.state["level"] + 1)
         self.state["current"] = self.config.STATE_PLAYING
+        self.accumulator = 0
+        self.interpolation = 1.0
+        self.game_speed = self.level_manager.get_tick_ms(self.state["level"])
 
-        # Update game speed for level 2
-        if self.state["level"] == 2:
-            self.game_speed = self.config.LEVEL_SPEEDS[1]
+    def queue_input(self, action, timestamp):
+        """Queue a move or "pause" for the next update()"""
+        self.input_queue.push(action, timestamp)
+
+    def apply_inputs(self):
+        """Apply queued inputs in arrival order"""
+        queue = self.input_queue
+        while queue.pending:
+            timestamp, action = queue.pending.popleft()
+            if action == "pause":
+                self.toggle_pause()
+            elif self.move_player(action):
+                queue.applied.append(timestamp)
 
     def move_player(self, direction):
-        """Move player in specified direction"""
+        """Move player in specified direction, return True if it moved"""
         if (self.state["current"] == self.config.STATE_PLAYING and
                 not self.state["is_paused"]):
+            if self.recorder:
+                self.recorder.record(self.tick, EVENT_CODES[direction])
             if self.player.move(direction):
                 self.player.update_rect()
                 self.check_collisions()
+                return True
+        return False
+
+    def snapshot(self):
+        """Pack the simulation state into a small bytes buffer"""
+        return snapshot.snapshot(self)
+
+    def restore(self, data):
+        """Restore the simulation state from a snapshot() buffer"""
+        snapshot.restore(self, data)
 
     def toggle_pause(self):
         """Toggle pause state"""
         self.state["is_paused"] = not self.state["is_paused"]
 
     def get_game_state(self):
-        """Return current game state"""
-        return {
-            "player_name": self.state["player_name"],
-            "level": self.state["level"],
-            "lives": self.state["lives"],
-            "score": self.state["score"],
-            "state": self.state["current"]
-        }
\ No newline at end of file
+        """Return current game state as a GameInfo, reused between calls"""
+        info = self.info
+        state = self.state
+        info.player_name = state["player_name"]
+        info.level = state["level"]
+        info.lives = state["lives"]
+        info.score = state["score"]
+        info.state = state["current"]
+        return info
\ No newline at end of file
@@ -0,0 +1,103 @@
+# game/headless.py
+import random
+from .game import Game
+
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+def idle_policy(game):
+    """Never move the frog"""
+    return None
+
+
+def random_policy(seed=None, move_chance=0.5):
+    """Build a policy that presses a random direction on some ticks"""
+    rng = random.Random(seed)
+
+    def policy(game):
+        if rng.random() < move_chance:
+            return rng.choice(DIRECTIONS)
+        return None
+
+    return policy
+
+
+def scripted_policy(moves):
+    """Build a policy that replays a fixed sequence of moves (None = wait)"""
+    moves = list(moves)
+
+    def policy(game):
+        if game.tick < len(moves):
+            return moves[game.tick]
+        return None
+
+    return policy
+
+
+class HeadlessRunner:
+    """Steps a Game by virtual ticks: no display, no UI, no frame cap"""
+
+    def __init__(self, game=None, policy=None, auto_continue=True):
+        self.game = game or Game()
+        self.policy = policy or idle_policy
+        self.auto_continue = auto_continue
+        self.virtual_time = 0
+        # Lane of every life lost since start()
+        self.death_lanes = []
+
+    def start(self, level=1, player_name="Bot"):
+        """Start a fresh game on the given level"""
+        self.game.state["player_name"] = player_name
+        self.game.reset(level)
+        self.virtual_time = 0
+        self.game.last_update = 0
+        self.death_lanes = []
+
+    def advance(self):
+        """Apply one policy input and run one simulation tick"""
+        game = self.game
+        lives = game.state["lives"]
+        direction = self.policy(game)
+        if direction is not None:
+            game.move_player(direction)
+            lives = self._track_death(lives)
+
+        if game.state["current"] == game.config.STATE_PLAYING:
+            # The virtual clock moves exactly one tick, as in Game.update()
+            self.virtual_time += game.tick_ms
+            game.last_update = self.virtual_time
+            game.step()
+            self._track_death(lives)
+
+        if (game.state["current"] == game.config.STATE_LEVEL_COMPLETE and
+                self.auto_continue):
+            game.next_level()
+
+    def _track_death(self, lives):
+        """Record the death lane if a life was lost, return current lives"""
+        if self.game.state["lives"] < lives:
+            self.death_lanes.append(self.game.last_death_lane)
+        return self.game.state["lives"]
+
+    def is_running(self):
+        """Check if the game still accepts ticks"""
+        return self.game.state["current"] == self.game.config.STATE_PLAYING
+
+    def run(self, max_ticks):
+        """Run until the game stops or max_ticks ticks have elapsed"""
+        ticks = 0
+        while ticks < max_ticks and self.is_running():
+            self.advance()
+            ticks += 1
+        return ticks
+
+    def run_episode(self, level=1, max_ticks=10000):
+        """Play one full game headlessly and return its summary"""
+        self.start(level)
+        ticks = self.run(max_ticks)
+        result = self.game.get_game_state().as_dict()
+        result["ticks"] = ticks
+        result["virtual_time"] = self.virtual_time
+        result["death_lanes"] = list(self.death_lanes)
+        result["completed"] = self.game.level_manager.all_homes_filled()
+        return result
@@ -0,0 +1,65 @@
+# game/input.py
+# Key dispatch table and the timestamped queue of gameplay inputs.
+from collections import deque
+
+# Actions that go through the InputQueue instead of running at once
+QUEUED_ACTIONS = ("up", "down", "left", "right", "pause")
+
+
+def build_key_actions(config):
+    """Precompute the (state, key) -> action table used by main.py"""
+    import pygame
+    # Keys of the four moves: arrows and WASD
+    move_keys = {
+        pygame.K_UP: "up", pygame.K_w: "up",
+        pygame.K_DOWN: "down", pygame.K_s: "down",
+        pygame.K_LEFT: "left", pygame.K_a: "left",
+        pygame.K_RIGHT: "right", pygame.K_d: "right"
+    }
+    states = (config.STATE_START, config.STATE_PLAYING,
+              config.STATE_GAME_OVER, config.STATE_LEVEL_COMPLETE)
+    table = {}
+    for state in states:
+        table[(state, pygame.K_F3)] = "profiler"
+        table[(state, pygame.K_F4)] = "export_profile"
+        table[(state, pygame.K_ESCAPE)] = "quit"
+
+    table[(config.STATE_START, pygame.K_RETURN)] = "start"
+    for key, direction in move_keys.items():
+        table[(config.STATE_PLAYING, key)] = direction
+    table[(config.STATE_PLAYING, pygame.K_p)] = "pause"
+    table[(config.STATE_GAME_OVER, pygame.K_r)] = "restart"
+    table[(config.STATE_GAME_OVER, pygame.K_m)] = "menu"
+    table[(config.STATE_LEVEL_COMPLETE, pygame.K_RETURN)] = "continue"
+    return table
+
+
+class InputQueue:
+    """Gameplay inputs waiting for the next simulation update
+
+    Entries are (timestamp, action) with perf_counter() timestamps taken
+    when the event was handled. Game.update() applies them in arrival
+    order before running its ticks, and keeps the timestamps of moves that
+    changed the frog's position until presented() is called after the
+    frame showing them reached the display.
+    """
+
+    def __init__(self):
+        self.pending = deque()
+        self.applied = []
+
+    def __len__(self):
+        return len(self.pending)
+
+    def push(self, action, timestamp):
+        self.pending.append((timestamp, action))
+
+    def clear(self):
+        self.pending.clear()
+        self.applied.clear()
+
+    def presented(self, now, profiler):
+        """Record input-to-display latency of every move applied since the last call"""
+        for timestamp in self.applied:
+            profiler.record_latency(now - timestamp)
+        self.applied.clear()
@@ -0,0 +1,142 @@
+# game/level_generator.py
+# Seeded procedural levels past the last level file, checked for solvability.
+import os
+import random
+from .level_loader import make_level
+from .board import ROAD, RIVER, get_board
+
+# Config values generated levels depend on
+GENERATOR_FIELDS = (
+    "LEVEL_SEED", "LEVEL_DIR", "SCREEN_WIDTH", "CELL_SIZE", "BOARD_COLUMNS", "LANE_KINDS",
+    "FROG_SIZE", "CAR_WIDTH", "CAR_HEIGHT", "LOG_WIDTH", "LOG_HEIGHT",
+    "HOME_WIDTH", "HOME_HEIGHT", "HOME_COUNT", "HOME_X", "HOME_Y", "HOME_SPACING",
+    "LEVEL_TICK_MS_START", "LEVEL_TICK_MS_MIN", "LEVEL_TICK_MS_DECAY",
+    "LEVEL_GEN_MAX_CANDIDATES", "LEVEL_GEN_SOLVER_TICKS"
+)
+
+
+def level_tick_ms(config, level):
+    """Tick length of a level: decays from LEVEL_TICK_MS_START to LEVEL_TICK_MS_MIN"""
+    start = config.LEVEL_TICK_MS_START
+    low = config.LEVEL_TICK_MS_MIN
+    return round(low + (start - low) * config.LEVEL_TICK_MS_DECAY ** (level - 1))
+
+
+def _lane(rng, lane, is_log, width, screen_width, count, speed):
+    """count evenly spaced obstacles of one lane at a random phase"""
+    right = rng.random() < 0.5
+    span = screen_width + width
+    spacing = span // count
+    phase = rng.randrange(span)
+    return [(is_log, lane, right, (phase + i * spacing) % span - width, speed)
+            for i in range(count)]
+
+
+def candidate(config, level, index):
+    """Layout candidate number index for a level, a pure function of LEVEL_SEED"""
+    rng = random.Random(f"{config.LEVEL_SEED}:{level}:{index}")
+    difficulty = max(level - 1, 0)
+    screen_width = config.SCREEN_WIDTH
+    board = get_board(config)
+
+    # Cars on every road lane, logs on every river lane
+    obstacles = []
+    for lane in board.rows_of(ROAD):
+        count = min(1 + difficulty // 2 + rng.randint(0, 1), 4)
+        speed = rng.randint(2, min(3 + difficulty // 2, 8))
+        obstacles += _lane(rng, lane, False, config.CAR_WIDTH, screen_width, count, speed)
+    for lane in board.rows_of(RIVER):
+        # Fewer and faster logs as the levels go on
+        count = max(1, 3 - difficulty // 3 + rng.randint(0, 1))
+        speed = rng.randint(1, min(2 + difficulty // 3, 6))
+        obstacles += _lane(rng, lane, True, config.LOG_WIDTH, screen_width, count, speed)
+
+    return make_level(level_tick_ms(config, level), board.home_positions, obstacles)
+
+
+def check_candidate(task):
+    """Process pool job: True if a candidate can be solved within the tick budget"""
+    # Imported here: the solver needs the level classes, which import this module
+    from .solver import LevelSolver
+
+    config, level, index = task
+    data = candidate(config, level, index)
+    return LevelSolver(config, level, data).is_solvable(config.LEVEL_GEN_SOLVER_TICKS)
+
+
+class LevelGenerator:
+    """Endless sequence of solvable levels for a config
+
+    Candidates for a level are solver-checked in batches of
+    LEVEL_GEN_BATCH on a process pool, and the first solvable one in
+    candidate order wins, so the result does not depend on timing or the
+    number of workers. Levels are generated on a background thread;
+    prefetch() the next level while the current one is played.
+    """
+
+    def __init__(self, config, fallback):
+        # Imported here: games without endless levels never pay for them
+        import multiprocessing
+        from concurrent.futures import ThreadPoolExecutor
+        self.config = config
+        # Layout used if no candidate is solvable: a known good level
+        self.fallback = fallback
+        self.levels = {}
+        self.futures = {}
+        self.thread = ThreadPoolExecutor(max_workers=1)
+        self.pool = None
+        self.workers = config.LEVEL_GEN_WORKERS
+        if self.workers is None:
+            self.workers = os.cpu_count() or 1
+        if multiprocessing.current_process().daemon:
+            # Pool workers (e.g. simulate.py) may not start processes of their own
+            self.workers = 0
+
+    def prefetch(self, level):
+        """Start generating level in the background, return its future"""
+        future = self.futures.get(level)
+        if future is None:
+            future = self.futures[level] = self.thread.submit(self._generate, level)
+        return future
+
+    def get(self, level):
+        """Return the LevelData of a generated level, waiting if needed"""
+        data = self.levels.get(level)
+        if data is None:
+            try:
+                data = self.levels[level] = self.prefetch(level).result()
+            finally:
+                # Generated levels live on in levels, failed ones are retried
+                self.futures.pop(level, None)
+        return data
+
+    def close(self):
+        """Stop background generation and the worker processes"""
+        self.thread.shutdown(wait=False, cancel_futures=True)
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def _map(self, tasks):
+        if self.workers and self.pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            try:
+                # Separate processes keep the solver off the game thread's GIL
+                self.pool = ProcessPoolExecutor(self.workers)
+            except (OSError, NotImplementedError):
+                # No usable process support, check the batch in this thread
+                self.workers = 0
+        if self.pool is None:
+            return [check_candidate(task) for task in tasks]
+        return list(self.pool.map(check_candidate, tasks))
+
+    def _generate(self, level):
+        config = self.config
+        batch = max(1, config.LEVEL_GEN_BATCH)
+        for first in range(0, config.LEVEL_GEN_MAX_CANDIDATES, batch):
+            indices = range(first, min(first + batch, config.LEVEL_GEN_MAX_CANDIDATES))
+            results = self._map([(config, level, index) for index in indices])
+            for index, solvable in zip(indices, results):
+                if solvable:
+                    return candidate(config, level, index)
+        return make_level(level_tick_ms(config, level), self.fallback.homes,
+                          self.fallback.obstacles)
@@ -0,0 +1,208 @@
+# game/level_loader.py
+# Declarative level files (levels/*.json) compiled to a binary on-disk cache.
+#
+# A level file looks like:
+#
+#   {
+#     "name": "Level 1",
+#     "tick_ms": 300,
+#     "homes": {"count": 5, "x": 40, "y": 10, "spacing": 120},
+#     "lanes": [
+#       {"lane": 4, "type": "car", "direction": "right", "count": 2,
+#        "offset": 0, "spacing": 200, "speed": 3},
+#       ...
+#     ]
+#   }
+#
+# Every lane entry adds count obstacles. offset is the distance of the first
+# one from the edge it enters from, the next ones are spacing further in.
+# count (1), offset (0), spacing (0), speed (3 for cars, 2 for logs),
+# homes (DEFAULT_HOMES) and tick_ms (level_generator.level_tick_ms()) are
+# optional. Obstacles are created in file order.
+import hashlib
+import mmap
+import os
+import struct
+
+MAGIC = b"FRGL"
+VERSION = 1
+
+# magic, version, tick ms (0 = default for the level), home count, obstacle count
+HEADER = struct.Struct("<4sBHHH")
+HOME = struct.Struct("<hh")  # x, y
+OBSTACLE = struct.Struct("<BBhh")  # flags, lane, offset, speed
+
+FLAG_LOG = 1
+FLAG_RIGHT = 2
+
+DEFAULT_SPEEDS = {"car": 3, "log": 2}
+DEFAULT_HOMES = {"count": 5, "x": 40, "y": 10, "spacing": 120}
+
+# Repository root, level paths in GameConfig are relative to it
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class LevelFormatError(ValueError):
+    """Raised for malformed level files or compiled levels"""
+
+
+class LevelData:
+    """A loaded level: tick length, home positions and obstacle records
+
+    Obstacle records stay packed until the level is first generated.
+    """
+
+    def __init__(self, tick_ms, homes, records):
+        self.tick_ms = tick_ms
+        self.homes = homes  # [(x, y)]
+        self.records = records
+        self._obstacles = None
+
+    @property
+    def obstacles(self):
+        """[(is_log, lane, is_right, offset, speed)] in creation order"""
+        if self._obstacles is None:
+            self._obstacles = [
+                (bool(flags & FLAG_LOG), lane, bool(flags & FLAG_RIGHT), offset, speed)
+                for flags, lane, offset, speed in OBSTACLE.iter_unpack(self.records)]
+        return self._obstacles
+
+
+def _int(entry, name, default, low, high):
+    value = entry.get(name, default)
+    if not isinstance(value, int) or not low <= value <= high:
+        raise LevelFormatError(f"{name} must be an integer in {low}..{high}, got {value!r}")
+    return value
+
+
+def compile_level(text):
+    """Compile the JSON text of a level file to its binary form"""
+    # Only needed on a cache miss, keep it out of the import
+    import json
+    try:
+        level = json.loads(text)
+    except ValueError as e:
+        raise LevelFormatError(f"invalid JSON: {e}") from e
+    if not isinstance(level, dict):
+        raise LevelFormatError("a level must be a JSON object")
+
+    homes = level.get("homes", {})
+    home_count = _int(homes, "count", DEFAULT_HOMES["count"], 0, 64)
+    home_x = _int(homes, "x", DEFAULT_HOMES["x"], -32768, 32767)
+    home_y = _int(homes, "y", DEFAULT_HOMES["y"], -32768, 32767)
+    home_spacing = _int(homes, "spacing", DEFAULT_HOMES["spacing"], -32768, 32767)
+    home_records = [HOME.pack(home_x + i * home_spacing, home_y) for i in range(home_count)]
+
+    obstacle_records = []
+    for entry in level.get("lanes", []):
+        kind = entry.get("type")
+        if kind not in DEFAULT_SPEEDS:
+            raise LevelFormatError(f"type must be 'car' or 'log', got {kind!r}")
+        direction = entry.get("direction", "right")
+        if direction not in ("left", "right"):
+            raise LevelFormatError(f"direction must be 'left' or 'right', got {direction!r}")
+        lane = _int(entry, "lane", None, 0, 255)
+        count = _int(entry, "count", 1, 0, 1024)
+        offset = _int(entry, "offset", 0, -32768, 32767)
+        spacing = _int(entry, "spacing", 0, -32768, 32767)
+        speed = _int(entry, "speed", DEFAULT_SPEEDS[kind], 0, 32767)
+        flags = (FLAG_LOG if kind == "log" else 0) | (FLAG_RIGHT if direction == "right" else 0)
+        for i in range(count):
+            obstacle_records.append(OBSTACLE.pack(flags, lane, offset + i * spacing, speed))
+
+    tick_ms = _int(level, "tick_ms", 0, 0, 65535)
+    header = HEADER.pack(MAGIC, VERSION, tick_ms, home_count, len(obstacle_records))
+    return header + b"".join(home_records) + b"".join(obstacle_records)
+
+
+def make_level(tick_ms, homes, obstacles):
+    """Build LevelData from (x, y) homes and (is_log, lane, is_right, offset, speed)"""
+    records = b"".join(
+        OBSTACLE.pack((FLAG_LOG if is_log else 0) | (FLAG_RIGHT if is_right else 0),
+                      lane, offset, speed)
+        for is_log, lane, is_right, offset, speed in obstacles)
+    return LevelData(tick_ms, list(homes), records)
+
+
+def parse_compiled(buffer):
+    """Read a compiled level from any bytes-like buffer"""
+    if len(buffer) < HEADER.size:
+        raise LevelFormatError("compiled level is truncated")
+    magic, version, tick_ms, home_count, obstacle_count = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        raise LevelFormatError("not a compiled level of a supported version")
+    homes_end = HEADER.size + home_count * HOME.size
+    if homes_end + obstacle_count * OBSTACLE.size != len(buffer):
+        raise LevelFormatError("compiled level size does not match its header")
+
+    homes = list(HOME.iter_unpack(buffer[HEADER.size:homes_end]))
+    return LevelData(tick_ms, homes, bytes(buffer[homes_end:]))
+
+
+def load_level(path, cache_dir):
+    """Load a level file through the compiled cache
+
+    The cache file is named after the hash of the level file's content, so
+    edited levels are recompiled and unchanged ones are only memory-mapped.
+    """
+    with open(path, "rb") as f:
+        text = f.read()
+    cache_path = os.path.join(cache_dir, hashlib.sha1(text).hexdigest() + ".lvl")
+    try:
+        with open(cache_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return parse_compiled(m)
+    except (OSError, ValueError):
+        # Missing, empty or stale cache entry: compile it again
+        pass
+
+    try:
+        data = compile_level(text)
+    except LevelFormatError as e:
+        raise LevelFormatError(f"{path}: {e}") from e
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # A read-only checkout still works, it just recompiles every run
+        pass
+    return parse_compiled(data)
+
+
+class LevelCatalog:
+    """The level files of a directory, numbered from 1 in file name order
+
+    Only the directory listing is read up front; each level is loaded on
+    first use and kept.
+    """
+
+    def __init__(self, level_dir, cache_dir):
+        self.level_dir = os.path.join(ROOT, level_dir)
+        self.cache_dir = os.path.join(ROOT, cache_dir)
+        self.loaded = {}
+        self._paths = None
+
+    @property
+    def paths(self):
+        if self._paths is None:
+            try:
+                names = sorted(name for name in os.listdir(self.level_dir)
+                               if name.endswith(".json"))
+            except FileNotFoundError:
+                names = []
+            self._paths = [os.path.join(self.level_dir, name) for name in names]
+        return self._paths
+
+    def __len__(self):
+        return len(self.paths)
+
+    def get(self, level):
+        """Return the LevelData of a level number, or None past the last level"""
+        if not 1 <= level <= len(self.paths):
+            return None
+        data = self.loaded.get(level)
+        if data is None:
+            data = self.loaded[level] = load_level(self.paths[level - 1], self.cache_dir)
+        return data
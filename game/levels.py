@@ -1,9 +1,65 @@
 # game/levels.py
-import pygame
 from .config import GameConfig
+from .level_loader import LevelCatalog
+from .board import get_board
+from .level_generator import GENERATOR_FIELDS, LevelGenerator, level_tick_ms
+from .rect import Rect
+
+
+# Room around a home sprite for border lines drawn on the rect edge
+HOME_MARGIN = 2
+# Level catalogs and generators shared by every LevelManager
+_catalogs = {}
+_generators = {}
+
+
+def get_catalog(config):
+    """Return the shared LevelCatalog of config.LEVEL_DIR"""
+    key = (config.LEVEL_DIR, config.LEVEL_CACHE_DIR)
+    catalog = _catalogs.get(key)
+    if catalog is None:
+        catalog = _catalogs[key] = LevelCatalog(*key)
+    return catalog
+
+
+def get_generator(config):
+    """Return the shared LevelGenerator for the levels after the level files
+
+    The last level file is the layout used when no candidate is
+    solvable, so a ValueError is raised if there is none.
+    """
+    key = tuple(getattr(config, name) for name in GENERATOR_FIELDS)
+    generator = _generators.get(key)
+    if generator is None:
+        catalog = get_catalog(config)
+        fallback = catalog.get(len(catalog))
+        if fallback is None:
+            raise ValueError(f"Endless levels need a level file in {config.LEVEL_DIR!r} "
+                             "to fall back on when no candidate is solvable")
+        generator = _generators[key] = LevelGenerator(config, fallback)
+    return generator
+
+
+def close_generators():
+    """Stop background level generation, e.g. before exiting"""
+    for generator in _generators.values():
+        generator.close()
+    _generators.clear()
+
+
+def home_sprite_key(config, filled):
+    """Cache key of a home sprite: everything its pixels depend on"""
+    colors = config.COLORS
+    return (config.HOME_WIDTH, config.HOME_HEIGHT, config.FROG_SIZE,
+            colors["GOAL_GREEN"], colors["BLACK"], colors["RED"], filled)
 
 
 class Home:
+    __slots__ = ("config", "x", "y", "width", "height", "filled", "frog_color", "rect")
+
+    # Pre-rendered sprites shared by all homes, see home_sprite_key()
+    sprites = {}
+
     def __init__(self, config, x, y):
         self.config = config
         self.x = x
@@ -12,131 +68,92 @@ class Home:
         self.height = config.HOME_HEIGHT
         self.filled = False
         self.frog_color = config.COLORS["RED"]
-        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.rect = Rect(x, y, self.width, self.height)
 
     def draw(self, screen):
         """Draw home on screen"""
-        # Draw home area
-        pygame.draw.rect(
-            screen,
-            self.config.COLORS["GOAL_GREEN"],
-            self.rect
-        )
-
-        # Draw border
-        pygame.draw.rect(
-            screen,
-            self.config.COLORS["BLACK"],
-            self.rect,
-            2
-        )
-
-        # Draw dashed border
-        dash_length = 5
-        for i in range(0, self.width, dash_length * 2):
-            pygame.draw.line(
-                screen,
-                self.config.COLORS["BLACK"],
-                (self.x + i, self.y),
-                (self.x + i + dash_length, self.y),
-                2
-            )
-            pygame.draw.line(
-                screen,
-                self.config.COLORS["BLACK"],
-                (self.x + i, self.y + self.height),
-                (self.x + i + dash_length, self.y + self.height),
-                2
-            )
-
-        for i in range(0, self.height, dash_length * 2):
-            pygame.draw.line(
-                screen,
-                self.config.COLORS["BLACK"],
-                (self.x, self.y + i),
-                (self.x, self.y + i + dash_length),
-                2
-            )
-            pygame.draw.line(
-                screen,
-                self.config.COLORS["BLACK"],
-                (self.x + self.width, self.y + i),
-                (self.x + self.width, self.y + i + dash_length),
-                2
-            )
-
-        # Draw frog if home is filled
-        if self.filled:
-            frog_rect = pygame.Rect(
-                self.x + self.width // 2 - self.config.FROG_SIZE // 2,
-                self.y + self.height // 2 - self.config.FROG_SIZE // 2,
-                self.config.FROG_SIZE,
-                self.config.FROG_SIZE
-            )
-            pygame.draw.circle(
-                screen,
-                self.frog_color,
-                frog_rect.center,
-                self.config.FROG_SIZE // 2
-            )
+        screen.blit(self.get_sprite(), (self.x - HOME_MARGIN, self.y - HOME_MARGIN))
+
+    def get_sprite(self):
+        """Return the pre-rendered surface for the current filled state"""
+        key = home_sprite_key(self.config, self.filled)
+        sprite = Home.sprites.get(key)
+        if sprite is None:
+            # Rendering needs pygame, the simulation doesn't
+            from .sprites import render_home
+            sprite = Home.sprites[key] = render_home(self.config, self.filled)
+        return sprite
 
 
 class LevelManager:
     def __init__(self, config):
         self.config = config
+        self.catalog = get_catalog(config)
         self.homes = []
         self.create_homes()
+        if config.ENDLESS_LEVELS:
+            # Fail now rather than on reaching the first generated level
+            get_generator(config)
+
+        # Cached layer with every home, rebuilt when a home changes
+        self.home_layer = None
+        self.home_layer_key = None
+
+    def is_last_level(self, level):
+        """True if no level follows this one"""
+        return not self.config.ENDLESS_LEVELS and level >= len(self.catalog)
 
-    def create_homes(self):
+    def create_homes(self, positions=None):
         """Create home positions"""
+        if positions is None:
+            positions = get_board(self.config).home_positions
         self.homes.clear()
-        for i in range(5):
-            x = 40 + i * 120
-            y = 10
+        for x, y in positions:
             home = Home(self.config, x, y)
             self.homes.append(home)
 
+    def get_level_data(self, level):
+        """LevelData of a level file, or of a generated level after the last one"""
+        data = self.catalog.get(level)
+        if data is None and self.config.ENDLESS_LEVELS and level > len(self.catalog):
+            data = get_generator(self.config).get(level)
+        return data
+
+    def prefetch(self, level):
+        """Start generating a level in the background if it is not a level file
+
+        Only with config.PREFETCH_LEVELS, elsewhere a level is generated
+        when it is first played.
+        """
+        if (self.config.PREFETCH_LEVELS and self.config.ENDLESS_LEVELS and
+                level > len(self.catalog)):
+            get_generator(self.config).prefetch(level)
+
+    def get_tick_ms(self, level):
+        """Milliseconds per simulation tick on a level"""
+        data = self.catalog.get(level)
+        if data is not None and data.tick_ms:
+            return data.tick_ms
+        return level_tick_ms(self.config, level)
+
     def generate_level(self, level, obstacle_manager):
         """Generate obstacles for specific level"""
         obstacle_manager.clear()
 
-        if level == 1:
-            self.generate_level_1(obstacle_manager)
-        elif level == 2:
-            self.generate_level_2(obstacle_manager)
-
-    def generate_level_1(self, obstacle_manager):
-        """Generate level 1 obstacles"""
-        # Cars on road (lanes 4-7)
-        obstacle_manager.create_car(4, True)  # Lane 4, moving right
-        obstacle_manager.create_car(5, False)  # Lane 5, moving left
-        obstacle_manager.create_car(6, True)  # Lane 6, moving right
-        obstacle_manager.create_car(7, False)  # Lane 7, moving left
-
-        # Logs on river (lanes 1-3)
-        obstacle_manager.create_log(1, True)  # Lane 1, moving right
-        obstacle_manager.create_log(2, False)  # Lane 2, moving left
-        obstacle_manager.create_log(3, True)  # Lane 3, moving right
-
-    def generate_level_2(self, obstacle_manager):
-        """Generate level 2 obstacles (more challenging)"""
-        # More cars
-        obstacle_manager.create_car(4, True)
-        obstacle_manager.create_car(4, False)
-        obstacle_manager.create_car(5, False)
-        obstacle_manager.create_car(5, True)
-        obstacle_manager.create_car(6, True)
-        obstacle_manager.create_car(6, False)
-        obstacle_manager.create_car(7, False)
-        obstacle_manager.create_car(7, True)
-
-        # More logs
-        obstacle_manager.create_log(1, True)
-        obstacle_manager.create_log(1, False)
-        obstacle_manager.create_log(2, False)
-        obstacle_manager.create_log(2, True)
-        obstacle_manager.create_log(3, True)
-        obstacle_manager.create_log(3, False)
+        data = self.get_level_data(level)
+        if data is not None:
+            self.build_level(data, obstacle_manager)
+
+    def build_level(self, data, obstacle_manager):
+        """Create the homes and obstacles of a level_loader.LevelData"""
+        if data.homes != [(home.x, home.y) for home in self.homes]:
+            self.create_homes(data.homes)
+
+        for is_log, lane, is_right, offset, speed in data.obstacles:
+            if is_log:
+                obstacle_manager.create_log(lane, is_right, is_right, offset, speed)
+            else:
+                obstacle_manager.create_car(lane, is_right, is_right, offset, speed)
 
     def check_home_reached(self, player_rect):
         """Check if player reached any home"""
@@ -155,7 +172,16 @@ class LevelManager:
         for home in self.homes:
             home.filled = False
 
+    def get_home_layer(self):
+        """Return one surface with all homes, re-rendered only on change"""
+        key = tuple((home.x, home.y, home_sprite_key(self.config, home.filled))
+                    for home in self.homes)
+        if key != self.home_layer_key:
+            from .sprites import render_home_layer
+            self.home_layer = render_home_layer(self.config, self.homes)
+            self.home_layer_key = key
+        return self.home_layer
+
     def draw_homes(self, screen):
         """Draw all homes"""
-        for home in self.homes:
-            home.draw(screen)
\ No newline at end of file
+        screen.blit(self.get_home_layer(), (0, 0))
\ No newline at end of file
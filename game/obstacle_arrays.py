@@ -0,0 +1,253 @@
+# game/obstacle_arrays.py
+import numpy as np
+from .rect import Rect
+
+
+class ArrayObstacleManager:
+    """Structure-of-arrays obstacle backend
+
+    Keeps x, speed, direction, width and lane of every obstacle in
+    contiguous NumPy arrays so updates, wrap-around and collision tests
+    run as single vectorized operations. The public API is the same as
+    ObstacleManager.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self._pending = []
+        # Bumped whenever positions change, keys the render_x() cache
+        self.version = 0
+        self._render_key = None
+        self.clear()
+
+    def _make_obstacle(self, lane, is_right, is_log, offset, speed):
+        """Return the column values of a new obstacle"""
+        config = self.config
+        if is_log:
+            width, height = config.LOG_WIDTH, config.LOG_HEIGHT
+        else:
+            width, height = config.CAR_WIDTH, config.CAR_HEIGHT
+        if speed is None:
+            speed = 2 if is_log else 3
+        x = offset if is_right else config.SCREEN_WIDTH - offset
+        y = lane * config.CELL_SIZE + (config.CELL_SIZE - height) // 2
+        return (x, y, width, height, speed, is_right, lane, is_log)
+
+    def create_car(self, lane, direction, is_right=True, offset=0, speed=None):
+        """Create a car obstacle"""
+        self._pending.append(self._make_obstacle(lane, is_right, False, offset, speed))
+
+    def create_log(self, lane, direction, is_right=True, offset=0, speed=None):
+        """Create a log obstacle"""
+        self._pending.append(self._make_obstacle(lane, is_right, True, offset, speed))
+
+    def clear(self):
+        """Clear all obstacles"""
+        self._pending.clear()
+        self.tick = 0
+        self.x = np.zeros(0, dtype=np.int64)
+        self.prev_x = np.zeros(0, dtype=np.int64)
+        self.start_x = np.zeros(0, dtype=np.int64)
+        self.start_tick = np.zeros(0, dtype=np.int64)
+        self.y = np.zeros(0, dtype=np.int64)
+        self.width = np.zeros(0, dtype=np.int64)
+        self.height = np.zeros(0, dtype=np.int64)
+        self.speed = np.zeros(0, dtype=np.int64)
+        self.direction = np.zeros(0, dtype=bool)
+        self.lane = np.zeros(0, dtype=np.int64)
+        self.is_log = np.zeros(0, dtype=bool)
+        self._rebuild_masks()
+
+    def _flush(self):
+        """Append obstacles created since the last flush to the arrays"""
+        if not self._pending:
+            return
+        columns = list(zip(*self._pending))
+        self._pending.clear()
+        new_x = np.array(columns[0], dtype=np.int64)
+        self.x = np.concatenate((self.x, new_x))
+        self.prev_x = np.concatenate((self.prev_x, new_x))
+        self.start_x = np.concatenate((self.start_x, new_x))
+        self.start_tick = np.concatenate((self.start_tick, np.full(len(new_x), self.tick)))
+        self.y = np.concatenate((self.y, np.array(columns[1], dtype=np.int64)))
+        self.width = np.concatenate((self.width, np.array(columns[2], dtype=np.int64)))
+        self.height = np.concatenate((self.height, np.array(columns[3], dtype=np.int64)))
+        self.speed = np.concatenate((self.speed, np.array(columns[4], dtype=np.int64)))
+        self.direction = np.concatenate((self.direction, np.array(columns[5], dtype=bool)))
+        self.lane = np.concatenate((self.lane, np.array(columns[6], dtype=np.int64)))
+        self.is_log = np.concatenate((self.is_log, np.array(columns[7], dtype=bool)))
+        self._rebuild_masks()
+
+    def _rebuild_masks(self):
+        """Precompute per-obstacle constants used every tick"""
+        self.version += 1
+        self.velocity = np.where(self.direction, self.speed, -self.speed)
+        self.wrap_left = -self.width
+        # Closed-form motion, see Obstacle.cycle()
+        screen_width = self.config.SCREEN_WIDTH
+        speed = np.maximum(self.speed, 1)
+        self.wrap_period = (screen_width + self.width) // speed + 1
+        self.first_wrap = np.maximum(np.where(
+            self.direction, (screen_width - self.start_x) // speed,
+            (self.start_x + self.width) // speed) + 1, 1)
+        # Obstacles update() never moves, see Obstacle.is_still()
+        self.still = (self.speed == 0) & np.where(
+            self.direction, self.start_x <= screen_width, self.start_x >= -self.width)
+        self.car_index = np.flatnonzero(~self.is_log)
+        self.log_index = np.flatnonzero(self.is_log)
+        # Draw order matches ObstacleManager: cars first, then logs
+        self.draw_index = np.concatenate((self.car_index, self.log_index))
+        # Lane buckets: indices grouped by lane, so queries touch one slice
+        self.car_by_lane, self.car_lanes = self._bucket_by_lane(self.car_index)
+        self.log_by_lane, self.log_lanes = self._bucket_by_lane(self.log_index)
+
+    def _bucket_by_lane(self, index):
+        """Return index stably sorted by lane, and the matching sorted lanes"""
+        order = index[np.argsort(self.lane[index], kind="stable")]
+        return order, self.lane[order]
+
+    def _lane_candidates(self, by_lane, lanes, player_rect):
+        """Indices of obstacles in the lanes player_rect spans"""
+        cell_size = self.config.CELL_SIZE
+        lo = np.searchsorted(lanes, player_rect.top // cell_size, side="left")
+        hi = np.searchsorted(lanes, (player_rect.bottom - 1) // cell_size, side="right")
+        return by_lane[lo:hi]
+
+    def __len__(self):
+        return len(self.x) + len(self._pending)
+
+    def update(self):
+        """Update all obstacles"""
+        self._flush()
+        self.version += 1
+        x = self.x
+        self.prev_x[:] = x
+        x += self.velocity
+        screen_width = self.config.SCREEN_WIDTH
+        # Right movers wrap to -width, left movers wrap to the right edge
+        np.copyto(x, self.wrap_left, where=self.direction & (x > screen_width))
+        x[~self.direction & (x < self.wrap_left)] = screen_width
+        self.tick += 1
+
+    def _positions_at(self, tick):
+        """Closed-form x of every obstacle at tick, in storage order"""
+        ticks = tick - self.start_tick
+        moved = self.start_x + self.velocity * ticks
+        offset = (ticks - self.first_wrap) % self.wrap_period * self.speed
+        wrapped = np.where(self.direction, offset - self.width,
+                           self.config.SCREEN_WIDTH - offset)
+        return np.where((ticks < self.first_wrap) | self.still, moved, wrapped)
+
+    def positions_at(self, tick):
+        """Return the x of every obstacle (cars, then logs) at tick as int32 array"""
+        self._flush()
+        return self._positions_at(tick)[self.draw_index].astype(np.int32)
+
+    def seek(self, tick):
+        """Move every obstacle to where it is after tick updates since clear()"""
+        if tick < 0:
+            raise ValueError("cannot seek before the obstacles were created")
+        self._flush()
+        self.x = self._positions_at(tick)
+        self.prev_x = np.where(tick > self.start_tick, self._positions_at(tick - 1), self.x)
+        self.tick = tick
+        self.version += 1
+
+    def get_positions(self):
+        """Return the x of every obstacle (cars, then logs) as int32 array"""
+        self._flush()
+        return self.x[self.draw_index].astype(np.int32)
+
+    def get_draw_state(self):
+        """(is_log, x, prev_x, y, width, height, speed) of every obstacle in draw order"""
+        self._flush()
+        order = self.draw_index
+        return tuple(zip(self.is_log[order].tolist(), self.x[order].tolist(),
+                         self.prev_x[order].tolist(), self.y[order].tolist(),
+                         self.width[order].tolist(), self.height[order].tolist(),
+                         self.speed[order].tolist()))
+
+    def set_positions(self, positions):
+        """Move every obstacle (cars, then logs) to the given x values"""
+        self._flush()
+        self.x[self.draw_index] = np.frombuffer(positions, dtype=np.int32)
+        self.prev_x[:] = self.x
+        # Positions no longer follow from the creation point
+        self.start_x = self.x.copy()
+        self.start_tick[:] = self.tick
+        self._rebuild_masks()
+
+    def render_x(self, alpha):
+        """Positions blended between the previous and current tick"""
+        if alpha >= 1.0:
+            return self.x
+        key = (alpha, self.version)
+        if key != self._render_key:
+            delta = self.x - self.prev_x
+            blended = np.rint(self.prev_x + delta * alpha).astype(np.int64)
+            # Obstacles that wrapped around the edge are drawn where they are now
+            self._render_x = np.where(np.abs(delta) > self.speed, self.x, blended)
+            self._render_key = key
+        return self._render_x
+
+    def get_rects(self, alpha=1.0):
+        """Return obstacle rects in draw order"""
+        self._flush()
+        order = self.draw_index
+        return [Rect(x, y, w, h) for x, y, w, h in zip(
+            self.render_x(alpha)[order].tolist(), self.y[order].tolist(),
+            self.width[order].tolist(), self.height[order].tolist())]
+
+    def get_sprites(self):
+        """Return the pre-rendered (car, log) surfaces"""
+        from .sprites import obstacle_sprite
+        config = self.config
+        return (obstacle_sprite(config.CAR_WIDTH, config.CAR_HEIGHT, config.COLORS["CAR_RED"]),
+                obstacle_sprite(config.LOG_WIDTH, config.LOG_HEIGHT, config.COLORS["LOG_BROWN"]))
+
+    def _blit_sequence(self, order, alpha):
+        """(sprite, position) pairs of the obstacles in order, for Surface.blits"""
+        sprites = self.get_sprites()
+        return [(sprites[is_log], (x, y)) for is_log, x, y in zip(
+            self.is_log[order].tolist(), self.render_x(alpha)[order].tolist(),
+            self.y[order].tolist())]
+
+    def draw(self, screen, alpha=1.0):
+        """Draw all obstacles with one batched blit"""
+        self._flush()
+        screen.blits(self._blit_sequence(self.draw_index, alpha), False)
+
+    def draw_many(self, screen, indices, alpha=1.0):
+        """Draw the obstacles at the given draw order indices, in that order"""
+        self._flush()
+        order = self.draw_index[np.asarray(indices, dtype=np.int64)]
+        screen.blits(self._blit_sequence(order, alpha), False)
+
+    def draw_one(self, screen, index, alpha=1.0):
+        """Draw the obstacle at index in draw order"""
+        self.draw_many(screen, (index,), alpha)
+
+    def _overlaps(self, index, player_rect):
+        """Vectorized colliderect of player_rect against obstacles[index]"""
+        x = self.x[index]
+        y = self.y[index]
+        return ((x < player_rect.right) & (x + self.width[index] > player_rect.x) &
+                (y < player_rect.bottom) & (y + self.height[index] > player_rect.y))
+
+    def is_hit_by_car(self, player_rect):
+        """Check if player is hit by any car"""
+        self._flush()
+        index = self._lane_candidates(self.car_by_lane, self.car_lanes, player_rect)
+        return bool(self._overlaps(index, player_rect).any())
+
+    def is_on_log(self, player_rect):
+        """Check if player is on any log"""
+        self._flush()
+        index = self._lane_candidates(self.log_by_lane, self.log_lanes, player_rect)
+        hits = index[self._overlaps(index, player_rect)]
+        if not len(hits):
+            return False
+        # Move player with the first created matching log, like ObstacleManager
+        log = hits.min()
+        player_rect.x += int(self.velocity[log])
+        return True
@@ -1,15 +1,28 @@
 # game/obstacles.py
-import pygame
+from array import array
+from bisect import bisect_left
 from .config import GameConfig
+from .rect import Rect
 
 
 class Obstacle:
-    def __init__(self, config, lane, direction, is_log=False):
+    __slots__ = ("config", "lane", "direction", "is_log", "speed", "width", "height",
+                 "color", "x", "y", "prev_x", "start_x", "start_tick", "rect", "sprite")
+
+    def __init__(self, config, lane, direction, is_log=False, offset=0, speed=None):
         self.config = config
+        self.rect = Rect(0, 0, 0, 0)
+        self.reset(lane, direction, is_log, offset, speed)
+
+    def reset(self, lane, direction, is_log=False, offset=0, speed=None):
+        """Re-initialize in place, so pooled obstacles can be reused"""
+        config = self.config
         self.lane = lane
         self.direction = direction  # True = right, False = left
         self.is_log = is_log
-        self.speed = 2 if is_log else 3
+        if speed is None:
+            speed = 2 if is_log else 3
+        self.speed = speed
 
         # Set size based on type
         if is_log:
@@ -21,14 +34,21 @@ class Obstacle:
             self.height = config.CAR_HEIGHT
             self.color = config.COLORS["CAR_RED"]
 
-        # Initial position
-        self.x = 0 if direction else config.SCREEN_WIDTH
+        # Initial position: offset pixels in from the edge it enters from
+        self.x = offset if direction else config.SCREEN_WIDTH - offset
         self.y = lane * config.CELL_SIZE + (config.CELL_SIZE - self.height) // 2
+        # Position before the last tick, for interpolated rendering
+        self.prev_x = self.x
+        # Where position_at() counts from: x at manager tick start_tick
+        self.start_x = self.x
+        self.start_tick = 0
 
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect.update(self.x, self.y, self.width, self.height)
+        self.sprite = None
 
     def update(self):
         """Update obstacle position"""
+        self.prev_x = self.x
         if self.direction:  # Moving right
             self.x += self.speed
             if self.x > self.config.SCREEN_WIDTH:
@@ -40,60 +60,323 @@ class Obstacle:
 
         self.rect.x = self.x
 
-    def draw(self, screen):
+    def cycle(self):
+        """Return (tick of the first wrap, ticks per wrap) counted from start_x"""
+        if not self.speed:
+            return 1, 1
+        screen_width = self.config.SCREEN_WIDTH
+        period = (screen_width + self.width) // self.speed + 1
+        if self.direction:
+            first = (screen_width - self.start_x) // self.speed + 1
+        else:
+            first = (self.start_x + self.width) // self.speed + 1
+        return max(first, 1), period
+
+    def is_still(self):
+        """True if update() never moves it from start_x
+
+        A speed 0 obstacle starting past the edge it wraps at is still
+        wrapped once by the first update(), and stays there.
+        """
+        if self.speed:
+            return False
+        if self.direction:
+            return self.start_x <= self.config.SCREEN_WIDTH
+        return self.start_x >= -self.width
+
+    def position_at(self, ticks):
+        """x after the given number of update() calls from start_x, in O(1)"""
+        first, period = self.cycle()
+        if ticks < first or self.is_still():
+            offset = ticks * self.speed
+            return self.start_x + offset if self.direction else self.start_x - offset
+        # After the first wrap the motion repeats from the wrap position
+        offset = (ticks - first) % period * self.speed
+        if self.direction:
+            return offset - self.width
+        return self.config.SCREEN_WIDTH - offset
+
+    def seek(self, ticks):
+        """Jump to the position after the given number of updates from start_x"""
+        self.x = self.position_at(ticks)
+        self.prev_x = self.position_at(ticks - 1) if ticks > 0 else self.x
+        self.rect.x = self.x
+
+    def render_x(self, alpha):
+        """Position blended between the previous and current tick"""
+        if abs(self.x - self.prev_x) > self.speed:
+            # Wrapped around the screen edge, don't sweep across it
+            return self.x
+        return round(self.prev_x + (self.x - self.prev_x) * alpha)
+
+    def render_rect(self, alpha=1.0):
+        """Rect to draw at, given the fraction of the current tick elapsed"""
+        if alpha >= 1.0 or self.x == self.prev_x:
+            return self.rect
+        return Rect(self.render_x(alpha), self.y, self.width, self.height)
+
+    def render_topleft(self, alpha=1.0):
+        """Position to blit at, as a tuple: pygame parses those fastest"""
+        if alpha >= 1.0 or self.x == self.prev_x:
+            return (self.x, self.y)
+        return (self.render_x(alpha), self.y)
+
+    def get_sprite(self):
+        """Return the pre-rendered surface of this obstacle"""
+        if self.sprite is None:
+            from .sprites import obstacle_sprite
+            self.sprite = obstacle_sprite(self.width, self.height, self.color)
+        return self.sprite
+
+    def draw(self, screen, alpha=1.0):
         """Draw obstacle on screen"""
-        pygame.draw.rect(screen, self.color, self.rect)
-        # Rounded corners
-        pygame.draw.rect(screen, self.color, self.rect, border_radius=5)
+        screen.blit(self.get_sprite(), self.render_topleft(alpha))
 
     def collides_with(self, player_rect):
         """Check collision with player"""
         return self.rect.colliderect(player_rect)
 
 
+class LaneBucket:
+    """Obstacles of one lane, sorted by x on demand"""
+
+    def __init__(self):
+        # [x, creation order, obstacle], updated and re-sorted in place
+        self.entries = []
+        self.xs = []
+        self.max_width = 0
+        self.version = -1
+
+    def add(self, order, obstacle):
+        self.entries.append([obstacle.x, order, obstacle])
+        self.xs.append(obstacle.x)
+        self.max_width = max(self.max_width, obstacle.width)
+        self.version = -1
+
+    def clear(self):
+        self.entries.clear()
+        self.xs.clear()
+        self.max_width = 0
+        self.version = -1
+
+    def resort(self, version):
+        """Re-sort by current x (cheap: the order barely changes per tick)"""
+        entries = self.entries
+        for entry in entries:
+            entry[0] = entry[2].x
+        # Creation orders are unique, so obstacles are never compared
+        entries.sort()
+        xs = self.xs
+        for i, entry in enumerate(entries):
+            xs[i] = entry[0]
+        self.version = version
+
+
+class LaneIndex:
+    """Spatial index of obstacles bucketed by lane and sorted by x"""
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.lanes = {}
+        self.count = 0
+        self.version = 0
+
+    def add(self, obstacle):
+        bucket = self.lanes.get(obstacle.lane)
+        if bucket is None:
+            bucket = self.lanes[obstacle.lane] = LaneBucket()
+        bucket.add(self.count, obstacle)
+        self.count += 1
+
+    def clear(self):
+        # Buckets are kept for the next level, most lanes are used again
+        for bucket in self.lanes.values():
+            bucket.clear()
+        self.count = 0
+
+    def invalidate(self):
+        """Mark every lane as unsorted after obstacles moved"""
+        self.version += 1
+
+    def candidates(self, rect):
+        """Yield (order, obstacle) for obstacles whose x-span may overlap rect"""
+        cell_size = self.cell_size
+        x = rect.x
+        y = rect.y
+        for lane in range(y // cell_size, (y + rect.height - 1) // cell_size + 1):
+            bucket = self.lanes.get(lane)
+            if bucket is None:
+                continue
+            if bucket.version != self.version:
+                bucket.resort(self.version)
+            # x + width > rect.x  and  x < rect.right
+            lo = bisect_left(bucket.xs, x - bucket.max_width + 1)
+            hi = bisect_left(bucket.xs, x + rect.width)
+            for i in range(lo, hi):
+                _, order, obstacle = bucket.entries[i]
+                yield order, obstacle
+
+
 class ObstacleManager:
     def __init__(self, config):
         self.config = config
         self.obstacles = []
         self.logs = []
+        self.car_index = LaneIndex(config.CELL_SIZE)
+        self.log_index = LaneIndex(config.CELL_SIZE)
+        # Obstacles released by clear(), reused by the next level
+        self.pool = []
+        # Updates since clear(); obstacle positions are a function of it
+        self.tick = 0
+
+    def _obstacle(self, lane, is_right, is_log, offset, speed):
+        """A pooled obstacle re-initialized in place, or a new one"""
+        if self.pool:
+            obstacle = self.pool.pop()
+            obstacle.reset(lane, is_right, is_log, offset, speed)
+        else:
+            obstacle = Obstacle(self.config, lane, is_right, is_log, offset, speed)
+        obstacle.start_tick = self.tick
+        return obstacle
 
-    def create_car(self, lane, direction, is_right=True):
+    def create_car(self, lane, direction, is_right=True, offset=0, speed=None):
         """Create a car obstacle"""
-        car = Obstacle(self.config, lane, is_right, is_log=False)
+        car = self._obstacle(lane, is_right, False, offset, speed)
         self.obstacles.append(car)
+        self.car_index.add(car)
 
-    def create_log(self, lane, direction, is_right=True):
+    def create_log(self, lane, direction, is_right=True, offset=0, speed=None):
         """Create a log obstacle"""
-        log = Obstacle(self.config, lane, is_right, is_log=True)
+        log = self._obstacle(lane, is_right, True, offset, speed)
         self.logs.append(log)
+        self.log_index.add(log)
 
     def clear(self):
         """Clear all obstacles"""
+        self.pool.extend(self.obstacles)
+        self.pool.extend(self.logs)
         self.obstacles.clear()
         self.logs.clear()
+        self.car_index.clear()
+        self.log_index.clear()
+        self.tick = 0
 
     def update(self):
         """Update all obstacles"""
-        for obstacle in self.obstacles + self.logs:
+        for obstacle in self.obstacles:
+            obstacle.update()
+        for obstacle in self.logs:
             obstacle.update()
+        self.tick += 1
+        self.car_index.invalidate()
+        self.log_index.invalidate()
+
+    def positions_at(self, tick):
+        """Return the x of every obstacle (cars, then logs) at tick as array('i')
+
+        Computed in closed form, without moving anything.
+        """
+        return array("i", [obstacle.position_at(tick - obstacle.start_tick)
+                           for obstacles in (self.obstacles, self.logs)
+                           for obstacle in obstacles])
+
+    def seek(self, tick):
+        """Move every obstacle to where it is after tick updates since clear()
+
+        Costs O(obstacles) for any tick; update() stays the cheap path for
+        advancing one tick at a time.
+        """
+        if tick < 0:
+            raise ValueError("cannot seek before the obstacles were created")
+        for obstacles in (self.obstacles, self.logs):
+            for obstacle in obstacles:
+                obstacle.seek(tick - obstacle.start_tick)
+        self.tick = tick
+        self.car_index.invalidate()
+        self.log_index.invalidate()
 
-    def draw(self, screen):
-        """Draw all obstacles"""
-        for obstacle in self.obstacles + self.logs:
-            obstacle.draw(screen)
+    def get_positions(self):
+        """Return the x of every obstacle (cars, then logs) as array('i')"""
+        return array("i", [obstacle.x for obstacles in (self.obstacles, self.logs)
+                           for obstacle in obstacles])
+
+    def get_draw_state(self):
+        """(is_log, x, prev_x, y, width, height, speed) of every obstacle in draw order"""
+        return tuple((o.is_log, o.x, o.prev_x, o.y, o.width, o.height, o.speed)
+                     for obstacles in (self.obstacles, self.logs) for o in obstacles)
+
+    def set_positions(self, positions):
+        """Move every obstacle (cars, then logs) to the given x values"""
+        all_obstacles = (obstacle for obstacles in (self.obstacles, self.logs)
+                         for obstacle in obstacles)
+        for obstacle, x in zip(all_obstacles, positions):
+            obstacle.x = obstacle.prev_x = x
+            obstacle.rect.x = x
+            # Positions no longer follow from the creation point
+            obstacle.start_x = x
+            obstacle.start_tick = self.tick
+        self.car_index.invalidate()
+        self.log_index.invalidate()
+
+    def draw(self, screen, alpha=1.0):
+        """Draw all obstacles with one batched blit"""
+        screen.blits([(obstacle.get_sprite(), obstacle.render_topleft(alpha))
+                      for obstacles in (self.obstacles, self.logs)
+                      for obstacle in obstacles], False)
+
+    def draw_many(self, screen, indices, alpha=1.0):
+        """Draw the obstacles at the given draw order indices, in that order"""
+        cars = self.obstacles
+        logs = self.logs
+        count = len(cars)
+        blits = []
+        for index in indices:
+            obstacle = cars[index] if index < count else logs[index - count]
+            blits.append((obstacle.get_sprite(), obstacle.render_topleft(alpha)))
+        screen.blits(blits, False)
+
+    def get_rects(self, alpha=1.0):
+        """Return obstacle rects in draw order"""
+        return [obstacle.render_rect(alpha) for obstacles in (self.obstacles, self.logs)
+                for obstacle in obstacles]
+
+    def draw_one(self, screen, index, alpha=1.0):
+        """Draw the obstacle at index in draw order"""
+        count = len(self.obstacles)
+        if index < count:
+            self.obstacles[index].draw(screen, alpha)
+        else:
+            self.logs[index - count].draw(screen, alpha)
 
     def is_hit_by_car(self, player_rect):
         """Check if player is hit by any car"""
-        for car in self.obstacles:
+        for _, car in self.car_index.candidates(player_rect):
             if car.collides_with(player_rect):
                 return True
         return False
 
     def is_on_log(self, player_rect):
         """Check if player is on any log"""
-        for log in self.logs:
-            if log.collides_with(player_rect):
-                # Move player with log
-                player_rect.x += log.speed if log.direction else -log.speed
-                return True
-        return False
\ No newline at end of file
+        # The earliest created log wins, as in a plain list scan
+        first = None
+        for order, log in self.log_index.candidates(player_rect):
+            if (first is None or order < first[0]) and log.collides_with(player_rect):
+                first = (order, log)
+        if first is None:
+            return False
+
+        # Move player with log
+        log = first[1]
+        player_rect.x += log.speed if log.direction else -log.speed
+        return True
+
+
+def create_obstacle_manager(config):
+    """Create the obstacle manager selected by config.OBSTACLE_BACKEND"""
+    if config.OBSTACLE_BACKEND == "numpy":
+        # Imported lazily so NumPy stays an optional dependency
+        from .obstacle_arrays import ArrayObstacleManager
+        return ArrayObstacleManager(config)
+    if config.OBSTACLE_BACKEND == "objects":
+        return ObstacleManager(config)
+    raise ValueError(f"Unknown obstacle backend: {config.OBSTACLE_BACKEND}")
\ No newline at end of file
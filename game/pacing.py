@@ -0,0 +1,66 @@
+# game/pacing.py
+# Decides when the main loop draws a frame and how long it may block on input.
+import pygame
+
+
+class FrameScheduler:
+    """Event-driven frame pacing for screens where nothing moves by itself
+
+    While a game is being played, or the profiler overlay shows live
+    timings, every frame is drawn at config.FPS. On the start, pause, game
+    over and level complete screens the picture only changes with the
+    game state, on input, or when an animation timer such as the blinking
+    cursor fires. There a frame is drawn only when frame_key() changed,
+    and wait() blocks in pygame.event.wait() between them.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.enabled = config.IDLE_FRAME_PACING
+        # frame_key() of the last idle frame drawn, None to draw the next one
+        self.drawn_key = None
+
+    def invalidate(self):
+        """Draw the next frame even if nothing changed, e.g. after an expose event"""
+        self.drawn_key = None
+
+    def is_active(self, game):
+        """True while the picture changes on its own and every frame is drawn"""
+        state = game.state
+        return (not self.enabled or game.profiler.show_overlay or
+                state["current"] == self.config.STATE_PLAYING and not state["is_paused"])
+
+    def is_idle(self, game):
+        """True once the current idle screen is drawn, and wait() may block"""
+        return self.drawn_key is not None and not self.is_active(game)
+
+    def frame_key(self, game, ui, now):
+        """Everything an idle frame shows that can change"""
+        state = game.state
+        return (state["current"], state["is_paused"], state["level"], state["lives"],
+                state["score"], state["player_name"],
+                ui.text_input, ui.active_input, ui.cursor_visible(now))
+
+    def should_draw(self, game, ui, now):
+        """Whether to draw the frame at pygame.time.get_ticks() time now"""
+        if self.is_active(game):
+            self.drawn_key = None
+            return True
+        key = self.frame_key(game, ui, now)
+        if key == self.drawn_key:
+            return False
+        self.drawn_key = key
+        return True
+
+    def wait(self, ui):
+        """Block until an event arrives or the next animation frame is due
+
+        Returns the event received, as a list to handle before the
+        pygame.event.get() of the next frame.
+        """
+        timeout = ui.next_animation_ms(pygame.time.get_ticks())
+        # pygame.event.wait() takes 0 as "no timeout"
+        event = pygame.event.wait(0 if timeout is None else max(1, timeout))
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event]
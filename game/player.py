@@ -1,9 +1,18 @@
 # game/player.py
-import pygame
 from .config import GameConfig
+from .board import get_board
+from .rect import Rect
+
+# Room around the frog sprite for the circle's outermost pixels
+FROG_MARGIN = 2
 
 
 class Player:
+    __slots__ = ("config", "position", "start_position", "rect", "color", "size", "board")
+
+    # Pre-rendered frog sprites, keyed by everything their pixels depend on
+    sprites = {}
+
     def __init__(self, config):
         self.config = config
         self.position = config.FROG_START.copy()
@@ -11,55 +20,56 @@ class Player:
         self.rect = None
         self.color = config.COLORS["FROG_GREEN"]
         self.size = config.FROG_SIZE
+        self.board = get_board(config)
 
     def move(self, direction):
-        old_position = self.position.copy()
+        position = self.position
+        if direction == "up" and position["y"] > 0:
+            position["y"] -= 1
+        elif direction == "down" and position["y"] < self.board.rows - 1:
+            position["y"] += 1
+        elif direction == "left" and position["x"] > 0:
+            position["x"] -= 1
+        elif direction == "right" and position["x"] < self.board.columns - 1:
+            position["x"] += 1
+        else:
+            return False
 
-        if direction == "up" and self.position["y"] > 0:
-            self.position["y"] -= 1
-        elif direction == "down" and self.position["y"] < 9:
-            self.position["y"] += 1
-        elif direction == "left" and self.position["x"] > 0:
-            self.position["x"] -= 1
-        elif direction == "right" and self.position["x"] < 8:
-            self.position["x"] += 1
-
-        # Return True if position changed
-        return old_position != self.position
+        # Position changed
+        return True
 
     def update_rect(self):
-        """Update rectangle position based on grid position"""
+        """Update rectangle position based on grid position, in place"""
         cell_size = self.config.CELL_SIZE
-        self.rect = pygame.Rect(
-            self.position["x"] * cell_size + (cell_size - self.size) // 2,
-            self.position["y"] * cell_size + (cell_size - self.size) // 2,
-            self.size,
-            self.size
-        )
+        x = self.position["x"] * cell_size + (cell_size - self.size) // 2
+        y = self.position["y"] * cell_size + (cell_size - self.size) // 2
+        if self.rect is None:
+            self.rect = Rect(x, y, self.size, self.size)
+        else:
+            self.rect.update(x, y, self.size, self.size)
 
     def reset(self):
         """Reset player to starting position"""
-        self.position = self.start_position.copy()
+        self.position["x"] = self.start_position["x"]
+        self.position["y"] = self.start_position["y"]
         self.update_rect()
 
     def is_in_river(self):
-        """Check if player is in river area (rows 1-3)"""
-        return 1 <= self.position["y"] <= 3
+        """Check if player is on a river lane"""
+        return self.board.is_river[self.position["y"]] == 1
+
+    def get_sprite(self):
+        """Return the pre-rendered frog surface"""
+        key = (self.size, tuple(self.color), tuple(self.config.COLORS["BLACK"]))
+        sprite = Player.sprites.get(key)
+        if sprite is None:
+            # Rendering needs pygame, the simulation doesn't
+            from .sprites import render_frog
+            sprite = Player.sprites[key] = render_frog(self.config, self.color)
+        return sprite
 
     def draw(self, screen):
         """Draw the player on screen"""
         if self.rect:
-            pygame.draw.circle(
-                screen,
-                self.color,
-                self.rect.center,
-                self.size // 2
-            )
-            # Draw border
-            pygame.draw.circle(
-                screen,
-                self.config.COLORS["BLACK"],
-                self.rect.center,
-                self.size // 2,
-                2
-            )
\ No newline at end of file
+            screen.blit(self.get_sprite(),
+                        (self.rect.x - FROG_MARGIN, self.rect.y - FROG_MARGIN))
\ No newline at end of file
@@ -0,0 +1,237 @@
+# game/profiler.py
+# Per-phase frame timings in a ring buffer, with percentiles, overlay and export.
+import os
+from array import array
+from time import perf_counter
+
+# Timed phases of a frame. update includes collisions, which is also
+# reported on its own; flip is display.flip() or display.update(rects).
+PHASES = ("events", "update", "collisions", "background", "homes",
+          "obstacles", "player", "hud", "flip")
+(PHASE_EVENTS, PHASE_UPDATE, PHASE_COLLISIONS, PHASE_BACKGROUND, PHASE_HOMES,
+ PHASE_OBSTACLES, PHASE_PLAYER, PHASE_HUD, PHASE_FLIP) = range(len(PHASES))
+
+# Upper edges of the histogram buckets in milliseconds
+HISTOGRAM_EDGES = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, float("inf"))
+
+
+class FrameProfiler:
+    """Times the phases of every frame into a ring buffer
+
+    Instrumented code brackets a phase with start() and stop(phase,
+    started). While disabled both are a single attribute test, so the
+    profiler can stay wired into the game loop permanently.
+    """
+
+    # Frames between overlay refreshes, so the numbers stay readable
+    OVERLAY_INTERVAL = 30
+
+    def __init__(self, capacity=600):
+        self.enabled = False
+        self.show_overlay = False
+        self.capacity = capacity
+        phases = len(PHASES)
+        # Frame-major rings: durations and first start of each phase, in seconds
+        self.durations = array("d", bytes(8 * capacity * phases))
+        self.offsets = array("d", bytes(8 * capacity * phases))
+        self.frame_starts = array("d", bytes(8 * capacity))
+        self.frame_times = array("d", bytes(8 * capacity))
+        self.count = 0
+        # Input-to-display latencies in seconds, recorded even while disabled
+        self.latencies = array("d", bytes(8 * capacity))
+        self.latency_count = 0
+        # perf_counter() of the first recorded frame, frame starts count from it
+        self.epoch = None
+        self.recording = False
+        self.frame_start = 0.0
+        self.current = [0.0] * phases
+        self.current_offsets = [-1.0] * phases
+        # Overlay surface, rebuilt every OVERLAY_INTERVAL frames
+        self.overlay = None
+        self.overlay_frame = -1
+
+    def toggle(self):
+        """Switch recording and the overlay on or off together"""
+        self.enabled = not self.enabled
+        self.show_overlay = self.enabled
+        self.overlay = None
+
+    def start(self):
+        """Timestamp for stop(), 0.0 while disabled"""
+        return perf_counter() if self.enabled else 0.0
+
+    def stop(self, phase, started):
+        """Add the time since started to a phase of the current frame"""
+        if self.enabled and started:
+            now = perf_counter()
+            self.current[phase] += now - started
+            if self.current_offsets[phase] < 0:
+                self.current_offsets[phase] = started - self.frame_start
+
+    def begin_frame(self):
+        # Frames only count if recording was on from their start
+        self.recording = self.enabled
+        if self.enabled:
+            self.frame_start = perf_counter()
+            if self.epoch is None:
+                self.epoch = self.frame_start
+            phases = len(PHASES)
+            self.current = [0.0] * phases
+            self.current_offsets = [-1.0] * phases
+
+    def end_frame(self):
+        """Store the current frame into the ring"""
+        if not self.recording:
+            return
+        slot = self.count % self.capacity
+        base = slot * len(PHASES)
+        self.durations[base:base + len(PHASES)] = array("d", self.current)
+        self.offsets[base:base + len(PHASES)] = array("d", self.current_offsets)
+        self.frame_starts[slot] = self.frame_start - self.epoch
+        self.frame_times[slot] = perf_counter() - self.frame_start
+        self.count += 1
+
+    def record_latency(self, seconds):
+        """Store the time from handling an input to displaying its result"""
+        self.latencies[self.latency_count % self.capacity] = seconds
+        self.latency_count += 1
+
+    def latency_times(self):
+        """Recorded input-to-display latencies, in milliseconds"""
+        count = min(self.latency_count, self.capacity)
+        return [value * 1000 for value in self.latencies[:count]]
+
+    def frames(self):
+        """Ring slots of the recorded frames, oldest first"""
+        if self.count <= self.capacity:
+            return range(self.count)
+        first = self.count % self.capacity
+        return [(first + i) % self.capacity for i in range(self.capacity)]
+
+    def phase_times(self, phase):
+        """Durations of one phase over the recorded frames, in milliseconds"""
+        phases = len(PHASES)
+        if phase is None:
+            return [self.frame_times[slot] * 1000 for slot in self.frames()]
+        return [self.durations[slot * phases + phase] * 1000 for slot in self.frames()]
+
+    def stats(self):
+        """{phase: {mean, p50, p90, p99, max, histogram}} in milliseconds
+
+        The "frame" entry covers the whole frame, "input" the latency from
+        handling a move to the display update showing it. histogram counts
+        samples per HISTOGRAM_EDGES bucket.
+        """
+        result = {}
+        for name, phase in list(zip(PHASES, range(len(PHASES)))) + [("frame", None)]:
+            times = self.phase_times(phase)
+            if times:
+                result[name] = summarize(times)
+        latencies = self.latency_times()
+        if latencies:
+            result["input"] = summarize(latencies)
+        return result
+
+    def export_csv(self, path):
+        """One row per recorded frame: start and each phase in milliseconds"""
+        import csv
+        phases = len(PHASES)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame", "start_ms", "frame_ms") + PHASES)
+            first = self.count - len(self.frames())
+            for i, slot in enumerate(self.frames()):
+                row = [first + i, round(self.frame_starts[slot] * 1000, 3),
+                       round(self.frame_times[slot] * 1000, 4)]
+                row += [round(self.durations[slot * phases + phase] * 1000, 4)
+                        for phase in range(phases)]
+                writer.writerow(row)
+
+    def export_chrome_trace(self, path):
+        """Write the frames as Chrome trace JSON (chrome://tracing, Perfetto)"""
+        import json
+        phases = len(PHASES)
+        events = []
+        for slot in self.frames():
+            start = self.frame_starts[slot] * 1e6
+            events.append({"name": "frame", "ph": "X", "pid": 1, "tid": 1,
+                           "ts": start, "dur": self.frame_times[slot] * 1e6})
+            for phase in range(phases):
+                offset = self.offsets[slot * phases + phase]
+                if offset < 0:
+                    continue
+                events.append({"name": PHASES[phase], "ph": "X", "pid": 1, "tid": 1,
+                               "ts": start + offset * 1e6,
+                               "dur": self.durations[slot * phases + phase] * 1e6})
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def export(self, directory, name):
+        """Write name.csv and name.trace.json into directory, return their paths"""
+        os.makedirs(directory, exist_ok=True)
+        csv_path = os.path.join(directory, name + ".csv")
+        trace_path = os.path.join(directory, name + ".trace.json")
+        self.export_csv(csv_path)
+        self.export_chrome_trace(trace_path)
+        return csv_path, trace_path
+
+    def get_overlay(self, font):
+        """Overlay surface with p50/p99/max per phase, drawn at the top left
+
+        Rebuilt every OVERLAY_INTERVAL frames, so the numbers stay readable.
+        """
+        if self.overlay is None or self.count - self.overlay_frame >= self.OVERLAY_INTERVAL:
+            self.overlay = self.build_overlay(font)
+            self.overlay_frame = self.count
+        return self.overlay
+
+    def build_overlay(self, font):
+        white = (255, 255, 255)
+        stats = self.stats()
+        rows = [("ms", "p50", "p99", "max")]
+        for name in PHASES + ("frame", "input"):
+            if name in stats:
+                s = stats[name]
+                rows.append((name, f"{s['p50']:.2f}", f"{s['p99']:.2f}", f"{s['max']:.2f}"))
+
+        # Right-aligned number columns, the default font is not monospaced
+        column_width = font.size("000.00")[0] + 8
+        label_width = font.size("collisions")[0] + 8
+        line_height = font.get_linesize()
+        import pygame
+        surface = pygame.Surface((label_width + 3 * column_width + 8,
+                                  line_height * len(rows) + 8))
+        y = 4
+        for label, *values in rows:
+            surface.blit(font.render(label, True, white), (4, y))
+            x = 4 + label_width
+            for value in values:
+                text = font.render(value, True, white)
+                surface.blit(text, (x + column_width - text.get_width(), y))
+                x += column_width
+            y += line_height
+        return surface
+
+
+def summarize(times):
+    """mean, percentiles, max and histogram of a list of milliseconds"""
+    times = sorted(times)
+    histogram = [0] * len(HISTOGRAM_EDGES)
+    bucket = 0
+    for value in times:
+        while value > HISTOGRAM_EDGES[bucket]:
+            bucket += 1
+        histogram[bucket] += 1
+    return {
+        "mean": sum(times) / len(times),
+        "p50": percentile(times, 0.50),
+        "p90": percentile(times, 0.90),
+        "p99": percentile(times, 0.99),
+        "max": times[-1],
+        "histogram": histogram
+    }
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list"""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
@@ -0,0 +1,134 @@
+# game/rect.py
+# Integer rectangle math for the simulation, without importing pygame.
+
+
+class Rect:
+    """Axis-aligned integer rectangle, the pygame.Rect subset the simulation uses
+
+    Behaves like pygame.Rect for non-negative sizes: the right and bottom
+    edges are exclusive and rectangles without area never collide. Other
+    rects may be Rect or pygame.Rect. A Rect is a sequence of (x, y,
+    width, height), so pygame accepts it wherever it takes a rect.
+    """
+
+    __slots__ = ("x", "y", "width", "height")
+
+    def __init__(self, x, y, width, height):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    @property
+    def left(self):
+        return self.x
+
+    @property
+    def top(self):
+        return self.y
+
+    @property
+    def right(self):
+        return self.x + self.width
+
+    @property
+    def bottom(self):
+        return self.y + self.height
+
+    @property
+    def topleft(self):
+        return (self.x, self.y)
+
+    @property
+    def center(self):
+        return (self.x + self.width // 2, self.y + self.height // 2)
+
+    def update(self, x, y, width, height):
+        """Set all four fields in place"""
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    def copy(self):
+        return Rect(self.x, self.y, self.width, self.height)
+
+    def colliderect(self, other):
+        """True if the two rectangles overlap in a non-empty area"""
+        return (self.x < other.x + other.width and other.x < self.x + self.width and
+                self.y < other.y + other.height and other.y < self.y + self.height and
+                self.width > 0 and self.height > 0 and other.width > 0 and other.height > 0)
+
+    def collidepoint(self, point):
+        x, y = point
+        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+
+    def collidelist(self, rects):
+        """Index of the first of rects this one collides with, or -1"""
+        for i, rect in enumerate(rects):
+            if self.colliderect(rect):
+                return i
+        return -1
+
+    def clip(self, other):
+        """The overlapping part, or an empty Rect at this one's position
+
+        Edge cases follow pygame: a zero-size side inside the other rect
+        gives a zero-size result there.
+        """
+        x = _clip_start(self.x, self.width, other.x, other.width)
+        y = _clip_start(self.y, self.height, other.y, other.height)
+        if x is not None and y is not None:
+            right = _clip_end(self.x, self.width, other.x, other.width)
+            bottom = _clip_end(self.y, self.height, other.y, other.height)
+            if right is not None and bottom is not None:
+                return Rect(x, y, right - x, bottom - y)
+        return Rect(self.x, self.y, 0, 0)
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self.width, self.height)[index]
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+        yield self.width
+        yield self.height
+
+    def __eq__(self, other):
+        if isinstance(other, Rect):
+            return (self.x == other.x and self.y == other.y and
+                    self.width == other.width and self.height == other.height)
+        try:
+            return tuple(self) == tuple(other)
+        except TypeError:
+            return NotImplemented
+
+    # Mutable, like pygame.Rect
+    __hash__ = None
+
+    def __bool__(self):
+        return self.width != 0 and self.height != 0
+
+    def __repr__(self):
+        return f"<rect({self.x}, {self.y}, {self.width}, {self.height})>"
+
+
+def _clip_start(a, a_size, b, b_size):
+    """Start of the overlap of two spans on one axis, None if they miss"""
+    if b <= a < b + b_size:
+        return a
+    if a <= b < a + a_size:
+        return b
+    return None
+
+
+def _clip_end(a, a_size, b, b_size):
+    """End of the overlap of two spans on one axis, None if they miss"""
+    if b < a + a_size <= b + b_size:
+        return a + a_size
+    if a < b + b_size <= a + a_size:
+        return b + b_size
+    return None
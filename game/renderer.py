@@ -0,0 +1,266 @@
+# game/renderer.py
+import pygame
+from .profiler import (PHASE_BACKGROUND, PHASE_HOMES, PHASE_OBSTACLES, PHASE_PLAYER,
+                       PHASE_HUD, PHASE_FLIP)
+
+
+def pygame_rect(rect):
+    """pygame.Rect copy of a simulation Rect, for pygame's C rect functions"""
+    return pygame.Rect(rect.x, rect.y, rect.width, rect.height)
+
+
+class FullRenderer:
+    """Redraws the whole frame and flips the display every frame"""
+
+    def __init__(self, game, ui, screen):
+        self.game = game
+        self.ui = ui
+        self.screen = screen
+        self.profiler = game.profiler
+
+    def invalidate(self):
+        """Force the next frame to be fully redrawn"""
+
+    def draw_playfield(self):
+        """Draw background, homes, obstacles and the player"""
+        profiler = self.profiler
+        started = profiler.start()
+        self.ui.draw_background()
+        profiler.stop(PHASE_BACKGROUND, started)
+
+        started = profiler.start()
+        self.game.level_manager.draw_homes(self.screen)
+        profiler.stop(PHASE_HOMES, started)
+
+        started = profiler.start()
+        self.game.obstacle_manager.draw(self.screen, self.game.interpolation)
+        profiler.stop(PHASE_OBSTACLES, started)
+
+        started = profiler.start()
+        self.game.player.draw(self.screen)
+        profiler.stop(PHASE_PLAYER, started)
+
+    def draw_profiler(self):
+        """Draw the frame profiler overlay if it is shown, return its rect"""
+        if not self.profiler.show_overlay:
+            return None
+        overlay = self.profiler.get_overlay(self.ui.fonts["tiny"])
+        return self.screen.blit(overlay, (0, 0))
+
+    def profiler_overlay_rect(self):
+        """Where draw_profiler() will draw this frame, None if hidden"""
+        if not self.profiler.show_overlay:
+            return None
+        return self.profiler.get_overlay(self.ui.fonts["tiny"]).get_rect()
+
+    def draw_frame(self):
+        """Draw the complete frame for the current game state"""
+        game = self.game
+        config = game.config
+        self.screen.fill(config.COLORS["BLACK"])
+
+        if game.state["current"] == config.STATE_START:
+            started = self.profiler.start()
+            self.ui.draw_start_screen()
+            self.profiler.stop(PHASE_HUD, started)
+
+        elif game.state["current"] in [config.STATE_PLAYING,
+                                       config.STATE_LEVEL_COMPLETE,
+                                       config.STATE_GAME_OVER]:
+            self.draw_playfield()
+
+            # Draw game info
+            started = self.profiler.start()
+            self.ui.draw_game_info(game.get_game_state())
+
+            # Draw overlay screens
+            if game.state["current"] == config.STATE_GAME_OVER:
+                self.ui.draw_game_over_screen(game.get_game_state())
+            elif game.state["current"] == config.STATE_LEVEL_COMPLETE:
+                self.ui.draw_level_complete_screen()
+            elif game.state["is_paused"]:
+                self.ui.draw_pause_screen()
+            self.profiler.stop(PHASE_HUD, started)
+
+        self.draw_profiler()
+
+    def flip(self):
+        started = self.profiler.start()
+        pygame.display.flip()
+        self.profiler.stop(PHASE_FLIP, started)
+
+    def render(self):
+        """Draw the frame and push it to the display"""
+        self.draw_frame()
+        self.flip()
+
+
+class DirtyRectRenderer(FullRenderer):
+    """Repaints and updates only the regions that changed since last frame
+
+    While the game is being played unpaused, only the old and new rects of
+    moved obstacles, the player and the HUD are restored from the cached
+    background and pushed with pygame.display.update(rects). Everything else
+    (menus, overlays, home changes, level changes) falls back to a full
+    redraw and flip.
+    """
+
+    def __init__(self, game, ui, screen):
+        super().__init__(game, ui, screen)
+        self.screen_rect = screen.get_rect()
+        self.hud_rect = pygame.Rect(0, game.config.SCREEN_HEIGHT,
+                                    game.config.SCREEN_WIDTH, 50)
+        self.max_rects = game.config.DIRTY_RECT_LIMIT
+        # Where the profiler overlay was drawn last frame
+        self.profiler_rect = None
+        self.invalidate()
+
+    def invalidate(self):
+        """Force the next frame to be fully redrawn"""
+        self.frame_key = None
+        self.obstacle_rects = []
+        self.player_rect = None
+        self.hud_state = None
+
+    def current_frame_key(self):
+        """Anything that, when changed, needs a full redraw"""
+        game = self.game
+        # Refresh both static caches so their keys reflect the current state
+        self.ui.get_background()
+        game.level_manager.get_home_layer()
+        return (game.state["current"], game.state["is_paused"], game.state["level"],
+                self.ui.background_key, game.level_manager.home_layer_key,
+                self.profiler.show_overlay)
+
+    def can_draw_incrementally(self):
+        game = self.game
+        return (game.state["current"] == game.config.STATE_PLAYING and
+                not game.state["is_paused"])
+
+    def obstacle_rects_at(self, alpha):
+        """Obstacle rects of this frame, as new pygame.Rects"""
+        return [pygame_rect(rect) for rect in self.game.obstacle_manager.get_rects(alpha)]
+
+    def remember(self, obstacle_rects):
+        """Store the rects of this frame to diff the next one against"""
+        self.obstacle_rects = obstacle_rects
+        player_rect = self.game.player.rect
+        self.player_rect = pygame_rect(player_rect) if player_rect else None
+        state = self.game.get_game_state()
+        self.hud_state = state.values()
+
+    def render_full(self):
+        self.draw_frame()
+        self.flip()
+        self.profiler_rect = self.profiler_overlay_rect()
+        # Cache keys are refreshed by the draw calls above
+        self.frame_key = self.current_frame_key()
+        self.remember(self.obstacle_rects_at(self.game.interpolation))
+
+    def render(self):
+        """Draw the frame and push only the changed regions"""
+        if not self.can_draw_incrementally():
+            self.render_full()
+            self.frame_key = None
+            return
+
+        alpha = self.game.interpolation
+        obstacle_rects = self.obstacle_rects_at(alpha)
+        if (self.frame_key != self.current_frame_key() or
+                len(obstacle_rects) != len(self.obstacle_rects)):
+            self.render_full()
+            return
+
+        dirty = []
+        items = []  # (index, rect) of drawables not yet scheduled for redraw
+        redraw = set()
+        if self.profiler.show_overlay:
+            # The overlay is redrawn on top every frame, and may change size
+            dirty.append(self.profiler_rect)
+            dirty.append(self.profiler_overlay_rect())
+        for index, (old, new) in enumerate(zip(self.obstacle_rects, obstacle_rects)):
+            if old != new:
+                dirty.append(old)
+                dirty.append(new)
+                redraw.add(index)
+            else:
+                items.append((index, new))
+
+        player_index = len(obstacle_rects)
+        player_rect = self.game.player.rect
+        if player_rect is not None:
+            player_rect = pygame_rect(player_rect)
+            if player_rect != self.player_rect:
+                if self.player_rect is not None:
+                    dirty.append(self.player_rect)
+                dirty.append(player_rect)
+                redraw.add(player_index)
+            else:
+                items.append((player_index, player_rect))
+
+        # Anything overlapping a repainted region must be redrawn too
+        changed = True
+        while changed and items:
+            changed = False
+            remaining = []
+            for index, rect in items:
+                if rect.collidelist(dirty) != -1:
+                    dirty.append(rect)
+                    redraw.add(index)
+                    changed = True
+                else:
+                    remaining.append((index, rect))
+            items = remaining
+
+        if len(dirty) > self.max_rects:
+            self.render_full()
+            return
+
+        dirty = [rect.clip(self.screen_rect) for rect in dirty]
+        dirty = [rect for rect in dirty if rect.width and rect.height]
+
+        # Restore the static layers under every dirty region
+        profiler = self.profiler
+        started = profiler.start()
+        background = self.ui.get_background()
+        self.screen.blits([(background, rect, rect) for rect in dirty], False)
+        profiler.stop(PHASE_BACKGROUND, started)
+
+        started = profiler.start()
+        home_layer = self.game.level_manager.get_home_layer()
+        self.screen.blits([(home_layer, rect, rect) for rect in dirty], False)
+        profiler.stop(PHASE_HOMES, started)
+
+        # Redraw in the usual order: obstacles, then the player
+        started = profiler.start()
+        self.game.obstacle_manager.draw_many(
+            self.screen, [index for index in sorted(redraw) if index != player_index], alpha)
+        profiler.stop(PHASE_OBSTACLES, started)
+        if player_index in redraw:
+            started = profiler.start()
+            self.game.player.draw(self.screen)
+            profiler.stop(PHASE_PLAYER, started)
+
+        started = profiler.start()
+        state = self.game.get_game_state()
+        if state.values() != self.hud_state:
+            self.ui.draw_game_info(state)
+            dirty.append(self.hud_rect)
+        profiler.stop(PHASE_HUD, started)
+
+        self.profiler_rect = self.draw_profiler()
+
+        if dirty:
+            started = profiler.start()
+            pygame.display.update(dirty)
+            profiler.stop(PHASE_FLIP, started)
+        self.remember(obstacle_rects)
+
+
+def create_renderer(game, ui, screen):
+    """Create the renderer selected by config.RENDER_MODE"""
+    if game.config.RENDER_MODE == "dirty":
+        return DirtyRectRenderer(game, ui, screen)
+    if game.config.RENDER_MODE == "full":
+        return FullRenderer(game, ui, screen)
+    raise ValueError(f"Unknown render mode: {game.config.RENDER_MODE}")
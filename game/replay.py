@@ -0,0 +1,160 @@
+# game/replay.py
+# Compact binary input logs and headless replay verification.
+#
+# Verify recorded sessions: python -m game.replay replays/*.frr
+import struct
+import sys
+import time
+from .board import LANE_KIND_NAMES
+from .config import GameConfig
+
+MAGIC = b"FRGR"
+VERSION = 3
+
+# Event codes stored in the log
+EVENT_CODES = {"up": 0, "down": 1, "left": 2, "right": 3}
+EVENT_CONTINUE = 4  # Game.next_level() after a completed level
+EVENT_NAMES = {code: name for name, code in EVENT_CODES.items()}
+
+# Integer config values that change the simulation, stored in every log.
+# The board's LANE_KINDS follow the header, SCREEN_HEIGHT follows from
+# them. LEVEL_GEN_BATCH and
+# LEVEL_GEN_WORKERS don't change which level gets generated
+CONFIG_FIELDS = (
+    "SCREEN_WIDTH", "CELL_SIZE", "FROG_SIZE", "INITIAL_LIVES",
+    "CAR_WIDTH", "CAR_HEIGHT", "LOG_WIDTH", "LOG_HEIGHT",
+    "HOME_WIDTH", "HOME_HEIGHT", "LEVEL_SEED",
+    "BOARD_COLUMNS", "HOME_COUNT", "HOME_X", "HOME_Y", "HOME_SPACING",
+    "ENDLESS_LEVELS", "LEVEL_GEN_MAX_CANDIDATES", "LEVEL_GEN_SOLVER_TICKS"
+)
+
+# magic, version, start level, frog start x/y, config fields, lane count
+HEADER = struct.Struct("<4sBHhh" + "i" * len(CONFIG_FIELDS) + "B")
+EVENT = struct.Struct("<IB")  # tick, event code
+# event count, final tick, score, lives, state
+FOOTER = struct.Struct("<IIiiB")
+
+
+class ReplayError(ValueError):
+    """Raised for malformed input logs"""
+
+
+class InputRecorder:
+    """Records (tick, input) events of a Game for deterministic replay
+
+    Attach with game.recorder = InputRecorder(); Game calls begin() on
+    reset and record() for every accepted move and level continue.
+    """
+
+    def __init__(self):
+        self.level = 1
+        self.config_values = ()
+        self.frog_start = (0, 0)
+        self.lane_kinds = b""
+        self.events = bytearray()
+        self.count = 0
+
+    def begin(self, game, level):
+        """Start a new log for a game that was just reset"""
+        config = game.config
+        self.level = level
+        self.config_values = tuple(int(getattr(config, name)) for name in CONFIG_FIELDS)
+        self.frog_start = (config.FROG_START["x"], config.FROG_START["y"])
+        # One LANE_KIND_NAMES index per lane
+        self.lane_kinds = bytes(LANE_KIND_NAMES.index(name) for name in config.LANE_KINDS)
+        self.events = bytearray()
+        self.count = 0
+
+    def record(self, tick, code):
+        self.events += EVENT.pack(tick, code)
+        self.count += 1
+
+    def to_bytes(self, game):
+        """Serialize the log with the game's current result as expected outcome"""
+        header = HEADER.pack(MAGIC, VERSION, self.level, *self.frog_start,
+                             *self.config_values, len(self.lane_kinds))
+        footer = FOOTER.pack(self.count, game.tick, game.state["score"],
+                             game.state["lives"], game.state["current"])
+        return header + self.lane_kinds + bytes(self.events) + footer
+
+    def save(self, game, path):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes(game))
+
+
+def parse(data):
+    """Split a log into (level, config, events, expected outcome)"""
+    if len(data) < HEADER.size + FOOTER.size:
+        raise ReplayError("input log is truncated")
+    fields = HEADER.unpack_from(data, 0)
+    magic, version, level, start_x, start_y = fields[:5]
+    if magic != MAGIC or version != VERSION:
+        raise ReplayError("not a Frogger input log of a supported version")
+
+    config = GameConfig()
+    for name, value in zip(CONFIG_FIELDS, fields[5:-1]):
+        setattr(config, name, value)
+    config.ENDLESS_LEVELS = bool(config.ENDLESS_LEVELS)
+    config.FROG_START = {"x": start_x, "y": start_y}
+
+    start = HEADER.size + fields[-1]
+    try:
+        config.LANE_KINDS = tuple(LANE_KIND_NAMES[kind] for kind in data[HEADER.size:start])
+    except IndexError:
+        raise ReplayError("input log has an unknown lane kind") from None
+
+    count, tick, score, lives, state = FOOTER.unpack_from(data, len(data) - FOOTER.size)
+    if start + count * EVENT.size + FOOTER.size != len(data):
+        raise ReplayError("input log size does not match its event count")
+    events = list(EVENT.iter_unpack(data[start:start + count * EVENT.size]))
+    expected = {"tick": tick, "score": score, "lives": lives, "state": state}
+    return level, config, events, expected
+
+
+def run(data):
+    """Re-run a log headlessly at full speed, return (game, expected outcome)"""
+    # Imported here so parse() stays usable without the simulation modules
+    from .game import Game
+
+    level, config, events, expected = parse(data)
+    game = Game(config)
+    game.reset(level)
+    playing = config.STATE_PLAYING
+
+    for tick, code in events:
+        while game.tick < tick and game.state["current"] == playing:
+            game.step()
+        if code == EVENT_CONTINUE:
+            game.next_level()
+        else:
+            game.move_player(EVENT_NAMES[code])
+
+    while game.tick < expected["tick"] and game.state["current"] == playing:
+        game.step()
+    return game, expected
+
+
+def verify(data):
+    """Replay a log and check tick, score, lives and state against it"""
+    game, expected = run(data)
+    actual = {"tick": game.tick, "score": game.state["score"],
+              "lives": game.state["lives"], "state": game.state["current"]}
+    return actual == expected, expected, actual
+
+
+def main(paths):
+    failures = 0
+    for path in paths:
+        with open(path, "rb") as f:
+            data = f.read()
+        start = time.perf_counter()
+        ok, expected, actual = verify(data)
+        elapsed = (time.perf_counter() - start) * 1000
+        status = "ok" if ok else f"MISMATCH expected {expected}, got {actual}"
+        print(f"{path}: {status} ({expected['tick']} ticks in {elapsed:.1f} ms)")
+        failures += not ok
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,151 @@
+# game/sim_thread.py
+# Simulation on a thread of its own, publishing immutable frame snapshots
+# that the render loop draws from (see game/snapshot_view.py).
+import threading
+from collections import deque
+from time import perf_counter
+from types import MappingProxyType
+
+# Tick times kept for timing statistics
+TICK_HISTORY = 4096
+
+
+class FrameSnapshot:
+    """Immutable copy of everything a frame shows, taken after an update
+
+    state is a read-only view of a copy of Game.state. player is the
+    frog's (x, y) or None, homes are (x, y, filled) and obstacles are
+    (is_log, x, prev_x, y, width, height, speed) in draw order.
+    """
+
+    __slots__ = ("sequence", "time", "tick", "tick_ms", "interpolation", "running",
+                 "state", "player", "homes", "obstacles")
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrameSnapshot is immutable")
+
+
+def take_snapshot(game, sequence, time):
+    """FrameSnapshot of game as of perf_counter() time"""
+    state = game.state
+    rect = game.player.rect
+    return FrameSnapshot(
+        sequence, time, game.tick, game.tick_ms, game.interpolation,
+        state["current"] == game.config.STATE_PLAYING and not state["is_paused"],
+        MappingProxyType(dict(state)),
+        (rect.x, rect.y) if rect is not None else None,
+        tuple((home.x, home.y, home.filled) for home in game.level_manager.homes),
+        game.obstacle_manager.get_draw_state())
+
+
+class SimulationThread:
+    """Runs Game.update() at the tick rate on a thread of its own
+
+    After every update the thread publishes a FrameSnapshot in latest.
+    Snapshots are never changed once taken, so publishing is a single
+    reference assignment: the snapshot being built is the back buffer and
+    latest the front one. The render loop reads latest whenever it draws,
+    without locking or waiting for the simulation, and keeps a consistent
+    view of one update however long it takes to draw it.
+
+    While the thread runs it owns the game: anything else that changes it
+    must go through call(), and moves and pause through queue_input().
+    Both wake the thread, which otherwise sleeps until the next tick is
+    due, or indefinitely in menus and while paused.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.commands = deque()
+        # (snapshot sequence, perf_counter() timestamp) of applied moves,
+        # until a frame showing them is presented
+        self.moves = deque()
+        self.wake = threading.Event()
+        self.thread = None
+        self.running = False
+        self.sequence = 0
+        self.latest = take_snapshot(game, 0, perf_counter())
+        # perf_counter() of recent ticks, see tick_intervals()
+        self.tick_times = deque(maxlen=TICK_HISTORY)
+        # Called on this thread after publishing a snapshot of a game that
+        # is not running, or just stopped, when the render loop may be idle
+        self.notify = None
+
+    def start(self):
+        # Measure frame time from now on, on the perf_counter() clock
+        self.game.last_update = perf_counter() * 1000
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="simulation", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop the thread and wait for its last update to finish"""
+        self.running = False
+        self.wake.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def is_alive(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def call(self, function, *args):
+        """Run function(*args) on the simulation thread before its next update"""
+        self.commands.append((function, args))
+        self.wake.set()
+
+    def queue_input(self, action, timestamp):
+        """Queue a move or "pause" for the next update, see Game.queue_input()"""
+        self.game.queue_input(action, timestamp)
+        self.wake.set()
+
+    def run(self):
+        game = self.game
+        try:
+            while self.running:
+                if self.latest.running:
+                    # Sleep until the accumulator fills the next tick
+                    self.wake.wait(max(0.0, game.tick_ms - game.accumulator) / 1000)
+                else:
+                    self.wake.wait()
+                    # Time spent idle is not simulated
+                    game.last_update = perf_counter() * 1000
+                self.wake.clear()
+                while self.commands:
+                    function, args = self.commands.popleft()
+                    function(*args)
+                self.update(perf_counter())
+        finally:
+            self.running = False
+
+    def update(self, now):
+        """Update the game to perf_counter() time now and publish a snapshot"""
+        game = self.game
+        tick = game.tick
+        game.update(now * 1000)
+        # Ticks caught up on in one update all happen now
+        self.tick_times.extend([now] * (game.tick - tick))
+        self.sequence += 1
+        applied = game.input_queue.applied
+        if applied:
+            self.moves.extend((self.sequence, timestamp) for timestamp in applied)
+            applied.clear()
+        previous = self.latest
+        self.latest = take_snapshot(game, self.sequence, now)
+        if self.notify is not None and not (previous.running and self.latest.running):
+            self.notify()
+
+    def presented(self, snapshot, now, profiler):
+        """Record input-to-display latency of the moves shown by a presented snapshot"""
+        moves = self.moves
+        while moves and moves[0][0] <= snapshot.sequence:
+            profiler.record_latency(now - moves.popleft()[1])
+
+    def tick_intervals(self):
+        """Milliseconds between consecutive recent ticks"""
+        times = list(self.tick_times)
+        return [(b - a) * 1000 for a, b in zip(times, times[1:])]
@@ -0,0 +1,74 @@
+# game/snapshot.py
+# Fixed-layout binary snapshots of the full simulation state of a Game.
+import struct
+
+MAGIC = b"FRGS"
+VERSION = 1
+
+# magic, version, tick, level, lives, score, current state, paused,
+# player x/y, game speed, accumulator, home count, home flags bitmask,
+# obstacle count
+HEADER = struct.Struct("<4sBIHhiBBhhHdBQI")
+
+
+def snapshot(game):
+    """Pack the simulation state of game into a small bytes buffer
+
+    The layout is a fixed header followed by one int32 x per obstacle
+    (cars, then logs). Obstacle kinds, lanes and speeds are not stored: they
+    follow from the level, which is regenerated on restore if needed.
+    """
+    state = game.state
+    homes = game.level_manager.homes
+    if len(homes) > 64:
+        raise ValueError("snapshots support at most 64 homes")
+    home_bits = 0
+    for i, home in enumerate(homes):
+        if home.filled:
+            home_bits |= 1 << i
+
+    positions = game.obstacle_manager.get_positions()
+    header = HEADER.pack(
+        MAGIC, VERSION, game.tick, state["level"], state["lives"], state["score"],
+        state["current"], state["is_paused"],
+        game.player.position["x"], game.player.position["y"],
+        game.game_speed, game.accumulator, len(homes), home_bits, len(positions)
+    )
+    return header + positions.tobytes()
+
+
+def restore(game, data):
+    """Restore game to the state packed by snapshot()"""
+    (magic, version, tick, level, lives, score, current, paused, player_x, player_y,
+     game_speed, accumulator, home_count, home_bits, obstacle_count) = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a Frogger snapshot of a supported version")
+    manager = game.obstacle_manager
+    if level != game.state["level"] or obstacle_count != len(manager.get_positions()):
+        game.level_manager.generate_level(level, manager)
+    # Checked after regenerating, which rebuilds the homes of the level
+    homes = game.level_manager.homes
+    if home_count != len(homes):
+        raise ValueError(f"snapshot has {home_count} homes, game has {len(homes)}")
+    positions = memoryview(data)[HEADER.size:].cast("i")
+    if len(positions) != obstacle_count:
+        raise ValueError("snapshot obstacle data does not match its header")
+    manager.set_positions(positions)
+
+    state = game.state
+    state["level"] = level
+    state["lives"] = lives
+    state["score"] = score
+    state["current"] = current
+    state["is_paused"] = bool(paused)
+    game.tick = tick
+    game.game_speed = game_speed
+    game.accumulator = accumulator
+    game.interpolation = 1.0
+
+    for i, home in enumerate(homes):
+        home.filled = bool(home_bits >> i & 1)
+
+    game.player.position["x"] = player_x
+    game.player.position["y"] = player_y
+    game.player.update_rect()
@@ -0,0 +1,134 @@
+# game/snapshot_view.py
+# Read-only stand-in for a Game, filled from the FrameSnapshots a
+# SimulationThread publishes, for the renderers and the UI to draw.
+from time import perf_counter
+from .game import Game, GameInfo
+from .levels import Home, LevelManager
+from .player import Player
+from .rect import Rect
+
+
+def render_x(obstacle, alpha):
+    """Obstacle x blended between the previous and current tick, see Obstacle.render_x()"""
+    _, x, prev_x, _, _, _, speed = obstacle
+    if alpha >= 1.0 or abs(x - prev_x) > speed:
+        # Wrapped around the screen edge, don't sweep across it
+        return x
+    return round(prev_x + (x - prev_x) * alpha)
+
+
+class SnapshotObstacles:
+    """The obstacles of a snapshot, drawn like an obstacle manager draws its own"""
+
+    def __init__(self, config):
+        self.config = config
+        self.obstacles = ()
+        self.sprites = None
+
+    def get_sprites(self):
+        """Return the pre-rendered (car, log) surfaces"""
+        if self.sprites is None:
+            from .sprites import obstacle_sprite
+            config = self.config
+            self.sprites = (
+                obstacle_sprite(config.CAR_WIDTH, config.CAR_HEIGHT, config.COLORS["CAR_RED"]),
+                obstacle_sprite(config.LOG_WIDTH, config.LOG_HEIGHT, config.COLORS["LOG_BROWN"]))
+        return self.sprites
+
+    def draw(self, screen, alpha=1.0):
+        """Draw all obstacles with one batched blit"""
+        sprites = self.get_sprites()
+        screen.blits([(sprites[o[0]], (render_x(o, alpha), o[3])) for o in self.obstacles],
+                     False)
+
+    def draw_many(self, screen, indices, alpha=1.0):
+        """Draw the obstacles at the given draw order indices, in that order"""
+        sprites = self.get_sprites()
+        obstacles = self.obstacles
+        screen.blits([(sprites[obstacles[i][0]], (render_x(obstacles[i], alpha), obstacles[i][3]))
+                      for i in indices], False)
+
+    def draw_one(self, screen, index, alpha=1.0):
+        """Draw the obstacle at index in draw order"""
+        self.draw_many(screen, (index,), alpha)
+
+    def get_rects(self, alpha=1.0):
+        """Return obstacle rects in draw order"""
+        return [Rect(render_x(o, alpha), o[3], o[4], o[5]) for o in self.obstacles]
+
+
+class SnapshotHomes:
+    """The homes of a snapshot, drawn through LevelManager's home layer cache"""
+
+    get_home_layer = LevelManager.get_home_layer
+    draw_homes = LevelManager.draw_homes
+
+    def __init__(self, config):
+        self.config = config
+        self.homes = []
+        self.home_layer = None
+        self.home_layer_key = None
+
+    def load(self, homes):
+        """Take (x, y, filled) of every home from a snapshot"""
+        if [(home.x, home.y) for home in self.homes] != [(x, y) for x, y, _ in homes]:
+            self.homes = [Home(self.config, x, y) for x, y, _ in homes]
+        for home, (_, _, filled) in zip(self.homes, homes):
+            home.filled = filled
+
+
+class SnapshotView:
+    """What renderers and the UI see of a Game run by a SimulationThread
+
+    They read config, state, interpolation, player, obstacle_manager,
+    level_manager, profiler and get_game_state() of the game they draw.
+    load() sets the same names from the latest snapshot, so they run
+    unchanged on the render thread while the simulation thread changes
+    the real game. state is read-only; start_game() is forwarded.
+    """
+
+    get_game_state = Game.get_game_state
+
+    def __init__(self, game, simulation):
+        self.config = game.config
+        self.profiler = game.profiler
+        self.simulation = simulation
+        # Drawn in place of the game's own, from snapshot positions
+        self.player = Player(game.config)
+        self.obstacle_manager = SnapshotObstacles(game.config)
+        self.level_manager = SnapshotHomes(game.config)
+        self.info = GameInfo()
+        self.snapshot = None
+        self.state = None
+        self.interpolation = 1.0
+        self.load()
+
+    def load(self, now=None):
+        """Show the latest snapshot at perf_counter() time now, and return it"""
+        snapshot = self.simulation.latest
+        if snapshot is not self.snapshot:
+            self.snapshot = snapshot
+            self.state = snapshot.state
+            player = self.player
+            if snapshot.player is None:
+                player.rect = None
+            elif player.rect is None:
+                player.rect = Rect(*snapshot.player, player.size, player.size)
+            else:
+                player.rect.update(*snapshot.player, player.size, player.size)
+            self.obstacle_manager.obstacles = snapshot.obstacles
+            self.level_manager.load(snapshot.homes)
+
+        self.interpolation = snapshot.interpolation
+        if snapshot.running:
+            if now is None:
+                now = perf_counter()
+            # Keep blending towards the tick the simulation is working on
+            elapsed = (now - snapshot.time) * 1000
+            self.interpolation = min(1.0, snapshot.interpolation + elapsed / snapshot.tick_ms)
+        return snapshot
+
+    def start_game(self, player_name):
+        """Start a new game on the simulation thread"""
+        simulation = self.simulation
+        simulation.call(simulation.game.start_game, player_name)
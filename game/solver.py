@@ -0,0 +1,303 @@
+# game/solver.py
+# Time-expanded reachability solver for levels.
+#
+# Check the built-in levels: python -m game.solver 1 2
+import math
+import sys
+from .config import GameConfig
+from .obstacles import ObstacleManager
+from .levels import LevelManager
+from .player import Player
+from .board import board_key, get_board
+
+# Search budget of is_solvable() and the command line. On generated levels
+# the hazard period (the LCM of every row's period) quickly outgrows any
+# search, so an unsolvable level is rarely proved so and needs a bound
+DEFAULT_MAX_TICKS = 10000
+
+# Cached per level definition, see level_key()
+_models = {}
+_solutions = {}
+
+
+def level_key(config, manager, homes):
+    """Everything a level's hazard pattern and goals depend on"""
+    obstacles = tuple((o.is_log, o.lane, o.direction, o.speed, o.x, o.y, o.width, o.height)
+                      for o in manager.obstacles + manager.logs)
+    return (config.SCREEN_WIDTH, config.FROG_SIZE, board_key(config),
+            config.FROG_START["x"], config.FROG_START["y"], obstacles,
+            tuple(tuple(home.rect) for home in homes))
+
+
+class LevelModel:
+    """Per-row safety tables of a level as a function of the tick
+
+    Obstacles only overlap the rows their rects span, so every row's hazard
+    pattern depends only on its own obstacles. Their motion is periodic
+    after the first wrap (Obstacle.cycle()), so each row's pattern is
+    tabulated once, up to the point where it repeats.
+    Safety of a cell is probed with the real ObstacleManager and Player
+    rules, exactly like Game.check_collisions: in the river the frog must
+    be on a log (which may carry its rect), and cars kill.
+    """
+
+    def __init__(self, config, manager, homes):
+        self.config = config
+        board = get_board(config)
+        self.columns = board.columns
+        self.rows = board.rows
+        self.full = (1 << self.columns) - 1
+        self.start = (config.FROG_START["x"], config.FROG_START["y"])
+        self.homes = [home.rect.copy() for home in homes]
+        self.player = Player(config)
+        self._build_tables(manager)
+        self._build_goal_row()
+
+    def _row_obstacles(self, manager):
+        """Indices of obstacles whose rect overlaps each row"""
+        cell_size = self.config.CELL_SIZE
+        rows = [[] for _ in range(self.rows)]
+        for i, obstacle in enumerate(manager.obstacles + manager.logs):
+            first = max(0, obstacle.y // cell_size)
+            last = min(self.rows - 1, (obstacle.y + obstacle.height - 1) // cell_size)
+            for row in range(first, last + 1):
+                rows[row].append(i)
+        return rows
+
+    def _probe(self, manager, x, y):
+        """True if the frog survives check_collisions on cell (x, y)"""
+        player = self.player
+        player.position = {"x": x, "y": y}
+        player.update_rect()
+        if player.is_in_river() and not manager.is_on_log(player.rect):
+            return False
+        return not manager.is_hit_by_car(player.rect)
+
+    def _row_mask(self, manager, y):
+        mask = 0
+        for x in range(self.columns):
+            if self._probe(manager, x, y):
+                mask |= 1 << x
+        return mask
+
+    def _build_tables(self, manager):
+        """Tabulate every row's safe cells over its preperiod and period"""
+        obstacles = manager.obstacles + manager.logs
+        self.masks = [[] for _ in range(self.rows)]
+        self.preperiod = [0] * self.rows
+        self.period = [1] * self.rows
+        for y, indices in enumerate(self._row_obstacles(manager)):
+            for i in indices:
+                first, period = obstacles[i].cycle()
+                self.preperiod[y] = max(self.preperiod[y], first)
+                self.period[y] = self.period[y] * period // math.gcd(self.period[y], period)
+
+        lengths = [p + q for p, q in zip(self.preperiod, self.period)]
+        manager.seek(0)
+        for t in range(max(lengths)):
+            for y in range(self.rows):
+                if t < lengths[y]:
+                    self.masks[y].append(self._row_mask(manager, y))
+            manager.update()
+
+        self.hazard_preperiod = max(self.preperiod)
+        self.hazard_period = 1
+        for period in self.period:
+            self.hazard_period = self.hazard_period * period // math.gcd(self.hazard_period, period)
+
+    def _build_goal_row(self):
+        """For each column of the top row, the homes it reaches, in order"""
+        self.column_homes = []
+        player = self.player
+        for x in range(self.columns):
+            player.position = {"x": x, "y": 0}
+            player.update_rect()
+            self.column_homes.append([i for i, home in enumerate(self.homes)
+                                      if home.colliderect(player.rect)])
+
+    def mask(self, y, t):
+        """Bitmask of safe columns of row y at tick t"""
+        masks = self.masks[y]
+        if t >= len(masks):
+            t = self.preperiod[y] + (t - self.preperiod[y]) % self.period[y]
+        return masks[t]
+
+    def canonical_tick(self, t):
+        """Smallest tick with the same hazard configuration as t"""
+        if t < self.hazard_preperiod:
+            return t
+        return self.hazard_preperiod + (t - self.hazard_preperiod) % self.hazard_period
+
+
+class LevelSolver:
+    """Finds the fastest route to every home, or proves there is none
+
+    The search runs over the time-expanded graph of (cell, tick). Between
+    two ticks the frog makes at most one move, as a bot calling
+    Game.move_player once per tick would. Because hazards are periodic,
+    the search stops when the reachable set repeats at the same phase,
+    which takes a full hazard period and may never come within max_ticks.
+    Results are cached per level definition.
+    """
+
+    def __init__(self, config=None, level=1, data=None):
+        self.config = config or GameConfig()
+        manager = ObstacleManager(self.config)
+        level_manager = LevelManager(self.config)
+        if data is None:
+            level_manager.generate_level(level, manager)
+        else:
+            # A level_loader.LevelData layout that is not in the catalog
+            level_manager.build_level(data, manager)
+        self.key = level_key(self.config, manager, level_manager.homes)
+
+        self.model = _models.get(self.key)
+        if self.model is None:
+            self.model = _models[self.key] = LevelModel(self.config, manager,
+                                                         level_manager.homes)
+
+    def solve(self, start_tick=0, filled=(), max_ticks=None):
+        """Fastest routes from the start cell at start_tick
+
+        filled lists indices of homes that are already taken. Returns
+        {home index: (arrival tick, moves)} for every reachable free home.
+        moves[i] is the input to give at tick start_tick + i (None = wait),
+        which is what scripted_policy() expects from tick 0. With max_ticks
+        the search gives up after that many ticks, so homes missing from
+        the result are only unreachable within the budget.
+        """
+        filled = frozenset(filled)
+        phase = self.model.canonical_tick(start_tick)
+        cache_key = (self.key, filled, phase, max_ticks)
+        routes = _solutions.get(cache_key)
+        if routes is None:
+            routes = _solutions[cache_key] = self._search(phase, filled, max_ticks)
+        shift = start_tick - phase
+        return {home: (tick + shift, moves) for home, (tick, moves) in routes.items()}
+
+    def is_solvable(self, max_ticks=DEFAULT_MAX_TICKS):
+        """True if every home can be reached from the start cell within max_ticks
+
+        Each home is searched for on its own, from tick 0 with every home
+        free. That is necessary for the level to be beaten, not sufficient:
+        a filled home may block the way to another, and later ticks meet
+        other hazard phases, so no order of filling the homes is checked.
+        solve() with filled and start_tick answers for one such state.
+        """
+        return len(self.solve(max_ticks=max_ticks)) == len(self.model.homes)
+
+    def _search(self, start_tick, filled, max_ticks):
+        model = self.model
+        rows = model.rows
+        full = model.full
+        start_x, start_y = model.start
+        wanted = set(range(len(model.homes))) - filled
+
+        reached = {}
+        current = [0] * rows
+        current[start_y] = 1 << start_x
+        history = [current]
+        checkpoint = None
+        base = max(start_tick, model.hazard_preperiod)
+
+        t = start_tick
+        end = None if max_ticks is None else start_tick + max_ticks
+        while wanted - set(reached) and t != end:
+            safe_now = [model.mask(y, t) for y in range(rows)]
+            safe_next = [model.mask(y, t + 1) for y in range(rows)]
+
+            # Moves into the top row: homes are goals, the rest resets the frog
+            reset = False
+            top = current[1] & safe_now[0] if rows > 1 else 0
+            for x in range(model.columns):
+                if top >> x & 1:
+                    free = [h for h in model.column_homes[x] if h not in filled]
+                    if free:
+                        if free[0] in wanted and free[0] not in reached:
+                            reached[free[0]] = (t, x)
+                    else:
+                        reset = True
+
+            following = [0] * rows
+            for y in range(1, rows):
+                cells = current[y]
+                moved = ((cells << 1) | (cells >> 1)) & full
+                if y + 1 < rows:
+                    moved |= current[y + 1]
+                if y > 1:
+                    moved |= current[y - 1]
+                following[y] = (cells | (moved & safe_now[y])) & safe_next[y]
+            if reset:
+                following[start_y] |= (1 << start_x) & safe_next[start_y]
+
+            current = following
+            history.append(current)
+            t += 1
+
+            if not any(current):
+                break
+            if t >= base and (t - base) % model.hazard_period == 0:
+                # Same phase as one period ago: nothing new can ever be reached
+                if current == checkpoint:
+                    break
+                checkpoint = current
+
+        return {home: (tick, self._route(history, start_tick, tick, x, filled))
+                for home, (tick, x) in reached.items()}
+
+    def _route(self, history, start_tick, arrival, x, filled):
+        """Walk the reachable sets back from the winning move at arrival"""
+        model = self.model
+        start_x, start_y = model.start
+        moves = ["up"]
+        cell = (x, 1)
+        for i in range(arrival - start_tick, 0, -1):
+            previous = history[i - 1]
+            t = start_tick + i - 1
+            cx, cy = cell
+            if previous[cy] >> cx & 1:
+                moves.append(None)
+                continue
+
+            step = None
+            if model.mask(cy, t) >> cx & 1:
+                for move, (nx, ny) in (("right", (cx - 1, cy)), ("left", (cx + 1, cy)),
+                                       ("down", (cx, cy - 1)), ("up", (cx, cy + 1))):
+                    if (0 <= nx < model.columns and 1 <= ny < model.rows and
+                            previous[ny] >> nx & 1):
+                        step = move, (nx, ny)
+                        break
+            if step is None and cell == (start_x, start_y):
+                # Reset to the start by jumping into a taken top-row cell
+                for nx in range(model.columns):
+                    if (previous[1] >> nx & 1 and model.mask(0, t) >> nx & 1 and
+                            not [h for h in model.column_homes[nx] if h not in filled]):
+                        step = "up", (nx, 1)
+                        break
+            moves.append(step[0])
+            cell = step[1]
+        moves.reverse()
+        return moves
+
+
+def is_level_solvable(level, config=None):
+    """Check that every home of a LevelManager level can be reached, see is_solvable()"""
+    return LevelSolver(config, level).is_solvable()
+
+
+def main(levels, max_ticks=DEFAULT_MAX_TICKS):
+    unsolvable = 0
+    for level in levels:
+        solver = LevelSolver(level=int(level))
+        routes = solver.solve(max_ticks=max_ticks)
+        for home in range(len(solver.model.homes)):
+            if home in routes:
+                print(f"level {level} home {home}: {routes[home][0]} ticks")
+            else:
+                print(f"level {level} home {home}: unreachable within {max_ticks} ticks")
+        unsolvable += len(routes) < len(solver.model.homes)
+    return 1 if unsolvable else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:] or ["1"]))
@@ -0,0 +1,94 @@
+# game/sprites.py
+# Rendering of the obstacle, home and frog sprites. The simulation modules
+# import this lazily, the first time a sprite is missing from their caches.
+import pygame
+from .levels import HOME_MARGIN
+from .player import FROG_MARGIN
+
+# Pre-rendered obstacle surfaces, see obstacle_sprite()
+_obstacle_sprites = {}
+
+
+def _converted(surface, alpha):
+    """Return surface in the display's pixel format, once a display exists"""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+def obstacle_sprite(width, height, color):
+    """Return the surface obstacles of this size and color are blitted from"""
+    key = (width, height, tuple(color))
+    sprite = _obstacle_sprites.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((width, height))
+        rect = sprite.get_rect()
+        pygame.draw.rect(sprite, color, rect)
+        # Rounded corners
+        pygame.draw.rect(sprite, color, rect, border_radius=5)
+        sprite = _obstacle_sprites[key] = _converted(sprite, False)
+    return sprite
+
+
+def render_home(config, filled):
+    """Render an empty or filled home once into a transparent surface"""
+    width = config.HOME_WIDTH
+    height = config.HOME_HEIGHT
+    x = y = HOME_MARGIN
+    surface = pygame.Surface((width + 2 * HOME_MARGIN, height + 2 * HOME_MARGIN),
+                             pygame.SRCALPHA)
+    home_rect = pygame.Rect(x, y, width, height)
+
+    # Draw home area
+    pygame.draw.rect(surface, config.COLORS["GOAL_GREEN"], home_rect)
+
+    # Draw border
+    pygame.draw.rect(surface, config.COLORS["BLACK"], home_rect, 2)
+
+    # Draw dashed border
+    dash_length = 5
+    for i in range(0, width, dash_length * 2):
+        pygame.draw.line(surface, config.COLORS["BLACK"],
+                         (x + i, y), (x + i + dash_length, y), 2)
+        pygame.draw.line(surface, config.COLORS["BLACK"],
+                         (x + i, y + height), (x + i + dash_length, y + height), 2)
+
+    for i in range(0, height, dash_length * 2):
+        pygame.draw.line(surface, config.COLORS["BLACK"],
+                         (x, y + i), (x, y + i + dash_length), 2)
+        pygame.draw.line(surface, config.COLORS["BLACK"],
+                         (x + width, y + i), (x + width, y + i + dash_length), 2)
+
+    # Draw frog if home is filled
+    if filled:
+        pygame.draw.circle(
+            surface,
+            config.COLORS["RED"],
+            home_rect.center,
+            config.FROG_SIZE // 2
+        )
+
+    return _converted(surface, True)
+
+
+def render_home_layer(config, homes):
+    """Render every home into one transparent surface the size of the playfield"""
+    bottom = max((home.y + home.height for home in homes), default=0)
+    layer = pygame.Surface((config.SCREEN_WIDTH, bottom + HOME_MARGIN), pygame.SRCALPHA)
+    for home in homes:
+        home.draw(layer)
+    return _converted(layer, True)
+
+
+def render_frog(config, color):
+    """Render the frog once into a transparent surface"""
+    size = config.FROG_SIZE
+    surface = pygame.Surface((size + 2 * FROG_MARGIN, size + 2 * FROG_MARGIN),
+                             pygame.SRCALPHA)
+    # Where rect.center falls on the sprite
+    center = (FROG_MARGIN + size // 2, FROG_MARGIN + size // 2)
+    pygame.draw.circle(surface, color, center, size // 2)
+    # Draw border
+    pygame.draw.circle(surface, config.COLORS["BLACK"], center, size // 2, 2)
+
+    return _converted(surface, True)
@@ -1,6 +1,8 @@
 # game/ui.py
 import pygame
+from collections import OrderedDict
 from .config import GameConfig
+from .board import board_key, get_board
 
 
 class UI:
@@ -11,10 +13,54 @@ class UI:
         self.clock = None
         self.fonts = {}
 
+        # LRU cache of rendered text surfaces, see render_text()
+        self.text_cache = OrderedDict()
+        self.text_cache_size = self.config.TEXT_CACHE_SIZE
+        self.text_cache_hits = 0
+        self.text_cache_misses = 0
+
+        # Composed overlay currently on screen, see draw_overlay()
+        self.overlay = None
+        self.overlay_key = None
+        self.overlay_result = None
+        self.overlay_builds = 0
+
+        # Pre-rendered static playfield, see get_background()
+        self.background = None
+        self.background_key = None
+
         # UI elements
         self.text_input = ""
         self.active_input = True
 
+        # Hit boxes shared by drawing and click handling, see build_buttons()
+        self.input_rect = None
+        self.buttons = {}
+        self.build_buttons()
+
+    def build_buttons(self):
+        """Compute the name input and button rects once for the screen size
+
+        buttons maps a game state to its (action, rect) pairs; main.py
+        dispatches the action of a clicked rect.
+        """
+        config = self.config
+        center = config.SCREEN_WIDTH // 2
+        self.input_rect = pygame.Rect(center - 125, 200, 250, 40)
+        self.buttons = {
+            config.STATE_START: (("start", pygame.Rect(center - 100, 280, 200, 50)),),
+            config.STATE_GAME_OVER: (("restart", pygame.Rect(center - 220, 350, 200, 50)),
+                                     ("menu", pygame.Rect(center + 20, 350, 200, 50))),
+            config.STATE_LEVEL_COMPLETE: (("continue", pygame.Rect(center - 100, 350, 200, 50)),)
+        }
+
+    def button_at(self, state, position):
+        """Action of the button of state under position, or None"""
+        for action, rect in self.buttons.get(state, ()):
+            if rect.collidepoint(position):
+                return action
+        return None
+
     def initialize(self, screen, clock):
         """Initialize UI with screen and clock"""
         self.screen = screen
@@ -23,6 +69,8 @@ class UI:
 
     def load_fonts(self):
         """Load game fonts"""
+        # Surfaces rendered with the old fonts are stale now
+        self.text_cache.clear()
         try:
             self.fonts["large"] = pygame.font.Font(None, 74)
             self.fonts["medium"] = pygame.font.Font(None, 48)
@@ -35,49 +83,81 @@ class UI:
             self.fonts["small"] = pygame.font.Font(None, 36)
             self.fonts["tiny"] = pygame.font.Font(None, 24)
 
-    def draw_background(self):
-        """Draw game background areas"""
+    def render_text(self, font_name, text, antialias, color):
+        """Render text with a named font, reusing cached surfaces"""
+        key = (font_name, text, antialias, color)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+            self.text_cache_hits += 1
+            return surface
+
+        self.text_cache_misses += 1
+        surface = self.fonts[font_name].render(text, antialias, color)
+        self.text_cache[key] = surface
+        if len(self.text_cache) > self.text_cache_size:
+            self.text_cache.popitem(last=False)
+        return surface
+
+    def text_cache_info(self):
+        """Return text cache statistics"""
+        return {
+            "hits": self.text_cache_hits,
+            "misses": self.text_cache_misses,
+            "size": len(self.text_cache),
+            "max_size": self.text_cache_size
+        }
+
+    def background_cache_key(self):
+        """Everything the static playfield pixels depend on"""
+        config = self.config
+        return (config.SCREEN_WIDTH, config.SCREEN_HEIGHT, board_key(config),
+                tuple(sorted(config.COLORS.items())))
+
+    def render_background(self):
+        """Render the static playfield once into an off-screen surface"""
+        surface = pygame.Surface((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
+        surface.fill(self.config.COLORS["BLACK"])
         colors = self.config.COLORS
 
-        # Goal area (top)
-        pygame.draw.rect(
-            self.screen,
-            colors["GOAL_GREEN"],
-            (0, 0, self.config.SCREEN_WIDTH, 60)
-        )
-
-        # River area
-        pygame.draw.rect(
-            self.screen,
-            colors["RIVER_BLUE"],
-            (0, 60, self.config.SCREEN_WIDTH, 180)
-        )
-
-        # Road area
-        pygame.draw.rect(
-            self.screen,
-            colors["ROAD_GRAY"],
-            (0, 240, self.config.SCREEN_WIDTH, 240)
-        )
+        board = get_board(self.config)
+        cell_size = board.cell_size
 
-        # Safe area (bottom)
-        pygame.draw.rect(
-            self.screen,
-            colors["GREEN"],
-            (0, 480, self.config.SCREEN_WIDTH, 60)
-        )
+        # Lane bands colored by kind: goal, river, road, safe
+        for i, color in enumerate(board.lane_colors(colors)):
+            pygame.draw.rect(
+                surface,
+                color,
+                (0, i * cell_size, self.config.SCREEN_WIDTH, cell_size)
+            )
 
         # Lane lines
-        for i in range(self.config.LANES):
-            y = i * self.config.CELL_SIZE
+        for i in range(board.rows):
+            y = i * cell_size
             pygame.draw.line(
-                self.screen,
+                surface,
                 colors["BLACK"],
                 (0, y),
                 (self.config.SCREEN_WIDTH, y),
                 1
             )
 
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def get_background(self):
+        """Return the cached playfield, rebuilding it if the config changed"""
+        key = self.background_cache_key()
+        if key != self.background_key:
+            self.background = self.render_background()
+            self.background_key = key
+        return self.background
+
+    def draw_background(self):
+        """Draw game background areas"""
+        self.screen.blit(self.get_background(), (0, 0))
+
     def draw_game_info(self, game_state):
         """Draw game information (score, lives, etc.)"""
         # Draw background for info panel
@@ -90,14 +170,14 @@ class UI:
         # Draw info text
         info_y = self.config.SCREEN_HEIGHT + 10
         info_texts = [
-            f"Player: {game_state['player_name']}",
-            f"Level: {game_state['level']}",
-            f"Lives: {game_state['lives']}",
-            f"Score: {game_state['score']}"
+            f"Player: {game_state.player_name}",
+            f"Level: {game_state.level}",
+            f"Lives: {game_state.lives}",
+            f"Score: {game_state.score}"
         ]
 
         for i, text in enumerate(info_texts):
-            text_surface = self.fonts["tiny"].render(text, True, self.config.COLORS["WHITE"])
+            text_surface = self.render_text("tiny", text, True, self.config.COLORS["WHITE"])
             self.screen.blit(text_surface, (10 + i * 140, info_y))
 
     def draw_start_screen(self):
@@ -105,28 +185,23 @@ class UI:
         self.screen.fill(self.config.COLORS["DARK_GREEN"])
 
         # Title
-        title = self.fonts["large"].render("FROGGER", True, self.config.COLORS["GOLD"])
+        title = self.render_text("large", "FROGGER", True, self.config.COLORS["GOLD"])
         title_rect = title.get_rect(center=(self.config.SCREEN_WIDTH // 2, 100))
         self.screen.blit(title, title_rect)
 
         # Input field
-        input_bg = pygame.Rect(
-            self.config.SCREEN_WIDTH // 2 - 125,
-            200,
-            250,
-            40
-        )
+        input_bg = self.input_rect
         pygame.draw.rect(self.screen, self.config.COLORS["WHITE"], input_bg)
         pygame.draw.rect(self.screen, self.config.COLORS["BLACK"], input_bg, 2)
 
         # Input text
         input_text = self.text_input if self.text_input else "Enter your name"
         text_color = self.config.COLORS["BLACK"] if self.text_input else self.config.COLORS["GRAY"]
-        text_surface = self.fonts["small"].render(input_text, True, text_color)
+        text_surface = self.render_text("small", input_text, True, text_color)
         self.screen.blit(text_surface, (input_bg.x + 10, input_bg.y + 8))
 
         # Cursor
-        if self.active_input:
+        if self.cursor_visible():
             cursor_pos = text_surface.get_width() + input_bg.x + 10
             pygame.draw.line(
                 self.screen,
@@ -137,16 +212,11 @@ class UI:
             )
 
         # Start button
-        start_button = pygame.Rect(
-            self.config.SCREEN_WIDTH // 2 - 100,
-            280,
-            200,
-            50
-        )
+        start_button = self.buttons[self.config.STATE_START][0][1]
         pygame.draw.rect(self.screen, self.config.COLORS["FROG_GREEN"], start_button, border_radius=10)
         pygame.draw.rect(self.screen, self.config.COLORS["BLACK"], start_button, 2, border_radius=10)
 
-        start_text = self.fonts["medium"].render("START GAME", True, self.config.COLORS["WHITE"])
+        start_text = self.render_text("medium", "START GAME", True, self.config.COLORS["WHITE"])
         start_rect = start_text.get_rect(center=start_button.center)
         self.screen.blit(start_text, start_rect)
 
@@ -158,105 +228,139 @@ class UI:
         ]
 
         for i, control in enumerate(controls):
-            control_text = self.fonts["tiny"].render(control, True, self.config.COLORS["WHITE"])
+            control_text = self.render_text("tiny", control, True, self.config.COLORS["WHITE"])
             control_rect = control_text.get_rect(center=(self.config.SCREEN_WIDTH // 2, 380 + i * 30))
             self.screen.blit(control_text, control_rect)
 
         return start_button
 
+    def cursor_visible(self, now=None):
+        """Whether the name input cursor shows at pygame.time.get_ticks() time now"""
+        if not self.active_input:
+            return False
+        blink = self.config.CURSOR_BLINK_MS
+        if not blink:
+            return True
+        if now is None:
+            now = pygame.time.get_ticks()
+        return now // blink % 2 == 0
+
+    def next_animation_ms(self, now):
+        """Milliseconds until the screen changes by itself, None if it doesn't"""
+        blink = self.config.CURSOR_BLINK_MS
+        if self.game.state["current"] == self.config.STATE_START and self.active_input and blink:
+            return blink - now % blink
+        return None
+
+    def new_overlay(self, alpha):
+        """Create a full-size semi-transparent overlay (premultiplied alpha)"""
+        overlay = pygame.Surface((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT),
+                                 pygame.SRCALPHA)
+        color = tuple(c * alpha // 255 for c in self.config.COLORS["BLACK"])
+        overlay.fill(color + (alpha,))
+        return overlay
+
+    def draw_overlay(self, key, build):
+        """Blit the overlay for key, composing it with build() only on change
+
+        The composed surface (dimmed background, text and buttons) is kept
+        until a different overlay or a different score is shown, so no
+        surfaces are allocated while an overlay stays on screen.
+        """
+        if key != self.overlay_key:
+            self.overlay, self.overlay_result = build()
+            self.overlay_key = key
+            self.overlay_builds += 1
+        self.screen.blit(self.overlay, (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+        return self.overlay_result
+
     def draw_game_over_screen(self, game_state):
         """Draw game over screen"""
+        return self.draw_overlay(
+            (self.config.STATE_GAME_OVER, game_state.score),
+            lambda: self.build_game_over_overlay(game_state.score)
+        )
+
+    def build_game_over_overlay(self, score):
+        """Compose the game over overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(self.config.COLORS["BLACK"])
-        self.screen.blit(overlay, (0, 0))
+        overlay = self.new_overlay(200)
 
         # Game Over text
-        game_over = self.fonts["large"].render("GAME OVER", True, self.config.COLORS["RED"])
+        game_over = self.render_text("large", "GAME OVER", True, self.config.COLORS["RED"])
         game_over_rect = game_over.get_rect(center=(self.config.SCREEN_WIDTH // 2, 150))
-        self.screen.blit(game_over, game_over_rect)
+        overlay.blit(game_over, game_over_rect)
 
         # Score
-        score_text = self.fonts["medium"].render(
-            f"Your score: {game_state['score']}",
+        score_text = self.render_text(
+            "medium",
+            f"Your score: {score}",
             True,
             self.config.COLORS["WHITE"]
         )
         score_rect = score_text.get_rect(center=(self.config.SCREEN_WIDTH // 2, 250))
-        self.screen.blit(score_text, score_rect)
+        overlay.blit(score_text, score_rect)
 
         # Buttons
-        restart_button = pygame.Rect(
-            self.config.SCREEN_WIDTH // 2 - 220,
-            350,
-            200,
-            50
-        )
-        menu_button = pygame.Rect(
-            self.config.SCREEN_WIDTH // 2 + 20,
-            350,
-            200,
-            50
-        )
+        (_, restart_button), (_, menu_button) = self.buttons[self.config.STATE_GAME_OVER]
 
         # Draw buttons
         for button, text in [(restart_button, "PLAY AGAIN"), (menu_button, "MAIN MENU")]:
-            pygame.draw.rect(self.screen, self.config.COLORS["FROG_GREEN"], button, border_radius=10)
-            pygame.draw.rect(self.screen, self.config.COLORS["BLACK"], button, 2, border_radius=10)
+            pygame.draw.rect(overlay, self.config.COLORS["FROG_GREEN"], button, border_radius=10)
+            pygame.draw.rect(overlay, self.config.COLORS["BLACK"], button, 2, border_radius=10)
 
-            button_text = self.fonts["small"].render(text, True, self.config.COLORS["WHITE"])
+            button_text = self.render_text("small", text, True, self.config.COLORS["WHITE"])
             button_rect = button_text.get_rect(center=button.center)
-            self.screen.blit(button_text, button_rect)
+            overlay.blit(button_text, button_rect)
 
-        return restart_button, menu_button
+        return overlay, (restart_button, menu_button)
 
     def draw_level_complete_screen(self):
         """Draw level complete screen"""
+        return self.draw_overlay(self.config.STATE_LEVEL_COMPLETE,
+                                 self.build_level_complete_overlay)
+
+    def build_level_complete_overlay(self):
+        """Compose the level complete overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(self.config.COLORS["BLACK"])
-        self.screen.blit(overlay, (0, 0))
+        overlay = self.new_overlay(200)
 
         # Level Complete text
-        complete_text = self.fonts["large"].render("LEVEL COMPLETE!", True, self.config.COLORS["GOLD"])
+        complete_text = self.render_text("large", "LEVEL COMPLETE!", True, self.config.COLORS["GOLD"])
         complete_rect = complete_text.get_rect(center=(self.config.SCREEN_WIDTH // 2, 150))
-        self.screen.blit(complete_text, complete_rect)
+        overlay.blit(complete_text, complete_rect)
 
         # Message
-        message = self.fonts["medium"].render("You reached the next level!", True, self.config.COLORS["WHITE"])
+        message = self.render_text("medium", "You reached the next level!", True, self.config.COLORS["WHITE"])
         message_rect = message.get_rect(center=(self.config.SCREEN_WIDTH // 2, 250))
-        self.screen.blit(message, message_rect)
+        overlay.blit(message, message_rect)
 
         # Continue button
-        continue_button = pygame.Rect(
-            self.config.SCREEN_WIDTH // 2 - 100,
-            350,
-            200,
-            50
-        )
-        pygame.draw.rect(self.screen, self.config.COLORS["FROG_GREEN"], continue_button, border_radius=10)
-        pygame.draw.rect(self.screen, self.config.COLORS["BLACK"], continue_button, 2, border_radius=10)
+        continue_button = self.buttons[self.config.STATE_LEVEL_COMPLETE][0][1]
+        pygame.draw.rect(overlay, self.config.COLORS["FROG_GREEN"], continue_button, border_radius=10)
+        pygame.draw.rect(overlay, self.config.COLORS["BLACK"], continue_button, 2, border_radius=10)
 
-        continue_text = self.fonts["medium"].render("CONTINUE", True, self.config.COLORS["WHITE"])
+        continue_text = self.render_text("medium", "CONTINUE", True, self.config.COLORS["WHITE"])
         continue_rect = continue_text.get_rect(center=continue_button.center)
-        self.screen.blit(continue_text, continue_rect)
+        overlay.blit(continue_text, continue_rect)
 
-        return continue_button
+        return overlay, continue_button
 
     def draw_pause_screen(self):
         """Draw pause screen"""
+        self.draw_overlay("paused", self.build_pause_overlay)
+
+    def build_pause_overlay(self):
+        """Compose the pause overlay"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.config.SCREEN_WIDTH, self.config.SCREEN_HEIGHT))
-        overlay.set_alpha(150)
-        overlay.fill(self.config.COLORS["BLACK"])
-        self.screen.blit(overlay, (0, 0))
+        overlay = self.new_overlay(150)
 
         # Pause text
-        pause_text = self.fonts["large"].render("PAUSED", True, self.config.COLORS["YELLOW"])
+        pause_text = self.render_text("large", "PAUSED", True, self.config.COLORS["YELLOW"])
         pause_rect = pause_text.get_rect(center=(self.config.SCREEN_WIDTH // 2, self.config.SCREEN_HEIGHT // 2))
-        self.screen.blit(pause_text, pause_rect)
+        overlay.blit(pause_text, pause_rect)
+
+        return overlay, None
 
     def handle_events(self, event):
         """Handle UI events"""
@@ -272,16 +376,8 @@ class UI:
                     self.text_input += event.unicode
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
-
             if self.game.state["current"] == self.config.STATE_START:
                 # Check if clicking on input field
-                input_rect = pygame.Rect(
-                    self.config.SCREEN_WIDTH // 2 - 125,
-                    200,
-                    250,
-                    40
-                )
-                self.active_input = input_rect.collidepoint(mouse_pos)
+                self.active_input = self.input_rect.collidepoint(event.pos)
 
         return False
\ No newline at end of file
@@ -0,0 +1,219 @@
+# game/vector_env.py
+import numpy as np
+from .config import GameConfig
+from .obstacles import ObstacleManager
+from .levels import LevelManager
+from .board import get_board
+
+# Action codes accepted by VectorGame.step
+ACTIONS = (None, "up", "down", "left", "right")
+NOOP, UP, DOWN, LEFT, RIGHT = range(5)
+
+
+class VectorGame:
+    """N independent games stepped in lockstep with batched NumPy arrays
+
+    Every game plays the same level layout. step(actions) applies one action
+    per game (0 = no move, 1-4 = up/down/left/right, see ACTIONS), then runs
+    one simulation tick. This is the same as calling Game.move_player and
+    then Game.step on each game, as HeadlessRunner does. Games that reach
+    game over or level complete are done and stay frozen until reset().
+    """
+
+    def __init__(self, num_games, level=1, config=None):
+        self.config = config or GameConfig()
+        self.num_games = num_games
+        self.level = level
+        self._load_layout(level)
+        self.reset()
+
+    def _load_layout(self, level):
+        """Extract the level's obstacle and home columns from the scalar classes"""
+        config = self.config
+        board = get_board(config)
+        self.rows = board.rows
+        self.columns = board.columns
+        # Row lookups of Board, indexed by player_y
+        self.river_rows = np.frombuffer(board.is_river, dtype=np.uint8).astype(bool)
+        self.goal_rows = np.frombuffer(board.is_goal, dtype=np.uint8).astype(bool)
+
+        manager = ObstacleManager(config)
+        level_manager = LevelManager(config)
+        level_manager.generate_level(level, manager)
+
+        # Cars first, then logs: the same order the scalar manager scans
+        obstacles = manager.obstacles + manager.logs
+        self.num_cars = len(manager.obstacles)
+        self.start_x = np.array([o.x for o in obstacles], dtype=np.int64)
+        self.obstacle_y = np.array([o.y for o in obstacles], dtype=np.int64)
+        self.obstacle_width = np.array([o.width for o in obstacles], dtype=np.int64)
+        self.obstacle_height = np.array([o.height for o in obstacles], dtype=np.int64)
+        self.speed = np.array([o.speed for o in obstacles], dtype=np.int64)
+        self.direction = np.array([o.direction for o in obstacles], dtype=bool)
+        self.velocity = np.where(self.direction, self.speed, -self.speed)
+        self.is_log = np.arange(len(obstacles)) >= self.num_cars
+
+        homes = level_manager.homes
+        self.home_x = np.array([h.rect.x for h in homes], dtype=np.int64)
+        self.home_y = np.array([h.rect.y for h in homes], dtype=np.int64)
+        self.home_width = np.array([h.rect.width for h in homes], dtype=np.int64)
+        self.home_height = np.array([h.rect.height for h in homes], dtype=np.int64)
+
+        self.game_speed = level_manager.get_tick_ms(level)
+        self.is_last_level = level_manager.is_last_level(level)
+
+    def reset(self, mask=None):
+        """Restart the games selected by mask (all games by default)"""
+        n = self.num_games
+        config = self.config
+        if mask is None:
+            mask = np.ones(n, dtype=bool)
+            self.x = np.empty((n, len(self.start_x)), dtype=np.int64)
+            self.px = np.empty(n, dtype=np.int64)
+            self.py = np.empty(n, dtype=np.int64)
+            self.lives = np.empty(n, dtype=np.int64)
+            self.score = np.empty(n, dtype=np.int64)
+            self.state = np.empty(n, dtype=np.int64)
+            self.tick = np.empty(n, dtype=np.int64)
+            self.homes = np.empty((n, len(self.home_x)), dtype=bool)
+
+        self.x[mask] = self.start_x
+        self.px[mask] = config.FROG_START["x"]
+        self.py[mask] = config.FROG_START["y"]
+        self.lives[mask] = config.INITIAL_LIVES
+        self.score[mask] = 0
+        self.state[mask] = config.STATE_PLAYING
+        self.tick[mask] = 0
+        self.homes[mask] = False
+        return self.observe()
+
+    def observe(self):
+        """Return the batched observation arrays (views, not copies)"""
+        return {
+            "player_x": self.px,
+            "player_y": self.py,
+            "lives": self.lives,
+            "score": self.score,
+            "state": self.state,
+            "homes": self.homes,
+            "obstacle_x": self.x
+        }
+
+    def done(self):
+        """Games that have left the playing state"""
+        return self.state != self.config.STATE_PLAYING
+
+    def step(self, actions):
+        """Apply one action per game and run one tick
+
+        Returns (observation, rewards, dones) where rewards is the score
+        gained during this step.
+        """
+        actions = np.asarray(actions)
+        score_before = self.score.copy()
+
+        moved = self._move_players(actions)
+        self._check_collisions(moved)
+
+        playing = ~self.done()
+        self.tick[playing] += 1
+        self._update_obstacles(playing)
+        self._check_collisions(playing)
+
+        return self.observe(), self.score - score_before, self.done()
+
+    def _move_players(self, actions):
+        """Player.move for every playing game, returns games that moved"""
+        playing = ~self.done()
+        px, py = self.px, self.py
+        up = playing & (actions == UP) & (py > 0)
+        down = playing & (actions == DOWN) & (py < self.rows - 1)
+        left = playing & (actions == LEFT) & (px > 0)
+        right = playing & (actions == RIGHT) & (px < self.columns - 1)
+        py -= up
+        py += down
+        px -= left
+        px += right
+        return up | down | left | right
+
+    def _update_obstacles(self, mask):
+        """Obstacle.update for every obstacle of the games in mask"""
+        x = self.x[mask]
+        x += self.velocity
+        width = self.config.SCREEN_WIDTH
+        x = np.where(self.direction & (x > width), -self.obstacle_width, x)
+        x = np.where(~self.direction & (x < -self.obstacle_width), width, x)
+        self.x[mask] = x
+
+    def _overlaps(self, rect_x, rect_y, size, columns):
+        """colliderect of each game's player rect against obstacle columns"""
+        x = self.x[:, columns]
+        y = self.obstacle_y[columns]
+        return ((x < rect_x[:, None] + size) &
+                (x + self.obstacle_width[columns] > rect_x[:, None]) &
+                (y < rect_y[:, None] + size) &
+                (y + self.obstacle_height[columns] > rect_y[:, None]))
+
+    def _reset_players(self, mask):
+        self.px[mask] = self.config.FROG_START["x"]
+        self.py[mask] = self.config.FROG_START["y"]
+
+    def _lose_life(self, mask):
+        """Game.lose_life for the games in mask"""
+        self.lives[mask] -= 1
+        self._reset_players(mask)
+        self.state[mask & (self.lives <= 0)] = self.config.STATE_GAME_OVER
+
+    def _check_collisions(self, mask):
+        """Game.check_collisions for the games in mask"""
+        if not mask.any():
+            return
+        config = self.config
+        cell_size = config.CELL_SIZE
+        size = config.FROG_SIZE
+        offset = (cell_size - size) // 2
+        rect_x = self.px * cell_size + offset
+        rect_y = self.py * cell_size + offset
+
+        # River: must be on a log, the first matching log carries the rect
+        logs = np.flatnonzero(self.is_log)
+        in_river = mask & self.river_rows[self.py]
+        on_logs = self._overlaps(rect_x, rect_y, size, logs)
+        on_log = on_logs.any(axis=1)
+        drowned = in_river & ~on_log
+        self._lose_life(drowned)
+        active = mask & ~drowned
+        if len(logs):
+            first_log = logs[on_logs.argmax(axis=1)]
+            carried = in_river & on_log
+            rect_x = np.where(carried, rect_x + self.velocity[first_log], rect_x)
+
+        # Cars
+        cars = np.flatnonzero(~self.is_log)
+        hit = active & self._overlaps(rect_x, rect_y, size, cars).any(axis=1)
+        self._lose_life(hit)
+        active &= ~hit
+
+        # Homes: the first unfilled home the rect touches gets filled
+        touching = (~self.homes &
+                    (self.home_x < rect_x[:, None] + size) &
+                    (self.home_x + self.home_width > rect_x[:, None]) &
+                    (self.home_y < rect_y[:, None] + size) &
+                    (self.home_y + self.home_height > rect_y[:, None]))
+        reached = active & touching.any(axis=1)
+        games = np.flatnonzero(reached)
+        self.homes[games, touching[games].argmax(axis=1)] = True
+        self.score[reached] += 100 * self.level
+        self._reset_players(reached)
+
+        all_filled = reached & self.homes.all(axis=1)
+        if not self.is_last_level:
+            self.state[all_filled] = config.STATE_LEVEL_COMPLETE
+        else:
+            self.score[all_filled] += 500
+            self.state[all_filled] = config.STATE_GAME_OVER
+
+        # Top row without a free home: extra points
+        top = active & ~reached & self.goal_rows[self.py]
+        self.score[top] += 50
+        self._reset_players(top)
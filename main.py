@@ -1,8 +1,78 @@
 # main.py
 import pygame
+import os
 import sys
+import time
 from game.game import Game
 from game.ui import UI
+from game.renderer import create_renderer
+from game.replay import InputRecorder
+from game.levels import close_generators
+from game.profiler import PHASE_EVENTS, PHASE_UPDATE
+from game.input import QUEUED_ACTIONS, build_key_actions
+from game.sim_thread import SimulationThread
+from game.snapshot_view import SnapshotView
+from game.pacing import FrameScheduler
+
+
+def save_replay(game):
+    """Write the finished session's input log into config.REPLAY_DIR"""
+    os.makedirs(game.config.REPLAY_DIR, exist_ok=True)
+    name = time.strftime("%Y%m%d-%H%M%S") + ".frr"
+    game.recorder.save(game, os.path.join(game.config.REPLAY_DIR, name))
+
+
+def export_profile(game):
+    """Write the frame profiler's data into config.PROFILE_DIR"""
+    name = time.strftime("%Y%m%d-%H%M%S")
+    for path in game.profiler.export(game.config.PROFILE_DIR, name):
+        print(f"Profile written to {path}")
+
+
+def report_latency(game):
+    """Print the input-to-display latency of the session"""
+    stats = game.profiler.stats().get("input")
+    if stats:
+        print(f"Input latency: p50 {stats['p50']:.1f} ms, p99 {stats['p99']:.1f} ms, "
+              f"max {stats['max']:.1f} ms over {game.profiler.latency_count} moves")
+
+
+def start_game(game, ui):
+    if ui.text_input:
+        game.start_game(ui.text_input)
+
+
+def show_menu(game, ui):
+    game.state["current"] = game.config.STATE_START
+
+
+# Immediate actions: handler(game, ui). Moves and pause are queued instead,
+# and "quit" ends the main loop
+ACTION_HANDLERS = {
+    "start": start_game,
+    "restart": lambda game, ui: game.reset(),
+    "menu": show_menu,
+    "continue": lambda game, ui: game.next_level(),
+    "profiler": lambda game, ui: game.profiler.toggle(),
+    "export_profile": lambda game, ui: export_profile(game)
+}
+
+
+def dispatch(game, ui, action, timestamp, simulation=None):
+    """Run an action from the key table or a button, return False on quit
+
+    With a SimulationThread, the game belongs to its thread and the action
+    runs there.
+    """
+    if action == "quit":
+        return False
+    if action in QUEUED_ACTIONS:
+        (simulation or game).queue_input(action, timestamp)
+    elif simulation is not None:
+        simulation.call(ACTION_HANDLERS[action], game, ui)
+    else:
+        ACTION_HANDLERS[action](game, ui)
+    return True
 
 
 def main():
@@ -11,9 +81,24 @@ def main():
 
     # Create game instance
     game = Game()
+    game.config.PREFETCH_LEVELS = True
+    if game.config.RECORD_REPLAYS:
+        game.recorder = InputRecorder()
+
+    # With THREADED_SIMULATION the game runs on its own thread, and the
+    # UI and renderer draw the snapshots it publishes through a view
+    simulation = None
+    view = game
+    if game.config.THREADED_SIMULATION:
+        simulation = SimulationThread(game)
+        view = SnapshotView(game, simulation)
+        # Wakes the main loop from FrameScheduler.wait() when a snapshot
+        # it has to draw is published
+        simulation_event = pygame.event.custom_type()
+        simulation.notify = lambda: pygame.event.post(pygame.event.Event(simulation_event))
 
     # Create UI instance
-    ui = UI(game)
+    ui = UI(view)
 
     # Set up screen
     screen_width = game.config.SCREEN_WIDTH
@@ -27,138 +112,94 @@ def main():
     # Initialize UI
     ui.initialize(screen, clock)
 
+    # Dirty-rect renderer, or full flip when config.RENDER_MODE == "full"
+    renderer = create_renderer(view, ui, screen)
+
+    # (state, key) -> action, see game/input.py
+    key_actions = build_key_actions(game.config)
+
+    # Draws menus and the pause screen only when they change, see game/pacing.py
+    scheduler = FrameScheduler(game.config)
+
     # Main game loop
+    profiler = game.profiler
+    if simulation is not None:
+        simulation.start()
     running = True
     while running:
+        # Nothing moves on its own: sleep until there is something to draw
+        events = scheduler.wait(ui) if scheduler.is_idle(view) else []
+
+        profiler.begin_frame()
         current_time = pygame.time.get_ticks()
+        previous_state = view.state["current"]
 
         # Handle events
-        for event in pygame.event.get():
+        started = profiler.start()
+        for event in events + pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
 
-            elif event.type == pygame.KEYDOWN:
-                # Game state transitions
-                if game.state["current"] == game.config.STATE_START:
-                    if event.key == pygame.K_RETURN and ui.text_input:
-                        game.start_game(ui.text_input)
-                    elif event.key == pygame.K_ESCAPE:
-                        running = False
-
-                elif game.state["current"] == game.config.STATE_PLAYING:
-                    # Player movement
-                    if event.key == pygame.K_UP or event.key == pygame.K_w:
-                        game.move_player("up")
-                    elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                        game.move_player("down")
-                    elif event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                        game.move_player("left")
-                    elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                        game.move_player("right")
-                    elif event.key == pygame.K_p:
-                        game.toggle_pause()
-                    elif event.key == pygame.K_ESCAPE:
-                        running = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # The window contents were lost, repaint everything
+                renderer.invalidate()
+                scheduler.invalidate()
 
-                elif game.state["current"] == game.config.STATE_GAME_OVER:
-                    if event.key == pygame.K_r:
-                        game.reset()
-                    elif event.key == pygame.K_m:
-                        game.state["current"] = game.config.STATE_START
-                    elif event.key == pygame.K_ESCAPE:
-                        running = False
-
-                elif game.state["current"] == game.config.STATE_LEVEL_COMPLETE:
-                    if event.key == pygame.K_RETURN:
-                        game.next_level()
-                    elif event.key == pygame.K_ESCAPE:
+            elif event.type == pygame.KEYDOWN:
+                action = key_actions.get((view.state["current"], event.key))
+                if action is not None:
+                    if not dispatch(game, ui, action, time.perf_counter(), simulation):
                         running = False
+                    # The action handled the key, e.g. Enter on the start screen
+                    continue
 
             elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-                game_state = game.get_game_state()
-
-                # Handle button clicks based on current state
-                if game.state["current"] == game.config.STATE_START:
-                    start_button = pygame.Rect(
-                        screen_width // 2 - 100,
-                        280,
-                        200,
-                        50
-                    )
-                    if start_button.collidepoint(mouse_pos) and ui.text_input:
-                        game.start_game(ui.text_input)
-
-                elif game.state["current"] == game.config.STATE_GAME_OVER:
-                    restart_button = pygame.Rect(
-                        screen_width // 2 - 220,
-                        350,
-                        200,
-                        50
-                    )
-                    menu_button = pygame.Rect(
-                        screen_width // 2 + 20,
-                        350,
-                        200,
-                        50
-                    )
-
-                    if restart_button.collidepoint(mouse_pos):
-                        game.reset()
-                    elif menu_button.collidepoint(mouse_pos):
-                        game.state["current"] = game.config.STATE_START
-
-                elif game.state["current"] == game.config.STATE_LEVEL_COMPLETE:
-                    continue_button = pygame.Rect(
-                        screen_width // 2 - 100,
-                        350,
-                        200,
-                        50
-                    )
-                    if continue_button.collidepoint(mouse_pos):
-                        game.next_level()
+                action = ui.button_at(view.state["current"], event.pos)
+                if action is not None and not dispatch(game, ui, action, time.perf_counter(),
+                                                       simulation):
+                    running = False
 
             # Handle UI events
             ui.handle_events(event)
-
-        # Update game
-        game.update(current_time)
-
-        # Draw everything
-        screen.fill(game.config.COLORS["BLACK"])
-
-        if game.state["current"] == game.config.STATE_START:
-            ui.draw_start_screen()
-
-        elif game.state["current"] in [game.config.STATE_PLAYING,
-                                       game.config.STATE_LEVEL_COMPLETE,
-                                       game.config.STATE_GAME_OVER]:
-            # Draw game background
-            ui.draw_background()
-
-            # Draw game elements
-            game.level_manager.draw_homes(screen)
-            game.obstacle_manager.draw(screen)
-            game.player.draw(screen)
-
-            # Draw game info
-            ui.draw_game_info(game.get_game_state())
-
-            # Draw overlay screens
-            if game.state["current"] == game.config.STATE_GAME_OVER:
-                ui.draw_game_over_screen(game.get_game_state())
-            elif game.state["current"] == game.config.STATE_LEVEL_COMPLETE:
-                ui.draw_level_complete_screen()
-            elif game.state["is_paused"]:
-                ui.draw_pause_screen()
-
-        # Update display
-        pygame.display.flip()
+        profiler.stop(PHASE_EVENTS, started)
+
+        # Update game, or take the latest state of the simulation thread
+        started = profiler.start()
+        if simulation is None:
+            game.update(current_time)
+        elif simulation.is_alive():
+            snapshot = view.load()
+        else:
+            # The simulation thread failed, its traceback is printed
+            break
+        profiler.stop(PHASE_UPDATE, started)
+
+        if (game.recorder and previous_state == game.config.STATE_PLAYING and
+                view.state["current"] == game.config.STATE_GAME_OVER):
+            if simulation is None:
+                save_replay(game)
+            else:
+                simulation.call(save_replay, game)
+
+        # Draw everything, unless an idle screen would look the same
+        if scheduler.should_draw(view, ui, pygame.time.get_ticks()):
+            renderer.render()
+            if simulation is not None:
+                simulation.presented(snapshot, time.perf_counter(), profiler)
+            elif game.input_queue.applied:
+                game.input_queue.presented(time.perf_counter(), profiler)
+        profiler.end_frame()
 
         # Cap the frame rate
         clock.tick(game.config.FPS)
 
+    if simulation is not None:
+        simulation.stop()
+    if game.config.PROFILE:
+        report_latency(game)
+
     # Quit Pygame
+    close_generators()
     pygame.quit()
     sys.exit()
 
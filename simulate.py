@@ -0,0 +1,170 @@
+# simulate.py
+# Run large batches of headless games on all CPU cores and print statistics.
+#
+#   python simulate.py --games 100000 --level 2 --policy random
+#   python simulate.py --games 1000 --policy scripted --moves "uuuu.uuuu"
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from game.headless import HeadlessRunner, random_policy, scripted_policy, idle_policy
+
+# One-letter moves for --moves: u/d/l/r, "." waits a tick
+MOVE_CODES = {"u": "up", "d": "down", "l": "left", "r": "right", ".": None}
+
+# Per-process runner, created once by init_worker()
+_runner = None
+
+
+def make_policy(name, seed, moves):
+    """Build the input policy for one game"""
+    if name == "random":
+        return random_policy(seed)
+    if name == "up":
+        return lambda game: "up"
+    if name == "scripted":
+        return scripted_policy(MOVE_CODES[c] for c in moves)
+    return idle_policy
+
+
+def init_worker():
+    global _runner
+    _runner = HeadlessRunner(auto_continue=False)
+
+
+def run_chunk(task):
+    """Play a chunk of games and return their aggregated statistics
+
+    Results are aggregated in the worker so one chunk costs one small
+    message, no matter how many games it holds.
+    """
+    first, count, options = task
+    if _runner is None:
+        init_worker()
+
+    scores = Counter()
+    deaths = Counter()
+    completed = 0
+    ticks = 0
+    for index in range(first, first + count):
+        _runner.policy = make_policy(options["policy"], options["seed"] + index,
+                                     options["moves"])
+        result = _runner.run_episode(options["level"], options["max_ticks"])
+        scores[result["score"]] += 1
+        deaths.update(result["death_lanes"])
+        completed += result["completed"]
+        ticks += result["ticks"]
+    return scores, deaths, completed, ticks
+
+
+def make_tasks(games, chunk_size, options):
+    for first in range(0, games, chunk_size):
+        yield first, min(chunk_size, games - first), options
+
+
+def percentile(distribution, total, fraction):
+    """Percentile of a {value: count} distribution"""
+    target = fraction * (total - 1)
+    seen = 0
+    for value in sorted(distribution):
+        seen += distribution[value]
+        if seen > target:
+            return value
+    return 0
+
+
+def summarize(scores, deaths, completed, ticks, games, elapsed):
+    total_score = sum(score * count for score, count in scores.items())
+    return {
+        "games": games,
+        "elapsed_s": round(elapsed, 3),
+        "games_per_s": round(games / elapsed, 1) if elapsed else None,
+        "ticks": ticks,
+        "completion_rate": completed / games if games else 0.0,
+        "score": {
+            "mean": total_score / games if games else 0.0,
+            "min": min(scores) if scores else 0,
+            "p10": percentile(scores, games, 0.10),
+            "median": percentile(scores, games, 0.50),
+            "p90": percentile(scores, games, 0.90),
+            "max": max(scores) if scores else 0,
+            "histogram": {str(score): scores[score] for score in sorted(scores)}
+        },
+        "deaths_per_lane": {str(lane): deaths[lane] for lane in sorted(deaths)}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel headless Frogger simulation")
+    parser.add_argument("--games", type=int, default=10000)
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--policy", default="random",
+                        choices=["random", "up", "scripted", "idle"])
+    parser.add_argument("--moves", default="",
+                        help="moves for --policy scripted, e.g. 'uuu.ul' (. = wait)")
+    parser.add_argument("--max-ticks", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=0,
+                        help="games per task (default: spread evenly, 4 tasks per worker)")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args()
+
+    if any(c not in MOVE_CODES for c in args.moves):
+        parser.error("--moves may only contain u, d, l, r and .")
+
+    options = {
+        "level": args.level,
+        "policy": args.policy,
+        "moves": args.moves,
+        "max_ticks": args.max_ticks,
+        "seed": args.seed
+    }
+    chunk_size = args.chunk_size or max(1, -(-args.games // (args.workers * 4)))
+    tasks = make_tasks(args.games, chunk_size, options)
+
+    scores = Counter()
+    deaths = Counter()
+    completed = 0
+    ticks = 0
+    start = time.perf_counter()
+    if args.workers > 1:
+        with Pool(args.workers, initializer=init_worker) as pool:
+            results = list(pool.imap_unordered(run_chunk, tasks))
+    else:
+        results = [run_chunk(task) for task in tasks]
+    elapsed = time.perf_counter() - start
+
+    for chunk_scores, chunk_deaths, chunk_completed, chunk_ticks in results:
+        scores.update(chunk_scores)
+        deaths.update(chunk_deaths)
+        completed += chunk_completed
+        ticks += chunk_ticks
+
+    summary = summarize(scores, deaths, completed, ticks, args.games, elapsed)
+    if args.json:
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+        return
+
+    print(f"games:           {summary['games']} ({args.workers} workers, "
+          f"{chunk_size} games per task)")
+    print(f"elapsed:         {summary['elapsed_s']} s ({summary['games_per_s']} games/s)")
+    print(f"completion rate: {summary['completion_rate']:.2%}")
+    score = summary["score"]
+    print(f"score:           mean {score['mean']:.1f}, min {score['min']}, "
+          f"p10 {score['p10']}, median {score['median']}, p90 {score['p90']}, "
+          f"max {score['max']}")
+    print("deaths per lane:")
+    for lane, count in summary["deaths_per_lane"].items():
+        print(f"  lane {lane:>2}: {count}")
+
+
+if __name__ == "__main__":
+    main()